@@ -5,6 +5,9 @@ This script shows how the AI File Classifier uses Indonesian language
 for directory names when configured with language.primary = "indonesian".
 """
 
+import functools
+import sys
+
 # Language-specific examples (from AIClassifier)
 LANGUAGE_EXAMPLES = {
     "indonesian": """- Documents → "Dokumen"
@@ -60,94 +63,112 @@ Output format:
   "reasoning": "string (can be in English)"
 }}"""
 
-def build_prompt(language: str) -> str:
-    """Build system prompt for given language."""
+@functools.lru_cache(maxsize=16)
+def _build_prompt_cached(language: str) -> str:
+    """Format the system prompt once per normalized language."""
     examples = LANGUAGE_EXAMPLES.get(language, LANGUAGE_EXAMPLES["english"])
     return SYSTEM_PROMPT_TEMPLATE.format(
         language=language.upper(),
         examples=examples
     )
 
+def build_prompt(language: str) -> str:
+    """Build system prompt for given language (cached per language)."""
+    return _build_prompt_cached(language.lower())
+
+# Pre-build prompts for every known language at import time
+for _language in LANGUAGE_EXAMPLES:
+    build_prompt(_language)
+
 def demonstrate_indonesian_prompts():
     """Demonstrate how Indonesian language configuration affects prompts."""
 
-    print("="*70)
-    print("Indonesian Directory Naming - Example System Prompts")
-    print("="*70)
-    print()
-
-    # Example 1: Indonesian (Primary)
-    print("1. INDONESIAN CONFIGURATION")
-    print("-" * 70)
-    print(build_prompt("indonesian"))
-    print()
-    print()
-
-    # Example 2: English (Fallback)
-    print("2. ENGLISH CONFIGURATION")
-    print("-" * 70)
-    print(build_prompt("english"))
-    print()
-    print()
-
-    # Example 3: Directory name examples
-    print("3. EXPECTED DIRECTORY NAME EXAMPLES")
-    print("-" * 70)
-    print()
-    print("English → Indonesian Mapping:")
-    print("  Documents           → Dokumen")
-    print("  Financial Reports   → Laporan Keuangan")
-    print("  Personal Photos     → Foto Pribadi")
-    print("  Work Projects       → Proyek Pekerjaan")
-    print("  Music               → Musik")
-    print("  Videos              → Video")
-    print("  Archives            → Arsip")
-    print("  Downloads           → Unduhan")
-    print("  Images              → Gambar")
-    print("  Spreadsheets        → Lembar Kerja")
-    print("  Code                → Kode Program")
-    print("  Contracts           → Kontrak")
-    print("  Invoices            → Faktur")
-    print("  Tax Documents       → Dokumen Pajak")
-    print()
-    print("With snake_case naming convention:")
-    print("  Laporan Keuangan    → laporan_keuangan/")
-    print("  Foto Pribadi        → foto_pribadi/")
-    print("  Proyek Pekerjaan    → proyek_pekerjaan/")
-    print("  Kode Program        → kode_program/")
-    print()
-    print("="*70)
+    lines = [
+        "="*70,
+        "Indonesian Directory Naming - Example System Prompts",
+        "="*70,
+        "",
+
+        # Example 1: Indonesian (Primary)
+        "1. INDONESIAN CONFIGURATION",
+        "-" * 70,
+        build_prompt("indonesian"),
+        "",
+        "",
+
+        # Example 2: English (Fallback)
+        "2. ENGLISH CONFIGURATION",
+        "-" * 70,
+        build_prompt("english"),
+        "",
+        "",
+
+        # Example 3: Directory name examples
+        "3. EXPECTED DIRECTORY NAME EXAMPLES",
+        "-" * 70,
+        "",
+        "English → Indonesian Mapping:",
+        "  Documents           → Dokumen",
+        "  Financial Reports   → Laporan Keuangan",
+        "  Personal Photos     → Foto Pribadi",
+        "  Work Projects       → Proyek Pekerjaan",
+        "  Music               → Musik",
+        "  Videos              → Video",
+        "  Archives            → Arsip",
+        "  Downloads           → Unduhan",
+        "  Images              → Gambar",
+        "  Spreadsheets        → Lembar Kerja",
+        "  Code                → Kode Program",
+        "  Contracts           → Kontrak",
+        "  Invoices            → Faktur",
+        "  Tax Documents       → Dokumen Pajak",
+        "",
+        "With snake_case naming convention:",
+        "  Laporan Keuangan    → laporan_keuangan/",
+        "  Foto Pribadi        → foto_pribadi/",
+        "  Proyek Pekerjaan    → proyek_pekerjaan/",
+        "  Kode Program        → kode_program/",
+        "",
+        "="*70,
+    ]
+
+    # Emit everything in a single write instead of one print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def show_configuration_guide():
     """Show how to configure Indonesian language in config.yaml."""
 
-    print()
-    print("="*70)
-    print("CONFIGURATION GUIDE")
-    print("="*70)
-    print()
-    print("To enable Indonesian directory naming, add this to config.yaml:")
-    print()
-    print("# Language Settings")
-    print("language:")
-    print("  primary: \"indonesian\"      # Primary language for directory names")
-    print("  fallback: \"english\"        # Fallback if primary not available")
-    print("  supported_languages:")
-    print("    - \"indonesian\"")
-    print("    - \"english\"")
-    print("    - \"spanish\"")
-    print("    - \"french\"")
-    print()
-    print("Available languages:")
-    print("  - indonesian (Bahasa Indonesia)")
-    print("  - english")
-    print("  - spanish (Español)")
-    print("  - french (Français)")
-    print()
-    print("Note: The classifier will automatically use the primary language")
-    print("to generate directory names based on file content.")
-    print()
-    print("="*70)
+    lines = [
+        "",
+        "="*70,
+        "CONFIGURATION GUIDE",
+        "="*70,
+        "",
+        "To enable Indonesian directory naming, add this to config.yaml:",
+        "",
+        "# Language Settings",
+        "language:",
+        "  primary: \"indonesian\"      # Primary language for directory names",
+        "  fallback: \"english\"        # Fallback if primary not available",
+        "  supported_languages:",
+        "    - \"indonesian\"",
+        "    - \"english\"",
+        "    - \"spanish\"",
+        "    - \"french\"",
+        "",
+        "Available languages:",
+        "  - indonesian (Bahasa Indonesia)",
+        "  - english",
+        "  - spanish (Español)",
+        "  - french (Français)",
+        "",
+        "Note: The classifier will automatically use the primary language",
+        "to generate directory names based on file content.",
+        "",
+        "="*70,
+    ]
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Run the demonstration."""
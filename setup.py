@@ -1,54 +1,5 @@
-"""Setup configuration for AI File Classifier."""
+"""Setup shim for tools that still invoke setup.py; metadata lives in pyproject.toml."""
 
-from setuptools import setup, find_packages
-from pathlib import Path
+from setuptools import setup
 
-# Read README for long description
-readme_file = Path(__file__).parent / "README.md"
-long_description = readme_file.read_text() if readme_file.exists() else ""
-
-setup(
-    name="ai-file-classifier",
-    version="1.0.0",
-    author="Your Name",
-    author_email="your.email@example.com",
-    description="Automatically classify and organize files using AI",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/yourusername/ai-file-classifier",
-    packages=find_packages(exclude=["tests", "tests.*"]),
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "Intended Audience :: End Users/Desktop",
-        "Topic :: System :: Filesystems",
-        "Topic :: Utilities",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-    ],
-    python_requires=">=3.10",
-    install_requires=[
-        "openai>=1.0.0",
-        "pyyaml>=6.0",
-        "python-dotenv>=1.0.0",
-    ],
-    extras_require={
-        "dev": [
-            "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
-            "pytest-cov>=4.0.0",
-        ],
-    },
-    entry_points={
-        "console_scripts": [
-            "classifier=src.cli:main",
-        ],
-    },
-    include_package_data=True,
-    package_data={
-        "": ["config/*.yaml", "templates/**/*"],
-    },
-)
+setup()
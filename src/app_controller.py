@@ -1,21 +1,34 @@
 """Application controller orchestrating the classification workflow."""
 
 import asyncio
+import logging
+import threading
 import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import cached_property, partial
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
 from .core.file_scanner import FileScanner, FileFilter, create_scanner_from_config, create_filter_from_config
-from .core.ai_classifier import AIClassifier, LLMClient
 from .core.directory_manager import DirectoryManager, create_directory_manager_from_config
 from .core.file_mover import FileMover, create_file_mover_from_config
-from .core.report_generator import ReportGenerator
-from .models.file_info import FileInfo
+from .models.file_info import HEAD_DIGEST_LENGTH, FileInfo
 from .models.classification import Classification
-from .strategies.content_based import ContentBasedStrategy
+from .utils.concurrency import gather_or_cancel, install_event_loop_policy
 from .utils.logger import get_logger
-from .utils.cache_manager import CacheManager
-from .utils.exceptions import ClassifierError
+from .utils.exceptions import ClassifierError, FatalAPIError
+
+# Heavy subsystems (OpenAI SDK, numpy) are imported on first use
+if TYPE_CHECKING:
+    from .core.ai_classifier import AIClassifier, LLMClient
+    from .core.fast_router import FastRouter
+    from .core.report_generator import ReportGenerator
+    from .strategies.content_based import ContentBasedStrategy
+    from .utils.cache_manager import CacheManager, SemanticCache
 
 logger = get_logger()
 
@@ -36,53 +49,129 @@ class ApplicationController:
         self._initialize_components()
 
     def _initialize_components(self) -> None:
-        """Initialize all application components."""
-        logger.info("Initializing application components...")
+        """
+        Initialize lightweight components.
+
+        The LLM client, classifier, caches and report generator are built on
+        first use (see the cached properties below), so scanning-only paths
+        never pay for importing the OpenAI SDK or numpy.
+        """
+        # File scanner
+        scan_config = self.config['scanning']
+        self.file_scanner = create_scanner_from_config(scan_config)
+        self.file_filter = create_filter_from_config(scan_config)
 
-        # Cache manager with optimized binary serialization
+        # Config subtrees read by the per-window helpers, resolved once
+        perf_config = self.config.get('performance', {})
+        self._perf_config = perf_config
+        self._content_config = perf_config.get('content_analysis', {})
+        self._batch_config = perf_config.get('batch_processing', {})
+        self._report_config = self.config.get('reporting', {})
+        self._batch_api_config = self.config['api'].get('batch_api', {})
+
+        # Every classification run drives its requests from asyncio.run
+        install_event_loop_policy(perf_config.get('uvloop', True))
+
+        # File mover
+        self.file_mover = create_file_mover_from_config(self.config['operations'])
+
+    @cached_property
+    def cache_manager(self) -> Optional['CacheManager']:
+        """Cache manager with optimized binary serialization."""
         cache_config = self.config['app']
-        use_binary = cache_config.get('cache_format', 'binary') == 'binary'
-        self.cache_manager = CacheManager(
+        if not cache_config.get('cache_enabled', True):
+            return None
+
+        from .utils.cache_manager import CacheManager
+
+        cache_format = cache_config.get('cache_format', 'binary')
+        return CacheManager(
             cache_dir=cache_config.get('cache_dir', '.cache'),
             ttl_hours=cache_config.get('cache_ttl_hours', 24),
             enabled=cache_config.get('cache_enabled', True),
-            use_binary=use_binary  # NEW: Use optimized binary serialization
-        ) if cache_config.get('cache_enabled', True) else None
+            use_binary=cache_format == 'binary',  # NEW: Use optimized binary serialization
+            use_sqlite=cache_format == 'sqlite'
+        )
 
-        # LLM client
-        api_config = self.config['api']
-        self.llm_client = LLMClient(api_config)
+    @cached_property
+    def semantic_cache(self) -> Optional['SemanticCache']:
+        """Optional semantic cache for near-identical files (requires numpy)."""
+        cache_config = self.config['app']
+        semantic_config = cache_config.get('semantic_cache', {})
+        if not semantic_config.get('enabled', False):
+            return None
+
+        from .core.ai_classifier import AIClassifier
+        from .utils.cache_manager import SemanticCache
+
+        language = self.config.get('language', {}).get('primary', 'english')
+        return SemanticCache(
+            cache_dir=cache_config.get('cache_dir', '.cache'),
+            threshold=semantic_config.get('threshold', 0.92),
+            ttl_hours=cache_config.get('cache_ttl_hours', 24),
+            model_name=semantic_config.get('model_name'),
+            onnx_model_path=semantic_config.get('onnx_model_path'),
+            onnx_providers=semantic_config.get('onnx_providers'),
+            quantize=semantic_config.get('quantize', True),
+            namespace=AIClassifier.cache_namespace(self.llm_client.model, language),
+        )
+
+    @cached_property
+    def llm_client(self) -> 'LLMClient':
+        """LLM client."""
+        from .core.ai_classifier import LLMClient
 
-        # AI classifier with language support
+        return LLMClient(self.config['api'])
+
+    @cached_property
+    def ai_classifier(self) -> 'AIClassifier':
+        """AI classifier with language support."""
+        from .core.ai_classifier import AIClassifier
+
+        api_config = self.config['api']
         language_config = self.config.get('language', {})
-        self.ai_classifier = AIClassifier(
+        multi_file_config = self._batch_config.get('multi_file_requests', {})
+        return AIClassifier(
             llm_client=self.llm_client,
             cache_manager=self.cache_manager,
             max_retries=api_config.get('max_retries', 3),
             retry_delay=api_config.get('retry_delay', 2),
+            max_delay=api_config.get('retry_max_delay', 30),
+            jitter=api_config.get('retry_jitter', 0.5),
             language=language_config.get('primary', 'english'),
-            fallback_language=language_config.get('fallback', 'english')
+            fallback_language=language_config.get('fallback', 'english'),
+            semantic_cache=self.semantic_cache,
+            prefix_cache=api_config.get('prefix_cache_enabled', True),
+            content_compression=self.config['classification'].get('content_compression', True),
+            max_prompt_tokens=multi_file_config.get('max_prompt_tokens')
         )
 
-        # Classification strategy
+    @cached_property
+    def strategy(self) -> 'ContentBasedStrategy':
+        """Classification strategy."""
+        from .strategies.content_based import ContentBasedStrategy
+
         strategy_weight = self.config['classification']['strategies']['content_based'].get('weight', 1.0)
-        self.strategy = ContentBasedStrategy(
+        return ContentBasedStrategy(
             ai_classifier=self.ai_classifier,
             weight=strategy_weight
         )
 
-        # File scanner
-        scan_config = self.config['scanning']
-        self.file_scanner = create_scanner_from_config(scan_config)
-        self.file_filter = create_filter_from_config(scan_config)
+    @cached_property
+    def fast_router(self) -> Optional['FastRouter']:
+        """Extension router for files that don't need the LLM."""
+        from .core.fast_router import create_fast_router_from_config
 
-        # Report generator
-        report_config = self.config['reporting']
-        self.report_generator = ReportGenerator(
-            output_dir=report_config.get('output_dir', 'reports')
-        )
+        return create_fast_router_from_config(self.config)
 
-        logger.info("Components initialized successfully")
+    @cached_property
+    def report_generator(self) -> 'ReportGenerator':
+        """Report generator."""
+        from .core.report_generator import ReportGenerator
+
+        return ReportGenerator(
+            output_dir=self._report_config.get('output_dir', 'reports')
+        )
 
     def execute(
         self,
@@ -113,17 +202,42 @@ class ApplicationController:
             logger.info(f"Mode: {'DRY RUN' if dry_run else 'EXECUTE'}")
             logger.info("="*60)
 
-            # Step 1: Scan files
-            logger.info("Step 1/5: Scanning files...")
-            files = self._scan_files(source_dir)
-
-            if not files:
-                logger.warning("No files found to classify")
-                return self._create_result([], {}, {}, 0)
-
-            # Step 2: Classify files
-            logger.info(f"Step 2/5: Classifying {len(files)} files...")
-            classification_map = self._classify_files(files)
+            if self._use_streaming_pipeline():
+                # Steps 1-2: Scan and classify concurrently
+                logger.info("Steps 1-2/5: Scanning and classifying files (pipelined)...")
+                files, classifications = self._scan_and_classify(source_dir)
+
+                if not files:
+                    logger.warning("No files found to classify")
+                    return self._create_result([], [], {}, 0, 0)
+            else:
+                # Step 1: Scan files
+                logger.info("Step 1/5: Scanning files...")
+                files = self._scan_files(source_dir)
+
+                if not files:
+                    logger.warning("No files found to classify")
+                    return self._create_result([], [], {}, 0, 0)
+
+                # Step 2: Classify files
+                logger.info(f"Step 2/5: Classifying {len(files)} files...")
+                classifications = self._classify_files(files)
+
+            if self.cache_manager:
+                self.cache_manager.flush()
+            if self.semantic_cache:
+                self.semantic_cache.save()
+
+            # Only classified files need directories and moves; filter once
+            classified_pairs = [
+                (file_info, classification)
+                for file_info, classification in zip(files, classifications)
+                if classification is not None
+            ]
+            # Per-category tally shared by the result and the report summary
+            category_counts = Counter(
+                classification.primary_category for _, classification in classified_pairs
+            )
 
             # Step 3: Create directory structure
             logger.info("Step 3/5: Planning directory structure...")
@@ -131,13 +245,15 @@ class ApplicationController:
                 dest_dir,
                 self.config['directories']
             )
-            directory_manager.create_structure(classification_map, dry_run=dry_run)
+            directory_manager.create_structure(
+                [classification for _, classification in classified_pairs],
+                dry_run=dry_run
+            )
 
             # Step 4: Move files
             logger.info("Step 4/5: Moving files...")
             operation_stats = self._move_files(
-                files,
-                classification_map,
+                classified_pairs,
                 directory_manager,
                 dry_run
             )
@@ -146,15 +262,26 @@ class ApplicationController:
             execution_time = time.time() - start_time
             logger.info(f"Step 5/5: Generating reports...")
 
+            # Count once and share with the result and the report summary
+            classified = len(classified_pairs)
             result = self._create_result(
                 files,
-                classification_map,
+                classifications,
                 operation_stats,
-                execution_time
+                execution_time,
+                classified,
+                category_counts
             )
 
-            if generate_report and self.config['reporting'].get('enabled', True):
-                self._generate_reports(classification_map, operation_stats, execution_time)
+            if generate_report and self._report_config.get('enabled', True):
+                self._generate_reports(
+                    files,
+                    classifications,
+                    operation_stats,
+                    execution_time,
+                    classified,
+                    category_counts
+                )
 
             logger.info("="*60)
             logger.info("Classification workflow completed successfully")
@@ -180,9 +307,8 @@ class ApplicationController:
             List of file information objects
         """
         # Read content for text files if configured
-        perf_config = self.config['performance']['content_analysis']
         read_content = True
-        max_content_length = perf_config.get('max_content_length', 5000)
+        max_content_length = self._content_config.get('max_content_length', 5000)
 
         files = self.file_scanner.scan(
             source_dir,
@@ -194,10 +320,227 @@ class ApplicationController:
         logger.info(f"Scanned {len(files)} files")
         return files
 
+    def _use_streaming_pipeline(self) -> bool:
+        """
+        Check whether scanning and classification should be pipelined.
+
+        Returns:
+            True if batch processing and the streaming pipeline are enabled
+        """
+        if self._batch_api_config.get('enabled', False):
+            # A Batch API job is submitted once for the whole scan
+            return False
+        batch_config = self._batch_config
+        return batch_config.get('enabled', True) and batch_config.get('streaming_pipeline', True)
+
+    def _scan_and_classify(
+        self,
+        source_dir: Path
+    ) -> Tuple[List[FileInfo], List[Optional[Classification]]]:
+        """
+        Scan and classify files as a producer/consumer pipeline.
+
+        Files are classified in windows as soon as the scanner yields them,
+        so directory walking and content reads overlap with LLM latency.
+
+        Args:
+            source_dir: Source directory
+
+        Returns:
+            Tuple of (scanned files, classifications aligned with files)
+        """
+        batch_config = self._batch_config
+        batch_size = batch_config.get('batch_size', self._perf_config.get('batch_size', 50))
+        max_concurrent = self.config['api'].get('max_concurrent_requests', 5)
+        pipeline_depth = max(1, batch_config.get('pipeline_depth', 2))
+
+        logger.info(
+            f"Using pipelined batch processing (window={batch_size}, "
+            f"depth={pipeline_depth}, max_concurrent={max_concurrent})"
+        )
+        return asyncio.run(
+            self._scan_and_classify_async(source_dir, batch_size, max_concurrent, pipeline_depth)
+        )
+
+    async def _scan_and_classify_async(
+        self,
+        source_dir: Path,
+        batch_size: int,
+        max_concurrent: int,
+        pipeline_depth: int = 2
+    ) -> Tuple[List[FileInfo], List[Optional[Classification]]]:
+        """
+        Run the scanner in a worker thread and classify its output in windows.
+
+        Up to pipeline_depth windows are classified at once while the next
+        one fills, so a slow window doesn't stall scanning or leave the
+        LLM client idle. Duplicates are resolved after every window is done,
+        since a representative may sit in a window that is still in flight.
+
+        Args:
+            source_dir: Source directory
+            batch_size: Number of files per classification window
+            max_concurrent: Maximum concurrent API requests
+            pipeline_depth: Maximum windows classified concurrently
+
+        Returns:
+            Tuple of (scanned files, classifications aligned with files)
+        """
+        max_content_length = self._content_config.get('max_content_length', 5000)
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=batch_size * 2)
+        stop = threading.Event()
+
+        def produce() -> None:
+            """Push scanned files onto the queue, ending with a None sentinel."""
+            try:
+                for file_info in self.file_scanner.iter_scan(
+                    source_dir,
+                    file_filter=self.file_filter,
+                    read_content=True,
+                    max_content_length=max_content_length
+                ):
+                    asyncio.run_coroutine_threadsafe(queue.put(file_info), loop).result()
+                    if stop.is_set():
+                        break
+            finally:
+                asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+
+        producer = asyncio.ensure_future(asyncio.to_thread(produce))
+
+        files: List[FileInfo] = []
+        classifications: List[Optional[Classification]] = []
+        window_start = 0
+        # Duplicate index shared across windows
+        seen: Dict[Tuple[int, str], Dict[str, List[int]]] = {}
+        duplicates: Dict[int, int] = {}
+        in_flight: Deque[asyncio.Task] = deque()
+
+        def launch(window_end: int) -> None:
+            """Start classifying files[window_start:window_end]."""
+            in_flight.append(asyncio.ensure_future(self._classify_window_deduplicated(
+                files, classifications, window_start, window_end, seen, batch_size, max_concurrent
+            )))
+
+        try:
+            async with self.llm_client:
+                while True:
+                    file_info = await queue.get()
+                    if file_info is None:
+                        break
+
+                    files.append(file_info)
+                    classifications.append(None)
+
+                    if len(files) - window_start >= batch_size:
+                        if len(in_flight) >= pipeline_depth:
+                            duplicates.update(await in_flight.popleft())
+                        launch(len(files))
+                        window_start = len(files)
+
+                if window_start < len(files):
+                    launch(len(files))
+                while in_flight:
+                    duplicates.update(await in_flight.popleft())
+        finally:
+            for task in in_flight:
+                task.cancel()
+            # Unblock the producer if we stopped consuming early
+            stop.set()
+            while not queue.empty():
+                queue.get_nowait()
+            await producer
+
+        for member, representative in duplicates.items():
+            classifications[member] = classifications[representative]
+
+        logger.info(f"Scanned {len(files)} files")
+        return files, classifications
+
+    async def _classify_window_deduplicated(
+        self,
+        files: List[FileInfo],
+        classifications: List[Optional[Classification]],
+        window_start: int,
+        window_end: int,
+        seen: Dict[Tuple[int, str], Dict[str, List[int]]],
+        batch_size: int,
+        max_concurrent: int
+    ) -> Dict[int, int]:
+        """
+        Classify one window of streamed files, skipping known duplicates.
+
+        Args:
+            files: All files received from the scanner so far
+            classifications: Classifications aligned with files, updated in place
+            window_start: Index of the first file in the window
+            window_end: Index one past the last file in the window
+            seen: Duplicate index shared across windows
+            batch_size: Maximum files per batch
+            max_concurrent: Maximum concurrent API requests
+
+        Returns:
+            Duplicate -> representative index map for the caller to resolve
+        """
+        window = range(window_start, window_end)
+        classifications[window_start:window_end] = self._route_files(files[window_start:window_end])
+        pending = [i for i in window if classifications[i] is None]
+
+        unique, duplicates = self._deduplicate_files(files, pending, seen)
+        if unique:
+            results = await self._classify_window(
+                [files[i] for i in unique], batch_size, max_concurrent
+            )
+            for i, classification in zip(unique, results):
+                classifications[i] = classification
+
+        return duplicates
+
+    async def _classify_window(
+        self,
+        window: List[FileInfo],
+        batch_size: int,
+        max_concurrent: int
+    ) -> List[Optional[Classification]]:
+        """
+        Classify one window of streamed files.
+
+        Args:
+            window: Files received from the scanner
+            batch_size: Maximum files per batch
+            max_concurrent: Maximum concurrent API requests
+
+        Returns:
+            Classifications aligned with window
+        """
+        grouping_strategy = self._batch_config.get('grouping_strategy', 'extension')
+        ordered = window
+        if grouping_strategy != 'none':
+            ordered = self._group_files_intelligently(window, grouping_strategy)
+
+        multi_file_config = self._batch_config.get('multi_file_requests', {})
+        if multi_file_config.get('enabled', True):
+            results = await self._classify_with_multi_file_batches(
+                ordered,
+                multi_file_config.get('max_files_per_request', 10),
+                max_concurrent,
+                len(ordered)
+            )
+        else:
+            results = await self._classify_with_concurrent_requests(
+                ordered,
+                batch_size,
+                max_concurrent,
+                len(ordered)
+            )
+
+        return self._restore_order(window, ordered, results)
+
     def _classify_files(
         self,
         files: List[FileInfo]
-    ) -> Dict[FileInfo, Optional[Classification]]:
+    ) -> List[Optional[Classification]]:
         """
         Classify all files using optimized batch processing.
 
@@ -205,58 +548,231 @@ class ApplicationController:
             files: List of file information objects
 
         Returns:
-            Dictionary mapping files to classifications
+            Classifications aligned with files (None where classification failed)
         """
         # Get batch processing configuration
-        perf_config = self.config.get('performance', {})
-        batch_config = perf_config.get('batch_processing', {})
+        batch_config = self._batch_config
 
         use_batch = batch_config.get('enabled', True)
-        batch_size = batch_config.get('batch_size', perf_config.get('batch_size', 50))
+        batch_size = batch_config.get('batch_size', self._perf_config.get('batch_size', 50))
         max_concurrent = self.config['api'].get('max_concurrent_requests', 5)
 
-        if use_batch and len(files) > 1:
+        # Route obviously-typed files by extension, then classify one
+        # representative per group of duplicate files
+        classifications = self._route_files(files)
+        pending = [i for i, c in enumerate(classifications) if c is None]
+        unique, duplicates = self._deduplicate_files(files, pending)
+        unique_files = [files[i] for i in unique]
+
+        if not unique_files:
+            results: List[Optional[Classification]] = []
+        elif self._batch_api_config.get('enabled', False):
+            logger.info(f"Submitting {len(unique_files)} files as a Batch API job")
+            results = self._classify_files_via_batch_api(unique_files)
+        elif use_batch and len(unique_files) > 1:
             logger.info(f"Using batch processing (batch_size={batch_size}, max_concurrent={max_concurrent})")
-            return self._classify_files_batch(files, batch_size, max_concurrent)
+            results = self._classify_files_batch(unique_files, batch_size, max_concurrent)
         else:
-            logger.info("Using serial processing")
-            return self._classify_files_serial(files)
+            logger.info(f"Using per-file processing (max_concurrent={max_concurrent})")
+            results = self._classify_files_per_file(unique_files, max_concurrent)
+
+        for i, classification in zip(unique, results):
+            classifications[i] = classification
+        for member, representative in duplicates.items():
+            classifications[member] = classifications[representative]
+
+        return classifications
+
+    def _route_files(self, files: List[FileInfo]) -> List[Optional[Classification]]:
+        """
+        Classify obviously-typed files by extension before any LLM work.
+
+        Args:
+            files: List of file information objects
+
+        Returns:
+            Classifications aligned with files - None where the LLM is needed
+        """
+        if self.fast_router is None:
+            return [None] * len(files)
+        return self.fast_router.route_files(files)
+
+    @staticmethod
+    def _restore_order(
+        files: List[FileInfo],
+        ordered: List[FileInfo],
+        results: List[Optional[Classification]]
+    ) -> List[Optional[Classification]]:
+        """
+        Re-align results computed on a regrouped list with the original order.
 
-    def _classify_files_serial(
+        Args:
+            files: Files in their original order
+            ordered: The same files after grouping
+            results: Classifications aligned with ordered
+
+        Returns:
+            Classifications aligned with files
+        """
+        if ordered is files:
+            return results
+
+        position = {id(file_info): i for i, file_info in enumerate(files)}
+        aligned: List[Optional[Classification]] = [None] * len(files)
+        for file_info, classification in zip(ordered, results):
+            aligned[position[id(file_info)]] = classification
+        return aligned
+
+    def _deduplicate_files(
         self,
-        files: List[FileInfo]
-    ) -> Dict[FileInfo, Optional[Classification]]:
+        files: List[FileInfo],
+        indices: Optional[List[int]] = None,
+        seen: Optional[Dict[Tuple[int, str], Dict[str, List[int]]]] = None
+    ) -> Tuple[List[int], Dict[int, int]]:
         """
-        Classify files serially (legacy mode).
+        Group duplicate files so only one representative is classified.
+
+        Files are duplicates when they share size, extension and content.
+        Files are only hashed once another file with the same size and
+        extension has been seen, so unique sizes cost no I/O; the first 4 KB
+        are compared first, and whole files are read only when those match.
 
         Args:
             files: List of file information objects
+            indices: Positions in files to consider (defaults to all)
+            seen: Optional duplicate index to share across calls
 
         Returns:
-            Dictionary mapping files to classifications
+            Tuple of (unique representative indices, duplicate -> representative index map)
         """
-        classification_map = {}
+        if indices is None:
+            indices = list(range(len(files)))
+
+        if not self._batch_config.get('deduplicate', True):
+            return indices, {}
+
+        if seen is None:
+            seen = {}
+
+        unique: List[int] = []
+        duplicates: Dict[int, int] = {}
+        # Reuses digests remembered by earlier runs for unchanged files
+        fingerprint = self.ai_classifier.fingerprint
+        full_digests: Dict[int, Optional[str]] = {}
+
+        def full_digest(index: int) -> Optional[str]:
+            if index not in full_digests:
+                full_digests[index] = files[index].full_digest()
+            return full_digests[index]
+
+        for i in indices:
+            file_info = files[i]
+            # Empty files carry no content signal; classify them by name
+            if file_info.size == 0:
+                unique.append(i)
+                continue
+
+            # Head digest -> representatives whose first 4 KB match it
+            group = seen.setdefault((file_info.size, file_info.extension), {})
+            if not group:
+                # First file of this size: defer hashing until a collision
+                group[''] = [i]
+                unique.append(i)
+                continue
+
+            if '' in group:
+                first = group.pop('')[0]
+                first_digest = fingerprint(files[first])
+                if first_digest is not None:
+                    group[first_digest] = [first]
+
+            digest = fingerprint(file_info)
+            if digest is None:
+                unique.append(i)
+                continue
+
+            candidates = group.setdefault(digest, [])
+            representative = None
+            if candidates and file_info.size <= HEAD_DIGEST_LENGTH:
+                # The head digest already covers the whole file
+                representative = candidates[0]
+            elif candidates and full_digest(i) is not None:
+                representative = next(
+                    (c for c in candidates if full_digest(c) == full_digest(i)),
+                    None
+                )
 
-        for i, file_info in enumerate(files, 1):
-            logger.info(f"Classifying [{i}/{len(files)}]: {file_info.name}")
+            if representative is None:
+                candidates.append(i)
+                unique.append(i)
+            else:
+                duplicates[i] = representative
 
-            classification = self.strategy.classify(file_info)
-            classification_map[file_info] = classification
+        if duplicates:
+            logger.info(
+                f"Skipping {len(duplicates)} duplicate files "
+                f"({len(unique)} unique files to classify)"
+            )
 
-            if classification is None:
-                logger.warning(f"Failed to classify: {file_info.name}")
+        return unique, duplicates
 
-        classified = sum(1 for c in classification_map.values() if c is not None)
-        logger.info(f"Successfully classified {classified}/{len(files)} files")
+    def _classify_files_per_file(
+        self,
+        files: List[FileInfo],
+        max_concurrent: int
+    ) -> List[Optional[Classification]]:
+        """
+        Classify files one request per file (legacy mode).
 
-        return classification_map
+        Requests run on the same async worker pool as batch mode, so they
+        share one pooled HTTP client and the adaptive concurrency limit.
+
+        Args:
+            files: List of file information objects
+            max_concurrent: Maximum concurrent API requests
+
+        Returns:
+            Classifications aligned with files
+        """
+        # Report progress about 100 times per run rather than once per file
+        interval = max(1, len(files) // 100)
+
+        async def run() -> List[Optional[Classification]]:
+            async with self.llm_client:
+                return await self._classify_with_concurrent_requests(
+                    files, interval, max_concurrent, len(files)
+                )
+
+        return asyncio.run(run())
+
+    def _classify_files_via_batch_api(self, files: List[FileInfo]) -> List[Optional[Classification]]:
+        """
+        Classify files as one offline Batch API job.
+
+        Args:
+            files: List of file information objects
+
+        Returns:
+            Classifications aligned with files
+        """
+        batch_api_config = self._batch_api_config
+
+        async def run() -> List[Optional[Classification]]:
+            async with self.llm_client:
+                return await self.ai_classifier.classify_via_batch_api(
+                    files,
+                    poll_interval=batch_api_config.get('poll_interval', 30),
+                    completion_window=batch_api_config.get('completion_window', '24h')
+                )
+
+        return asyncio.run(run())
 
     def _classify_files_batch(
         self,
         files: List[FileInfo],
         batch_size: int,
         max_concurrent: int
-    ) -> Dict[FileInfo, Optional[Classification]]:
+    ) -> List[Optional[Classification]]:
         """
         Classify files using concurrent batch processing.
 
@@ -266,18 +782,12 @@ class ApplicationController:
             max_concurrent: Maximum concurrent API requests
 
         Returns:
-            Dictionary mapping files to classifications
+            Classifications aligned with files
         """
-        # Run async batch processing in event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            classification_map = loop.run_until_complete(
-                self._classify_files_batch_async(files, batch_size, max_concurrent)
-            )
-            return classification_map
-        finally:
-            loop.close()
+        # Run async batch processing in a single event loop for the whole run
+        return asyncio.run(
+            self._classify_files_batch_async(files, batch_size, max_concurrent)
+        )
 
     def _group_files_intelligently(
         self,
@@ -302,7 +812,11 @@ class ApplicationController:
         if strategy == 'extension':
             # Group by extension for better classification context
             # Files of same type together helps LLM understand patterns
-            return sorted(files, key=lambda f: (f.extension, f.size))
+            ordered: List[FileInfo] = []
+            for bucket in self._bucket_files(files, attrgetter('extension')):
+                bucket.sort(key=attrgetter('size'))
+                ordered.extend(bucket)
+            return ordered
 
         elif strategy == 'size':
             # Group by size categories for memory management
@@ -314,41 +828,34 @@ class ApplicationController:
                 3 if f.size < 10485760 else  # < 10MB
                 4  # >= 10MB
             )
-            return sorted(files, key=lambda f: (size_category(f), f.extension))
+            return self._flatten(self._bucket_files(files, lambda f: (size_category(f), f.extension)))
 
         elif strategy == 'mixed':
             # Balanced strategy: extension first, then size buckets
             # Best overall performance for most workloads
-            size_bucket = lambda f: f.size // 102400  # 100KB buckets
-            return sorted(files, key=lambda f: (f.extension, size_bucket(f)))
+            return self._flatten(self._bucket_files(files, lambda f: (f.extension, f.size // 102400)))
 
         elif strategy == 'semantic':
             # Semantic grouping: group by file type categories
             # Groups code files, documents, media, etc. together
-            return sorted(files, key=lambda f: (
+            return self._flatten(self._bucket_files(files, lambda f: (
                 self._get_file_category(f),
                 f.extension,
                 f.size // 102400
-            ))
+            )))
 
         elif strategy == 'balanced':
             # Balanced distribution to avoid skewed batches
             # Distributes file types evenly across batches
-            from collections import defaultdict
-            import itertools
-
-            # Group files by extension
-            ext_groups = defaultdict(list)
-            for file in files:
-                ext_groups[file.extension].append(file)
+            ext_groups = self._bucket_files(files, attrgetter('extension'), sort_keys=False)
 
             # Sort each group by size
-            for ext in ext_groups:
-                ext_groups[ext].sort(key=lambda f: f.size)
+            for group in ext_groups:
+                group.sort(key=attrgetter('size'))
 
             # Interleave groups to balance batches
             balanced = []
-            iterators = [iter(group) for group in ext_groups.values()]
+            iterators = [iter(group) for group in ext_groups]
 
             while iterators:
                 for it in list(iterators):
@@ -363,6 +870,48 @@ class ApplicationController:
             # No grouping - original order
             return files
 
+    @staticmethod
+    def _bucket_files(
+        files: List[FileInfo],
+        key: Callable[[FileInfo], Any],
+        sort_keys: bool = True
+    ) -> List[List[FileInfo]]:
+        """
+        Distribute files into buckets in a single pass.
+
+        Each file's key is computed once and only the distinct keys are
+        sorted, so grouping N files costs O(N + K log K) for K buckets
+        instead of a full O(N log N) sort. Files keep their relative
+        order within a bucket.
+
+        Args:
+            files: List of file information objects
+            key: Function returning the bucket key for a file
+            sort_keys: Whether to order buckets by key (otherwise first-seen order)
+
+        Returns:
+            List of buckets
+        """
+        buckets: Dict[Any, List[FileInfo]] = defaultdict(list)
+        for file_info in files:
+            buckets[key(file_info)].append(file_info)
+
+        keys = sorted(buckets) if sort_keys else buckets
+        return [buckets[k] for k in keys]
+
+    @staticmethod
+    def _flatten(buckets: List[List[FileInfo]]) -> List[FileInfo]:
+        """
+        Concatenate buckets into a single list.
+
+        Args:
+            buckets: List of buckets
+
+        Returns:
+            Flat list of files
+        """
+        return list(chain.from_iterable(buckets))
+
     def _get_file_category(self, file_info: FileInfo) -> str:
         """
         Categorize file by type for semantic grouping.
@@ -417,7 +966,7 @@ class ApplicationController:
         files: List[FileInfo],
         batch_size: int,
         max_concurrent: int
-    ) -> Dict[FileInfo, Optional[Classification]]:
+    ) -> List[Optional[Classification]]:
         """
         Asynchronously classify files in batches with controlled concurrency.
 
@@ -430,42 +979,45 @@ class ApplicationController:
             max_concurrent: Maximum concurrent API requests
 
         Returns:
-            Dictionary mapping files to classifications
+            Classifications aligned with files
         """
-        classification_map = {}
         total_files = len(files)
 
         # Apply intelligent file grouping
-        batch_config = self.config.get('performance', {}).get('batch_processing', {})
-        grouping_strategy = batch_config.get('grouping_strategy', 'extension')
+        grouping_strategy = self._batch_config.get('grouping_strategy', 'extension')
 
+        ordered = files
         if grouping_strategy != 'none':
             logger.info(f"Grouping files by strategy: {grouping_strategy}")
-            files = self._group_files_intelligently(files, grouping_strategy)
+            ordered = self._group_files_intelligently(files, grouping_strategy)
 
         # Get multi-file batch settings
-        multi_file_config = batch_config.get('multi_file_requests', {})
+        multi_file_config = self._batch_config.get('multi_file_requests', {})
         use_multi_file = multi_file_config.get('enabled', True)  # TRUE by default now
         files_per_request = multi_file_config.get('max_files_per_request', 10)
 
-        if use_multi_file:
-            # TRUE BATCH PROCESSING: Multiple files per API request
-            logger.info(f"Using TRUE batch processing: {files_per_request} files per API request")
-            return await self._classify_with_multi_file_batches(
-                files,
-                files_per_request,
-                max_concurrent,
-                total_files
-            )
-        else:
-            # CONCURRENT PROCESSING: One file per API request (legacy mode)
-            logger.info("Using concurrent processing: 1 file per API request")
-            return await self._classify_with_concurrent_requests(
-                files,
-                batch_size,
-                max_concurrent,
-                total_files
-            )
+        # Keep one pooled HTTP client alive across every batch in this loop
+        async with self.llm_client:
+            if use_multi_file:
+                # TRUE BATCH PROCESSING: Multiple files per API request
+                logger.info(f"Using TRUE batch processing: {files_per_request} files per API request")
+                results = await self._classify_with_multi_file_batches(
+                    ordered,
+                    files_per_request,
+                    max_concurrent,
+                    total_files
+                )
+            else:
+                # CONCURRENT PROCESSING: One file per API request (legacy mode)
+                logger.info("Using concurrent processing: 1 file per API request")
+                results = await self._classify_with_concurrent_requests(
+                    ordered,
+                    batch_size,
+                    max_concurrent,
+                    total_files
+                )
+
+        return self._restore_order(files, ordered, results)
 
     async def _classify_with_multi_file_batches(
         self,
@@ -473,83 +1025,45 @@ class ApplicationController:
         files_per_request: int,
         max_concurrent: int,
         total_files: int
-    ) -> Dict[FileInfo, Optional[Classification]]:
+    ) -> List[Optional[Classification]]:
         """
         Classify files using TRUE batch processing: multiple files per API request.
 
-        Processes batches SEQUENTIALLY (one at a time) to avoid overwhelming the LLM.
         This sends N files in a single API request, dramatically reducing total API calls.
-        Example: 100 files with files_per_request=10 → only 10 API requests (sequential)!
+        Requests run concurrently under the LLM client's adaptive limiter,
+        which starts at max_concurrent (1 = sequential).
+        Example: 100 files with files_per_request=10 → only 10 API requests!
 
         Args:
             files: List of file information objects
             files_per_request: Number of files to send in each API request
-            max_concurrent: Not used (kept for API compatibility)
+            max_concurrent: Initial concurrent API requests (for logging)
             total_files: Total number of files being processed
 
         Returns:
-            Dictionary mapping files to classifications
+            Classifications aligned with files
         """
-        classification_map = {}
-        total_success = 0
-        total_failed = 0
-
-        # Calculate total batches
-        total_batches = (total_files + files_per_request - 1) // files_per_request
+        # Calculate total batches (fewer files per request under a token budget)
+        total_batches = len(self.ai_classifier.pack_requests(files, files_per_request))
 
         logger.info(
-            f"Processing {total_files} files in {total_batches} sequential API requests "
-            f"({files_per_request} files per request)"
+            f"Processing {total_files} files in {total_batches} API requests "
+            f"({files_per_request} files per request, max_concurrent={max_concurrent})"
         )
 
         overall_start_time = time.time()
 
-        # Process batches SEQUENTIALLY (one at a time)
-        for batch_num, i in enumerate(range(0, total_files, files_per_request), 1):
-            batch_files = files[i:i + files_per_request]
-            batch_start_idx = i
-
-            logger.info(
-                f"API Request {batch_num}/{total_batches}: Classifying files "
-                f"{batch_start_idx + 1}-{batch_start_idx + len(batch_files)} "
-                f"({len(batch_files)} files in 1 request)"
-            )
-
-            # Send multiple files in ONE API request (SEQUENTIAL - no concurrency)
-            batch_start_time = time.time()
-            try:
-                classifications = await self.ai_classifier.classify_multi_file_batch(
-                    batch_files,
-                    max_files_per_request=files_per_request
-                )
-
-                batch_time = time.time() - batch_start_time
-
-                # Process results for this batch
-                batch_success = 0
-                for file_info, classification in zip(batch_files, classifications):
-                    classification_map[file_info] = classification
-                    if classification is not None:
-                        total_success += 1
-                        batch_success += 1
-                    else:
-                        total_failed += 1
-                        logger.warning(f"Failed to classify: {file_info.name}")
-
-                # Batch metrics
-                files_per_sec = len(batch_files) / batch_time if batch_time > 0 else 0
-                logger.info(
-                    f"Batch {batch_num}/{total_batches} completed in {batch_time:.2f}s: "
-                    f"{batch_success}/{len(batch_files)} successful ({files_per_sec:.1f} files/sec)"
-                )
+        classifications = await self.strategy.classify_many_async(
+            files,
+            files_per_request=files_per_request
+        )
 
-            except Exception as e:
-                batch_time = time.time() - batch_start_time
-                logger.error(f"Batch {batch_num}/{total_batches} failed: {e}")
-                # Mark all files in this batch as failed
-                for file_info in batch_files:
-                    classification_map[file_info] = None
-                    total_failed += 1
+        total_success = 0
+        for file_info, classification in zip(files, classifications):
+            if classification is not None:
+                total_success += 1
+            else:
+                logger.warning(f"Failed to classify: {file_info.name}")
 
         # Overall performance metrics
         overall_time = time.time() - overall_start_time
@@ -566,7 +1080,7 @@ class ApplicationController:
             f"({savings_percent:.1f}% reduction)"
         )
 
-        return classification_map
+        return classifications
 
     async def _classify_with_concurrent_requests(
         self,
@@ -574,83 +1088,70 @@ class ApplicationController:
         batch_size: int,
         max_concurrent: int,
         total_files: int
-    ) -> Dict[FileInfo, Optional[Classification]]:
+    ) -> List[Optional[Classification]]:
         """
         Classify files using concurrent processing: one file per API request (legacy).
 
         This makes N API requests for N files, but processes them concurrently
-        for better performance than serial processing.
+        for better performance than serial processing. A pool of workers pulls
+        files from a shared iterator, so a slow request never holds back the
+        files behind it. Requests in flight are bounded by the LLM client's
+        adaptive limiter, which starts at max_concurrent and backs off when
+        the API reports overload.
 
         Args:
             files: List of file information objects
-            batch_size: Maximum files per batch
-            max_concurrent: Maximum concurrent API requests
+            batch_size: Number of completed files between progress reports
+            max_concurrent: Initial concurrent API requests
             total_files: Total number of files being processed
 
         Returns:
-            Dictionary mapping files to classifications
+            Classifications aligned with files
         """
-        classification_map = {}
-
-        # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def classify_with_semaphore(file_info: FileInfo, index: int) -> tuple:
-            """Classify a single file with semaphore-controlled concurrency."""
-            async with semaphore:
-                logger.info(f"Classifying [{index + 1}/{total_files}]: {file_info.name}")
-                classification = await self.ai_classifier.classify_async(file_info)
-
-                if classification is None:
+        classifications: List[Optional[Classification]] = [None] * total_files
+        pending = iter(enumerate(files))
+        progress = {'done': 0, 'success': 0}
+        start_time = time.time()
+        log_each_file = logger.isEnabledFor(logging.DEBUG)
+
+        async def worker() -> None:
+            """Classify files until the shared iterator is exhausted."""
+            for index, file_info in pending:
+                if log_each_file:
+                    logger.debug(f"Classifying [{index + 1}/{total_files}]: {file_info.name}")
+                try:
+                    classification = await self.ai_classifier.classify_async(file_info)
+                except FatalAPIError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Batch classification error: {e}")
+                    classification = None
+
+                classifications[index] = classification
+                progress['done'] += 1
+                if classification is not None:
+                    progress['success'] += 1
+                else:
                     logger.warning(f"Failed to classify: {file_info.name}")
 
-                return (file_info, classification)
+                if progress['done'] % batch_size == 0 or progress['done'] == total_files:
+                    elapsed = time.time() - start_time
+                    files_per_second = progress['done'] / elapsed if elapsed > 0 else 0
+                    logger.info(f"Progress: {progress['done']}/{total_files} files "
+                               f"({progress['success']} successful, {files_per_second:.1f} files/sec)")
 
-        # Process files in batches
-        for batch_start in range(0, total_files, batch_size):
-            batch_end = min(batch_start + batch_size, total_files)
-            batch_files = files[batch_start:batch_end]
+        # Enough workers for the limiter to reach its ceiling; the limiter,
+        # not the worker count, decides how many requests are in flight
+        worker_count = min(total_files, self.llm_client.concurrency.maximum)
+        await gather_or_cancel([worker() for _ in range(worker_count)])
 
-            logger.info(f"Processing batch {batch_start // batch_size + 1}: "
-                       f"files {batch_start + 1}-{batch_end} of {total_files}")
-
-            # Create tasks for this batch
-            tasks = [
-                classify_with_semaphore(file_info, batch_start + i)
-                for i, file_info in enumerate(batch_files)
-            ]
+        logger.info(f"Successfully classified {progress['success']}/{total_files} files")
 
-            # Execute batch concurrently with controlled concurrency
-            batch_start_time = time.time()
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            batch_time = time.time() - batch_start_time
-
-            # Process results
-            batch_success = 0
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Batch classification error: {result}")
-                elif isinstance(result, tuple):
-                    file_info, classification = result
-                    classification_map[file_info] = classification
-                    if classification is not None:
-                        batch_success += 1
-
-            # Calculate batch performance metrics
-            files_per_second = len(batch_files) / batch_time if batch_time > 0 else 0
-            logger.info(f"Batch completed in {batch_time:.2f}s: "
-                       f"{batch_success}/{len(batch_files)} successful "
-                       f"({files_per_second:.1f} files/sec)")
-
-        classified = sum(1 for c in classification_map.values() if c is not None)
-        logger.info(f"Successfully classified {classified}/{total_files} files")
-
-        return classification_map
+        return classifications
 
     def _move_files(
         self,
-        files: List[FileInfo],
-        classification_map: Dict[FileInfo, Optional[Classification]],
+        classified_pairs: List[Tuple[FileInfo, Classification]],
         directory_manager: DirectoryManager,
         dry_run: bool
     ) -> Dict[str, int]:
@@ -658,65 +1159,90 @@ class ApplicationController:
         Move files to classified directories.
 
         Args:
-            files: List of file information objects
-            classification_map: File to classification mapping
+            classified_pairs: (file, classification) pairs of classified files
             directory_manager: Directory manager instance
             dry_run: Whether this is a dry run
 
         Returns:
             Operation statistics
         """
-        file_mover = create_file_mover_from_config(self.config['operations'])
-
-        operations = []
-        for file_info in files:
-            classification = classification_map.get(file_info)
-            if classification:
-                destination = directory_manager.get_destination_path(
-                    file_info,
-                    classification
-                )
-                operations.append((file_info.path, destination))
+        # The directory manager resolves each classification path only once
+        def operations() -> Iterator[Tuple[Path, Path]]:
+            get_base_dir = directory_manager.get_base_dir
+            for file_info, classification in classified_pairs:
+                yield file_info.path, get_base_dir(classification) / file_info.name
 
-        if operations:
-            stats = file_mover.move_batch(operations, dry_run=dry_run)
-        else:
-            stats = {'total': 0, 'success': 0, 'failed': 0, 'skipped': 0}
+        if not classified_pairs:
+            return {'total': 0, 'success': 0, 'failed': 0, 'skipped': 0}
 
-        return stats
+        # Planned operations stream straight into the mover's workers
+        return self.file_mover.move_stream(operations(), dry_run=dry_run)
 
     def _generate_reports(
         self,
-        classification_map: Dict[FileInfo, Optional[Classification]],
+        files: List[FileInfo],
+        classifications: List[Optional[Classification]],
         operation_stats: Dict[str, int],
-        execution_time: float
+        execution_time: float,
+        classified: Optional[int] = None,
+        category_counts: Optional[Dict[str, int]] = None
     ) -> None:
         """
         Generate classification reports.
 
         Args:
-            classification_map: File to classification mapping
+            files: List of processed files
+            classifications: Classifications aligned with files
             operation_stats: Operation statistics
             execution_time: Total execution time
+            classified: Number of classified files, if already counted
+            category_counts: Files per primary category, if already counted
         """
         try:
             summary = self.report_generator.generate_summary(
-                classification_map,
+                files,
+                classifications,
                 operation_stats,
-                execution_time
+                execution_time,
+                classified=classified,
+                categories=category_counts
             )
 
-            # Export in configured formats
-            formats = self.config['reporting'].get('formats', ['json'])
+            # Export in configured formats. One timestamp for all of them so
+            # concurrent exports straddling a second still share a name.
+            formats = self._report_config.get('formats', ['json'])
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            exporters = []
 
             if 'json' in formats:
-                self.report_generator.export_json(summary)
+                exporters.append(partial(
+                    self.report_generator.export_json, summary, timestamp=timestamp
+                ))
 
             if 'csv' in formats:
-                self.report_generator.export_csv(classification_map)
+                exporters.append(partial(
+                    self.report_generator.export_csv, files, classifications, timestamp=timestamp
+                ))
 
             if 'html' in formats:
-                self.report_generator.export_html(summary, classification_map)
+                exporters.append(partial(
+                    self.report_generator.export_html, summary, files, classifications, timestamp=timestamp
+                ))
+
+            if len(exporters) <= 1:
+                for exporter in exporters:
+                    exporter()
+                return
+
+            # Formats are independent, so write them concurrently; total time
+            # is bounded by the slowest format instead of the sum of all
+            with ThreadPoolExecutor(max_workers=len(exporters)) as executor:
+                futures = [executor.submit(exporter) for exporter in exporters]
+                for future in futures:
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to generate report: {e}")
 
         except Exception as e:
             logger.error(f"Failed to generate reports: {e}")
@@ -724,31 +1250,36 @@ class ApplicationController:
     def _create_result(
         self,
         files: List[FileInfo],
-        classification_map: Dict[FileInfo, Optional[Classification]],
+        classifications: List[Optional[Classification]],
         operation_stats: Dict[str, int],
-        execution_time: float
+        execution_time: float,
+        classified: int,
+        category_counts: Optional[Dict[str, int]] = None
     ) -> Dict[str, Any]:
         """
         Create result dictionary.
 
         Args:
             files: List of processed files
-            classification_map: Classification results
+            classifications: Classifications aligned with files
             operation_stats: Operation statistics
             execution_time: Execution time
+            classified: Number of classified files, counted once by execute
+            category_counts: Files per primary category
 
         Returns:
             Result dictionary
         """
         total = len(files)
-        classified = sum(1 for c in classification_map.values() if c is not None)
 
         return {
             'success': True,
             'total_files': total,
             'classified': classified,
             'failed': total - classified,
+            'categories': dict(category_counts) if category_counts else {},
             'operation_stats': operation_stats,
             'execution_time': execution_time,
-            'cache_stats': self.cache_manager.get_stats() if self.cache_manager else None
+            'cache_stats': self.cache_manager.get_stats() if self.cache_manager else None,
+            'semantic_cache_stats': self.semantic_cache.get_stats() if self.semantic_cache else None
         }
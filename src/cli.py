@@ -3,15 +3,34 @@
 import argparse
 import sys
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-from .app_controller import ApplicationController
 from .utils.config_manager import load_config, get_config
 from .utils.logger import configure_logger, get_logger
 from .utils.validators import PathValidator
 from .utils.exceptions import ClassifierError, ConfigurationError, ValidationError
 
 
+# Language code or full name -> normalized language name (casefolded keys)
+LANGUAGE_CODES: Mapping[str, str] = MappingProxyType({
+    'id': 'indonesian',
+    'indonesian': 'indonesian',
+    'en': 'english',
+    'english': 'english',
+    'es': 'spanish',
+    'spanish': 'spanish',
+    'fr': 'french',
+    'french': 'french',
+    'de': 'german',
+    'german': 'german',
+    'ja': 'japanese',
+    'japanese': 'japanese',
+    'zh': 'chinese',
+    'chinese': 'chinese'
+})
+
+
 def normalize_language_code(language: str) -> str:
     """
     Normalize language code to full language name.
@@ -22,24 +41,7 @@ def normalize_language_code(language: str) -> str:
     Returns:
         Normalized language name
     """
-    language_map = {
-        'id': 'indonesian',
-        'indonesian': 'indonesian',
-        'en': 'english',
-        'english': 'english',
-        'es': 'spanish',
-        'spanish': 'spanish',
-        'fr': 'french',
-        'french': 'french',
-        'de': 'german',
-        'german': 'german',
-        'ja': 'japanese',
-        'japanese': 'japanese',
-        'zh': 'chinese',
-        'chinese': 'chinese'
-    }
-
-    normalized = language_map.get(language.lower())
+    normalized = LANGUAGE_CODES.get(language.casefold())
     if not normalized:
         raise ValidationError(
             f"Unsupported language: {language}. "
@@ -72,6 +74,12 @@ Examples:
   # Use English for directory names
   %(prog)s classify ./files ./organized --language en
 
+  # Send up to 16 API requests at once
+  %(prog)s classify ./files ./organized --max-concurrent 16
+
+  # Submit the files as one discounted offline Batch API job
+  %(prog)s classify ./files ./organized --batch-api
+
   # Use custom configuration
   %(prog)s classify ./files ./organized --config config.yaml
 
@@ -150,6 +158,21 @@ For more information, visit: https://github.com/yourusername/ai-file-classifier
         help='Language for directory names (id/indonesian, en/english, es/spanish, fr/french, de/german, ja/japanese, zh/chinese). Default: english'
     )
 
+    classify_parser.add_argument(
+        '--max-concurrent',
+        type=int,
+        default=None,
+        metavar='N',
+        help='API requests in flight at once (overrides api.max_concurrent_requests; '
+             'match it to the provider rate tier or the server\'s parallel slots)'
+    )
+
+    classify_parser.add_argument(
+        '--batch-api',
+        action='store_true',
+        help='Classify through the provider\'s Batch API (cheaper, but may take up to 24h)'
+    )
+
     return parser
 
 
@@ -251,6 +274,17 @@ class CLIApp:
                 config['language']['primary'] = normalized_language
                 self.logger.info(f"Using language from CLI: {normalized_language}")
 
+            if args.max_concurrent is not None:
+                if args.max_concurrent < 1:
+                    raise ValidationError("--max-concurrent must be at least 1")
+                config['api']['max_concurrent_requests'] = args.max_concurrent
+
+            if args.batch_api:
+                config['api'].setdefault('batch_api', {})['enabled'] = True
+
+            # Imported here so --help and --version skip the LLM SDK imports
+            from .app_controller import ApplicationController
+
             # Create application controller
             app = ApplicationController(config)
 
@@ -309,6 +343,15 @@ class CLIApp:
                 print(f"  Memory entries: {cache['memory_entries']}")
                 print(f"  Disk entries:   {cache['disk_entries']}")
                 print(f"  Total size:     {cache['total_size_mb']:.2f} MB")
+                if 'hit_rate' in cache:
+                    print(f"  Hit rate:       {cache['hit_rate']:.1%} ({cache['hits']} hits, {cache['misses']} misses)")
+
+        if result.get('semantic_cache_stats'):
+            semantic = result['semantic_cache_stats']
+            print("\nSemantic cache:")
+            print(f"  Entries: {semantic['entries']}")
+            print(f"  Hits:    {semantic['hits']}")
+            print(f"  Misses:  {semantic['misses']}")
 
         print("="*60)
 
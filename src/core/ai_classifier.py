@@ -1,27 +1,346 @@
 """AI-powered file classification using LLM."""
 
 import asyncio
+import functools
 import json
+import logging
+import random
+import re
+import sys
 import time
-from typing import Any, Dict, List, Optional
+from collections import Counter
+from typing import Annotated, Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
-from openai import AsyncOpenAI, OpenAI
+import httpx
+from openai import AsyncOpenAI
 from openai import (
-    APIError,
     APIConnectionError,
+    AuthenticationError,
+    NotFoundError,
+    PermissionDeniedError,
     RateLimitError,
     APITimeoutError
 )
 
-from ..models.file_info import FileInfo
+from ..models.file_info import HEAD_DIGEST_ALGORITHM, FileInfo
 from ..models.classification import Classification
 from ..utils.logger import get_logger
-from ..utils.exceptions import APIError as ClassifierAPIError, ClassificationError
+from ..utils.exceptions import (
+    APIError as ClassifierAPIError,
+    CircuitOpenError,
+    ClassificationError,
+    FatalAPIError
+)
 from ..utils.validators import JSONResponseValidator
-from ..utils.cache_manager import CacheManager
+from ..utils.cache_manager import CacheManager, SemanticCache
+from ..utils.concurrency import AdaptiveSemaphore, CircuitBreaker, TokenBucket, gather_or_cancel
+
+# msgspec decodes straight into typed structs (optional, falls back to json)
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
+
+# tiktoken caps content previews by real token count (optional; previews
+# are budgeted in characters only without it)
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+# h2 lets httpx negotiate HTTP/2 with https endpoints (httpx[http2])
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+# Without msgspec, responses are decoded with orjson if present
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = get_logger()
 
+# JSON schema for one classification object
+CLASSIFICATION_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "primary_category": {"type": "string"},
+        "subcategory": {"type": ["string", "null"]},
+        "sub_subcategory": {"type": ["string", "null"]},
+        "confidence": {"type": "number"},
+        "reasoning": {"type": "string"},
+    },
+    "required": ["primary_category", "subcategory", "sub_subcategory", "confidence", "reasoning"],
+    "additionalProperties": False,
+}
+
+# Structured-output format for single-file requests
+SINGLE_FILE_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "file_classification",
+        "strict": True,
+        "schema": CLASSIFICATION_SCHEMA,
+    },
+}
+
+
+# Structured-output format for multi-file requests, one per batch size
+@functools.lru_cache(maxsize=32)
+def multi_file_response_format(count: int) -> Dict[str, Any]:
+    """
+    Get the structured-output format for a request classifying ``count`` files.
+
+    Strict schemas must have an object at the root, so the array is wrapped
+    in a "classifications" key; its length is pinned to the file count so the
+    server cannot return too few or too many entries.
+
+    Args:
+        count: Number of files in the request
+
+    Returns:
+        response_format value (shared; do not modify)
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "file_classifications",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {
+                    "classifications": {
+                        "type": "array",
+                        "items": CLASSIFICATION_SCHEMA,
+                        "minItems": count,
+                        "maxItems": count,
+                    },
+                },
+                "required": ["classifications"],
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+if HAS_MSGSPEC:
+    class ClassificationMsg(msgspec.Struct):
+        """Typed view of one classification object in an LLM response."""
+
+        primary_category: Annotated[str, msgspec.Meta(min_length=1)]
+        confidence: Annotated[float, msgspec.Meta(ge=0, le=1)]
+        subcategory: Optional[str] = None
+        sub_subcategory: Optional[str] = None
+        reasoning: Optional[str] = None
+
+    class MultiFileMsg(msgspec.Struct):
+        """Structured-output wrapper around a multi-file response."""
+
+        classifications: List[ClassificationMsg]
+
+    # Decoders are reusable and much cheaper than json.loads + dict validation
+    _CLASSIFICATION_DECODER = msgspec.json.Decoder(ClassificationMsg)
+    _MULTI_FILE_DECODER = msgspec.json.Decoder(Union[List[ClassificationMsg], MultiFileMsg])
+
+
+# A markdown fence around the whole response, with any language tag
+_CODE_FENCE_RE = re.compile(r'^```[\w-]*\s*(.*?)\s*(?:```)?$', re.DOTALL)
+
+
+def _strip_code_fence(response_text: Optional[str]) -> str:
+    """
+    Remove markdown code blocks around an LLM response.
+
+    Args:
+        response_text: Raw response text from LLM (None for a refusal or
+            tool-call message without content)
+
+    Returns:
+        Bare JSON text, empty if the response had no content
+    """
+    if not response_text:
+        return ''
+    text = response_text.strip()
+    # Structured and JSON-mode responses are never fenced
+    if not text.startswith("```"):
+        return text.removesuffix("```").rstrip()
+    return _CODE_FENCE_RE.match(text).group(1)
+
+
+def _is_complete_json(text: str) -> bool:
+    """
+    Check whether a partial LLM response already holds a complete JSON value.
+
+    Args:
+        text: Response text received so far
+
+    Returns:
+        True if the text (without code fences) parses as JSON
+    """
+    try:
+        _json_loads(_strip_code_fence(text))
+    except ValueError:
+        return False
+    return True
+
+
+class _JsonEndTracker:
+    """
+    Detects where a streamed JSON value closes, one delta at a time.
+
+    Tracks bracket depth outside string literals, so a multi-file array is
+    parsed once when its last bracket arrives instead of after every object.
+    """
+
+    __slots__ = ('depth', 'in_string', 'escaped', 'started')
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+
+    def feed(self, delta: str) -> bool:
+        """
+        Scan the next piece of the response.
+
+        Args:
+            delta: Text received since the last call
+
+        Returns:
+            True if the outermost object or array closed within delta
+        """
+        closed = False
+        for char in delta:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == '\\':
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = self.started
+            elif char in '{[':
+                self.depth += 1
+                self.started = True
+            elif char in '}]' and self.depth > 0:
+                self.depth -= 1
+                closed = closed or self.depth == 0
+        return closed
+
+
+def _classification_from_msg(msg: 'ClassificationMsg') -> Classification:
+    """
+    Build a Classification from a decoded message.
+
+    Args:
+        msg: Decoded classification message
+
+    Returns:
+        Classification instance
+    """
+    path = [msg.primary_category]
+    if msg.subcategory:
+        path.append(msg.subcategory)
+    if msg.sub_subcategory:
+        path.append(msg.sub_subcategory)
+
+    return Classification(
+        path=path,
+        confidence=msg.confidence,
+        reasoning=msg.reasoning if msg.reasoning is not None else ''
+    )
+
+
+def _signature_lines(text: str, count: int, max_line_length: int) -> List[str]:
+    """
+    Pick the lines whose character trigrams are most typical of a text.
+
+    Args:
+        text: Text to pick lines from
+        count: Maximum number of lines to return
+        max_line_length: Lines are truncated to this many characters
+
+    Returns:
+        Selected lines in their original order
+    """
+    lines: List[str] = []
+    seen = set()
+    for line in text.splitlines():
+        line = line.strip()[:max_line_length]
+        # Skip noise and the section markers added by content sampling
+        if len(line) < 8 or line.startswith('... [') or line in seen:
+            continue
+        seen.add(line)
+        lines.append(line)
+
+    if len(lines) <= count:
+        return lines
+
+    trigrams = [
+        [line[i:i + 3] for i in range(len(line) - 2)]
+        for line in (line.lower() for line in lines)
+    ]
+    frequency = Counter(gram for grams in trigrams for gram in grams)
+    scores = [sum(frequency[gram] for gram in grams) / len(grams) for grams in trigrams]
+
+    best = sorted(range(len(lines)), key=scores.__getitem__, reverse=True)[:count]
+    return [lines[i] for i in sorted(best)]
+
+
+def compress_content(
+    content: str,
+    head: int = 1024,
+    tail: int = 512,
+    signature_lines: int = 4,
+    max_line_length: int = 120
+) -> str:
+    """
+    Shrink a content preview to a head, a tail and a few signature lines.
+
+    Trailing whitespace and repeated blank lines are dropped first. If the
+    text is still longer than ``head + tail``, the part in between is
+    replaced by the lines whose trigrams best represent it, so the prompt
+    covers the whole sample at a fraction of its length.
+
+    Args:
+        content: Content preview
+        head: Characters kept from the beginning
+        tail: Characters kept from the end
+        signature_lines: Lines kept from the omitted middle
+        max_line_length: Maximum length of each signature line
+
+    Returns:
+        Compressed content
+    """
+    lines = []
+    for line in content.splitlines():
+        line = line.rstrip()
+        if line or (lines and lines[-1]):
+            lines.append(line)
+    text = '\n'.join(lines).strip()
+
+    if len(text) <= head + tail:
+        return text
+
+    # Cut points rarely fall on line breaks; leave the partial lines at
+    # either end of the middle out of the signature candidates
+    middle = text[head:len(text) - tail].split('\n')[1:-1]
+    parts = [text[:head]]
+    signatures = _signature_lines('\n'.join(middle), signature_lines, max_line_length)
+    if signatures:
+        parts.append('... [signature lines] ...\n' + '\n'.join(signatures))
+    if tail:
+        parts.append('... [end] ...\n' + text[-tail:])
+    return '\n'.join(parts)
+
 
 class LLMClient:
     """Client for interacting with OpenAI-compatible APIs."""
@@ -34,73 +353,439 @@ class LLMClient:
             config: API configuration dictionary
         """
         self.config = config
-        self.client = OpenAI(
-            api_key=config.get('api_key', 'default'),
-            base_url=config['base_url'],
-            timeout=config.get('timeout', 30),
-            max_retries=0  # We handle retries manually
-        )
-        self.async_client = AsyncOpenAI(
-            api_key=config.get('api_key', 'default'),
-            base_url=config['base_url'],
-            timeout=config.get('timeout', 30),
-            max_retries=0
+        # Async client is created lazily inside the running event loop so its
+        # connection pool is reused across all batches of a run
+        self._async_client: Optional[AsyncOpenAI] = None
+        # Multiplex concurrent requests over one connection where the server
+        # supports it (negotiated via TLS ALPN, so https endpoints only)
+        self.http2 = config.get('http2', True) and HAS_H2
+
+        # Requests in flight are bounded by an AIMD limiter that starts at
+        # max_concurrent_requests and may grow to twice that while healthy
+        max_concurrent = max(1, config.get('max_concurrent_requests', 5))
+        adaptive_config = config.get('adaptive_concurrency', {})
+        self.concurrency = AdaptiveSemaphore(
+            initial=max_concurrent,
+            minimum=1,
+            maximum=max_concurrent * adaptive_config.get('max_multiplier', 2),
+            window=adaptive_config.get('window', 32),
+            adaptive=adaptive_config.get('enabled', True)
         )
+        self.max_connections = self.concurrency.maximum if self.concurrency.adaptive else max_concurrent
+        # httpx drops idle connections after 5s by default, which is shorter
+        # than the gap between pipeline windows or a rate-limit wait
+        self.keepalive_expiry = config.get('keepalive_expiry', 60.0)
         self.model = config['model_name']
         self.temperature = config.get('temperature', 0.2)
         self.max_tokens = config.get('max_tokens', 1000)
+        # Constrain responses with a JSON schema (needs server support)
+        self.structured_output = config.get('structured_output', False)
+        # Stream completions and stop reading at the end of the JSON payload
+        self.stream = config.get('stream_responses', False)
+        # Provider prompt-cache routing hint, sent with every request
+        prompt_cache_key = config.get('prompt_cache_key')
+        self._extra_body = {'prompt_cache_key': prompt_cache_key} if prompt_cache_key else None
+
+        # Client-side RPM/TPM budgets, so requests are spaced out before the
+        # provider has to reject them (null/0 disables a limit)
+        rpm = config.get('requests_per_minute')
+        tpm = config.get('tokens_per_minute')
+        self.request_limiter = TokenBucket(rpm) if rpm else None
+        self.token_limiter = TokenBucket(tpm) if tpm else None
+        # Exact token counts of system prompts, which repeat on every request
+        self._system_tokens: Dict[str, int] = {}
+        # A 429 with Retry-After holds back every new request, not just the
+        # one that was rejected, so concurrent workers don't all hit it too
+        self._resume_at = 0.0
+
+        # Stop sending requests while the API is down instead of letting
+        # every file run through its retries
+        breaker_config = config.get('circuit_breaker', {})
+        self.circuit_breaker: Optional[CircuitBreaker] = None
+        if breaker_config.get('enabled', True):
+            self.circuit_breaker = CircuitBreaker(
+                failure_threshold=breaker_config.get('failure_threshold', 5),
+                reset_timeout=breaker_config.get('reset_timeout', 30.0)
+            )
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """
+        Get the async client, creating it on first use.
+
+        Returns:
+            AsyncOpenAI client backed by a pooled keep-alive HTTP client
+        """
+        if self._async_client is None:
+            timeout = self.config.get('timeout', 30)
+            http_client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=self.keepalive_expiry
+                ),
+                timeout=timeout
+            )
+            self._async_client = AsyncOpenAI(
+                api_key=self.config.get('api_key', 'default'),
+                base_url=self.config['base_url'],
+                timeout=timeout,
+                max_retries=0,
+                http_client=http_client
+            )
+        return self._async_client
 
-    def send_request(self, messages: List[Dict[str, str]]) -> str:
+    @functools.cached_property
+    def encoder(self) -> Optional['tiktoken.Encoding']:
         """
-        Send synchronous request to LLM.
+        Get the tokenizer for the configured model, loading it on first use.
+
+        Returns:
+            tiktoken encoding, or None if tiktoken or its data is unavailable
+        """
+        if not HAS_TIKTOKEN:
+            return None
+
+        try:
+            try:
+                return tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                # Not an OpenAI model; cl100k_base is a close enough proxy
+                return tiktoken.get_encoding('cl100k_base')
+        except Exception as e:
+            # Encodings are downloaded on first use and may be unreachable
+            logger.warning(f"Token counting unavailable, previews limited by characters: {e}")
+            return None
+
+    async def aclose(self) -> None:
+        """Close the async client and release pooled connections."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    async def __aenter__(self) -> 'LLMClient':
+        """Enter async context; the client is created on first request."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close pooled connections when leaving the event loop."""
+        await self.aclose()
+
+    def estimate_tokens(self, messages: List[Dict[str, str]]) -> int:
+        """
+        Estimate the tokens a request counts against a TPM limit.
+
+        Providers charge the prompt plus the full max_tokens budget. The
+        system prompt is tokenized once and its count reused; the rest of the
+        prompt is approximated at four characters per token.
 
         Args:
             messages: List of message dictionaries
 
         Returns:
-            Response text from LLM
+            Estimated token count
+        """
+        tokens = self.max_tokens
+        characters = 0
+        for message in messages:
+            if message['role'] == 'system':
+                tokens += self.system_prompt_tokens(message['content'])
+            else:
+                characters += len(message['content'])
+        return tokens + characters // 4
 
-        Raises:
-            ClassifierAPIError: If API call fails
+    def system_prompt_tokens(self, prompt: str) -> int:
         """
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
-            )
-            return response.choices[0].message.content
+        Count the tokens of a system prompt, tokenizing it only once.
 
-        except Exception as e:
-            logger.error(f"API request failed: {e}")
-            raise ClassifierAPIError(f"LLM API call failed: {e}")
+        Args:
+            prompt: System prompt text
+
+        Returns:
+            Token count (estimated from length if no tokenizer is available)
+        """
+        count = self._system_tokens.get(prompt)
+        if count is None:
+            encoder = self.encoder
+            count = len(encoder.encode_ordinary(prompt)) if encoder is not None else len(prompt) // 4
+            self._system_tokens[prompt] = count
+        return count
+
+    @staticmethod
+    def retry_after(error: BaseException) -> Optional[float]:
+        """
+        Read the Retry-After delay from an API error.
+
+        Args:
+            error: Exception raised by the LLM client (SDK errors wrapped in
+                ClassifierAPIError are unwrapped)
+
+        Returns:
+            Delay in seconds, or None if the response did not specify one
+        """
+        if isinstance(error, ClassifierAPIError) and error.__cause__ is not None:
+            error = error.__cause__
 
-    async def send_request_async(self, messages: List[Dict[str, str]]) -> str:
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+
+        # OpenAI-compatible servers may send milliseconds as well
+        for header, scale in (('retry-after-ms', 0.001), ('retry-after', 1.0)):
+            value = headers.get(header)
+            if value is None:
+                continue
+            try:
+                return max(0.0, float(value) * scale)
+            except ValueError:
+                # HTTP-date form is not worth parsing; fall back to backoff
+                return None
+        return None
+
+    async def _rate_limit(self, messages: List[Dict[str, str]]) -> None:
+        """Wait out any server-requested pause, then the RPM and TPM budgets."""
+        pause = self._resume_at - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+        if self.request_limiter:
+            await self.request_limiter.acquire()
+        if self.token_limiter:
+            await self.token_limiter.acquire(self.estimate_tokens(messages))
+
+    async def send_request_async(
+        self,
+        messages: List[Dict[str, str]],
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> str:
         """
         Send asynchronous request to LLM.
 
         Args:
             messages: List of message dictionaries
+            response_format: Optional structured-output format for the response
 
         Returns:
             Response text from LLM
 
         Raises:
+            CircuitOpenError: If the API is considered down
+            FatalAPIError: If the credentials, model or endpoint are rejected
             ClassifierAPIError: If API call fails
         """
+        if self.circuit_breaker is not None and not self.circuit_breaker.allow():
+            raise CircuitOpenError("LLM API unavailable, request skipped")
+
+        extra: Dict[str, Any] = {}
+        if response_format is not None:
+            extra['response_format'] = response_format
+        if self._extra_body is not None:
+            extra['extra_body'] = self._extra_body
+
+        # Wait for budget before taking a concurrency permit, so throttled
+        # requests don't hold slots that ready ones could use
+        await self._rate_limit(messages)
+
+        async with self.concurrency:
+            try:
+                if self.stream:
+                    content = await self._read_stream(messages, extra)
+                else:
+                    response = await self.async_client.chat.completions.create(
+                        model=self.model,
+                        messages=messages,
+                        temperature=self.temperature,
+                        max_tokens=self.max_tokens,
+                        **extra
+                    )
+                    content = response.choices[0].message.content
+                self.concurrency.record_success()
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_success()
+                return content
+
+            except Exception as e:
+                if self._is_overload_error(e):
+                    self.concurrency.record_failure()
+                if isinstance(e, RateLimitError):
+                    retry_after = self.retry_after(e)
+                    if retry_after:
+                        self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+                if self.circuit_breaker is not None:
+                    if self._is_outage_error(e):
+                        self.circuit_breaker.record_failure()
+                    else:
+                        self.circuit_breaker.record_success()
+                if isinstance(e, (AuthenticationError, PermissionDeniedError, NotFoundError)):
+                    raise FatalAPIError(f"LLM API rejected the request: {e}") from e
+                logger.error(f"Async API request failed: {e}")
+                raise ClassifierAPIError(f"LLM API call failed: {e}") from e
+
+    async def _read_stream(self, messages: List[Dict[str, str]], extra: Dict[str, Any]) -> str:
+        """
+        Stream a completion, stopping as soon as it holds complete JSON.
+
+        Closing the stream early drops the connection, so the server stops
+        generating whatever the model would have added after the payload.
+
+        Args:
+            messages: List of message dictionaries
+            extra: Additional create() arguments
+
+        Returns:
+            Response text received
+        """
+        stream = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=True,
+            **extra
+        )
+        parts: List[str] = []
+        tracker = _JsonEndTracker()
         try:
-            response = await self.async_client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=self.temperature,
-                max_tokens=self.max_tokens
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+                # Parse only once the outermost bracket has closed
+                if tracker.feed(delta):
+                    # Join once; later deltas then append to the joined text
+                    text = ''.join(parts)
+                    if _is_complete_json(text):
+                        return text
+                    parts = [text]
+        finally:
+            await stream.close()
+        return ''.join(parts)
+
+    async def run_batch(
+        self,
+        requests: Dict[str, List[Dict[str, str]]],
+        response_format: Optional[Dict[str, Any]] = None,
+        poll_interval: float = 30.0,
+        completion_window: str = "24h"
+    ) -> Dict[str, str]:
+        """
+        Send chat requests through the provider's Batch API and wait for them.
+
+        Batch jobs are billed at a discount and do not count against the
+        real-time rate limits, at the cost of finishing within the completion
+        window rather than in seconds.
+
+        Args:
+            requests: Message lists keyed by a caller-chosen request ID
+            response_format: Optional structured-output format for every response
+            poll_interval: Seconds between job status checks
+            completion_window: Time the provider has to finish the job
+
+        Returns:
+            Response text by request ID; failed requests are left out
+
+        Raises:
+            FatalAPIError: If the credentials are rejected
+            ClassifierAPIError: If the provider has no Batch API or the job fails
+        """
+        lines = []
+        for custom_id, messages in requests.items():
+            body: Dict[str, Any] = {
+                'model': self.model,
+                'messages': messages,
+                'temperature': self.temperature,
+                'max_tokens': self.max_tokens,
+            }
+            if response_format is not None:
+                body['response_format'] = response_format
+            lines.append(json.dumps({
+                'custom_id': custom_id,
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': body,
+            }))
+
+        client = self.async_client
+        try:
+            input_file = await client.files.create(
+                file=('classify.jsonl', '\n'.join(lines).encode()),
+                purpose='batch'
+            )
+            batch = await client.batches.create(
+                input_file_id=input_file.id,
+                endpoint='/v1/chat/completions',
+                completion_window=completion_window
             )
-            return response.choices[0].message.content
+            logger.info(f"Submitted batch job {batch.id} with {len(lines)} requests")
+
+            while batch.status not in ('completed', 'failed', 'expired', 'cancelled'):
+                await asyncio.sleep(poll_interval)
+                batch = await client.batches.retrieve(batch.id)
+                counts = batch.request_counts
+                if counts is not None:
+                    logger.info(
+                        f"Batch job {batch.id}: {batch.status} "
+                        f"({counts.completed}/{counts.total} done)"
+                    )
 
+            # Expired jobs still return the requests that finished in time
+            if batch.output_file_id is None:
+                raise ClassifierAPIError(f"Batch job {batch.id} {batch.status} without output")
+            output = await client.files.content(batch.output_file_id)
+        except ClassifierAPIError:
+            raise
+        except (AuthenticationError, PermissionDeniedError) as e:
+            raise FatalAPIError(f"LLM API rejected the batch job: {e}") from e
         except Exception as e:
-            logger.error(f"Async API request failed: {e}")
-            raise ClassifierAPIError(f"LLM API call failed: {e}")
+            raise ClassifierAPIError(f"Batch API call failed: {e}") from e
+
+        responses: Dict[str, str] = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = _json_loads(line)
+            response = record.get('response') or {}
+            if response.get('status_code') != 200:
+                logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                continue
+            responses[record['custom_id']] = response['body']['choices'][0]['message']['content']
+        return responses
+
+    @staticmethod
+    def _is_overload_error(error: Exception) -> bool:
+        """
+        Check whether an API error means the server is overloaded.
+
+        Args:
+            error: Exception raised by the API call
+
+        Returns:
+            True for rate limits, timeouts and 5xx responses
+        """
+        if isinstance(error, (RateLimitError, APITimeoutError)):
+            return True
+        status_code = getattr(error, 'status_code', None)
+        return status_code is not None and status_code >= 500
+
+    @staticmethod
+    def _is_outage_error(error: Exception) -> bool:
+        """
+        Check whether an API error means the server is unreachable or failing.
+
+        Args:
+            error: Exception raised by the API call
+
+        Returns:
+            True for connection errors, timeouts and 5xx responses
+        """
+        if isinstance(error, APIConnectionError):
+            return True
+        status_code = getattr(error, 'status_code', None)
+        return status_code is not None and status_code >= 500
 
 
 class AIClassifier:
@@ -170,14 +855,31 @@ Output format:
 """
     }
 
+    # Bump whenever prompts or response parsing change so results cached by
+    # an older version are not reused
+    PROMPT_VERSION = 2
+
+    # Content budgets as (head, tail, signature lines, max tokens). The first
+    # three go to compress_content, and head + tail matches the plain
+    # truncation used when compression is disabled. The token cap keeps
+    # dense text (CJK, minified code) from blowing the TPM budget.
+    SINGLE_FILE_CONTENT = (400, 100, 3, 200)
+    MULTI_FILE_CONTENT = (160, 40, 1, 80)
+
     def __init__(
         self,
         llm_client: LLMClient,
         cache_manager: Optional[CacheManager] = None,
         max_retries: int = 3,
         retry_delay: int = 2,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
         language: str = "english",
-        fallback_language: str = "english"
+        fallback_language: str = "english",
+        semantic_cache: Optional[SemanticCache] = None,
+        prefix_cache: bool = True,
+        content_compression: bool = True,
+        max_prompt_tokens: Optional[int] = None
     ):
         """
         Initialize the AI classifier.
@@ -187,18 +889,85 @@ Output format:
             cache_manager: Optional cache manager
             max_retries: Maximum number of retry attempts
             retry_delay: Delay between retries in seconds
+            max_delay: Upper bound on the exponential backoff in seconds
+            jitter: Random extra fraction (0..jitter) added to each backoff
             language: Primary language for directory names
             fallback_language: Fallback language if primary not available
+            semantic_cache: Optional similarity cache consulted before the LLM
+            prefix_cache: Move the static multi-file instructions into the
+                system message so they are part of the cacheable prefix
+            content_compression: Send head, tail and signature lines of each
+                content preview instead of its first characters
+            max_prompt_tokens: Approximate prompt-token budget per multi-file
+                request; files without content pack densely, files with
+                large previews fill a request sooner (None: file count only)
         """
         self.llm_client = llm_client
         self.cache_manager = cache_manager
+        self.semantic_cache = semantic_cache if semantic_cache and semantic_cache.enabled else None
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
         self.language = language.lower()
         self.fallback_language = fallback_language.lower()
-
-        # Build system prompt with language-specific examples
+        self.max_prompt_tokens = max_prompt_tokens
+        self.prefix_cache = prefix_cache
+        self.content_compression = content_compression
+        self._cache_namespace = self.cache_namespace(llm_client.model, self.language)
+
+        # Build system prompt with language-specific examples. The prompt and
+        # the message wrapping it are shared by every request so the API sees
+        # a byte-identical prefix and can reuse its prompt cache.
         self.system_prompt = self._build_system_prompt()
+        self._system_message = {"role": "system", "content": self.system_prompt}
+
+        # Static tail of every multi-file prompt
+        self._multi_file_format = self.get_multi_file_format(self.language)
+
+        # Multi-file requests get their own static system message: shared
+        # prompt, then the output instructions, so only the file list varies
+        # and provider/server prefix caching (OpenAI, vLLM, llama.cpp) can
+        # skip prefill for everything before it.
+        self._multi_file_system_message = {
+            "role": "system",
+            "content": self.get_multi_file_system_prompt(self.language, self.fallback_language)
+        }
+
+    def _compute_backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Compute how long to wait before retrying a failed request.
+
+        Args:
+            attempt: Zero-based number of the attempt that failed
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            Delay in seconds: the server's Retry-After when given, otherwise
+            capped exponential backoff with random jitter so clients that
+            failed together do not retry together
+        """
+        if retry_after is not None:
+            return retry_after
+
+        delay = min(self.retry_delay * (1 << attempt), self.max_delay)
+        return delay * (1 + random.random() * self.jitter)
+
+    @classmethod
+    def cache_namespace(cls, model: str, language: str) -> str:
+        """
+        Namespace that cached classifications are stored under.
+
+        Cached results are only valid for the same model, prompt and language.
+
+        Args:
+            model: LLM model name
+            language: Language for category names
+
+        Returns:
+            Namespace string
+        """
+        return f"{model}|{cls.PROMPT_VERSION}|{language.lower()}"
 
     def _build_system_prompt(self) -> str:
         """
@@ -207,85 +976,278 @@ Output format:
         Returns:
             Formatted system prompt string
         """
+        return self.get_system_prompt(self.language, self.fallback_language)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def get_system_prompt(language: str, fallback_language: str = "english") -> str:
+        """
+        Get the system prompt for a language, formatting it once per process.
+
+        Args:
+            language: Primary language for directory names
+            fallback_language: Language whose examples are used if primary has none
+
+        Returns:
+            Formatted system prompt string
+        """
+        language = language.lower()
+        examples_by_language = AIClassifier.LANGUAGE_EXAMPLES
+
         # Get examples for the selected language
-        examples = self.LANGUAGE_EXAMPLES.get(
-            self.language,
-            self.LANGUAGE_EXAMPLES.get(self.fallback_language, self.LANGUAGE_EXAMPLES["english"])
+        examples = (
+            examples_by_language.get(language)
+            or examples_by_language.get(fallback_language.lower())
+            or examples_by_language["english"]
         )
 
-        # Format the prompt
-        return self.SYSTEM_PROMPT_TEMPLATE.format(
-            language=self.language.upper(),
+        # Format the prompt; interned so every classifier shares one copy
+        return sys.intern(AIClassifier.SYSTEM_PROMPT_TEMPLATE.format(
+            language=language.upper(),
             examples=examples
+        ))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def get_multi_file_format(language: str) -> str:
+        """
+        Get the multi-file response format description for a language.
+
+        Args:
+            language: Language for directory names
+
+        Returns:
+            JSON array template shown to the model
+        """
+        language_upper = language.upper()
+        return sys.intern(f"""[
+  {{
+    "primary_category": "string (in {language_upper})",
+    "subcategory": "string or null (in {language_upper})",
+    "sub_subcategory": "string or null (in {language_upper})",
+    "confidence": float (0.0-1.0),
+    "reasoning": "string"
+  }},
+  ...
+]
+""")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def get_multi_file_system_prompt(language: str, fallback_language: str = "english") -> str:
+        """
+        Get the system prompt for multi-file requests, formatting it once per process.
+
+        Args:
+            language: Primary language for directory names
+            fallback_language: Language whose examples are used if primary has none
+
+        Returns:
+            Shared system prompt followed by the multi-file output instructions
+        """
+        return sys.intern(
+            f"{AIClassifier.get_system_prompt(language, fallback_language)}\n\n"
+            "When asked to classify several files, return a JSON array with one "
+            "classification object per file, in the SAME ORDER as the files.\n\n"
+            f"Return format:\n{AIClassifier.get_multi_file_format(language.lower())}"
         )
 
-    def classify(self, file_info: FileInfo) -> Optional[Classification]:
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """
+        Build the chat messages for a request.
+
+        Args:
+            prompt: User prompt describing the file(s) to classify
+
+        Returns:
+            List of message dictionaries sharing the cached system message
         """
-        Classify a single file.
+        return [self._system_message, {"role": "user", "content": prompt}]
+
+    def _cache_key(self, file_info: FileInfo) -> str:
+        """
+        Build the exact-cache key for a file.
+
+        Keyed by name and content rather than path and mtime, so results
+        survive the files being moved by a previous run. The key is stored
+        on the FileInfo with its namespace, so the lookup and the later
+        store hash it once, and a classifier with other settings (model,
+        language, prompt version) never reuses it.
 
         Args:
             file_info: File information object
 
         Returns:
-            Classification result or None if failed
+            Cache key
         """
-        # Check cache first
-        if self.cache_manager:
-            cache_key = self.cache_manager.get_cache_key(
-                str(file_info.path),
-                file_info.size,
-                file_info.modified.timestamp()
-            )
-            cached = self.cache_manager.get(cache_key)
-            if cached:
-                logger.debug(f"Using cached classification for {file_info.name}")
-                return Classification.from_dict(cached)
+        namespace = self._cache_namespace
+        stored = file_info.cache_key
+        if stored is not None and stored[0] == namespace:
+            return stored[1]
+        key = self.cache_manager.get_content_key(
+            file_info.name,
+            file_info.size,
+            self.fingerprint(file_info),
+            namespace
+        )
+        file_info.cache_key = (namespace, key)
+        return key
 
-        # Build prompt
-        prompt = self._build_content_prompt(file_info)
-        messages = [
-            {"role": "system", "content": self.system_prompt},
-            {"role": "user", "content": prompt}
+    def _lookup_cached(self, file_info: FileInfo) -> Optional[Classification]:
+        """
+        Look up a file in the exact-match cache.
+
+        Args:
+            file_info: File information object
+
+        Returns:
+            Cached classification or None on a miss (or with caching off)
+        """
+        if self.cache_manager is None:
+            return None
+
+        cached = self.cache_manager.get(self._cache_key(file_info))
+        if not cached:
+            return None
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Using cached classification for {file_info.name}")
+        return Classification.from_dict(cached)
+
+    def _lookup_cached_many(self, file_infos: List[FileInfo]) -> List[Optional[Classification]]:
+        """
+        Look up several files in the exact-match cache with one batched read.
+
+        Args:
+            file_infos: List of file information objects
+
+        Returns:
+            Cached classifications aligned with file_infos (None on a miss)
+        """
+        if self.cache_manager is None:
+            return [None] * len(file_infos)
+
+        keys = [self._cache_key(file_info) for file_info in file_infos]
+        found = self.cache_manager.get_many(keys)
+        if not found:
+            return [None] * len(file_infos)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Using cached classifications for {len(found)}/{len(keys)} files")
+        return [
+            Classification.from_dict(found[key]) if key in found else None
+            for key in keys
         ]
 
-        # Send request with retry logic
-        for attempt in range(self.max_retries):
-            try:
-                response_text = self.llm_client.send_request(messages)
-                classification = self._parse_response(response_text)
+    def fingerprint(self, file_info: FileInfo) -> Optional[str]:
+        """
+        Get a file's content digest, reusing the one stored by an earlier run.
 
-                if classification:
-                    # Cache the result
-                    if self.cache_manager:
-                        self.cache_manager.set(cache_key, classification.to_dict())
+        Args:
+            file_info: File information object
 
-                    logger.info(
-                        f"Classified {file_info.name} -> {classification.directory_path} "
-                        f"(confidence: {classification.confidence:.2f})"
-                    )
-                    return classification
+        Returns:
+            Head digest of the file, or None if it is unreadable
+        """
+        if file_info.content_digest is not None or self.cache_manager is None:
+            return file_info.head_digest()
+
+        memo_path = f"{HEAD_DIGEST_ALGORITHM}:{file_info.path}"
+        modified_time = file_info.mtime
+        if modified_time is None:
+            modified_time = file_info.modified.timestamp()
+        digest = self.cache_manager.get_fingerprint(memo_path, file_info.size, modified_time)
+        if digest is not None:
+            file_info.content_digest = digest
+            return digest
+
+        digest = file_info.head_digest()
+        if digest is not None:
+            self.cache_manager.set_fingerprint(memo_path, file_info.size, modified_time, digest)
+        return digest
+
+    def _semantic_lookup(
+        self,
+        file_info: FileInfo,
+        vector: Any = None
+    ) -> Tuple[Any, Optional[Classification]]:
+        """
+        Look up a classification for a similar, previously classified file.
 
-            except RateLimitError:
-                wait_time = self.retry_delay * (2 ** attempt)
-                logger.warning(f"Rate limit hit, waiting {wait_time}s")
-                time.sleep(wait_time)
+        Args:
+            file_info: File information object
+            vector: Precomputed sketch vector (embedded here if None)
 
-            except APITimeoutError:
-                logger.warning(f"Timeout on attempt {attempt + 1}")
-                if attempt == self.max_retries - 1:
-                    logger.error(f"Failed to classify {file_info.name} after {self.max_retries} attempts")
+        Returns:
+            Tuple of (sketch vector or None, cached classification or None)
+        """
+        if self.semantic_cache is None:
+            return None, None
 
-            except (APIConnectionError, APIError) as e:
-                logger.error(f"API error: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.retry_delay * (2 ** attempt))
+        if vector is None:
+            vector, cached = self.semantic_cache.semantic_lookup(
+                SemanticCache.build_sketch(file_info.name, file_info.content_preview)
+            )
+        else:
+            cached = self.semantic_cache.lookup(vector)
+        if cached:
+            logger.debug(f"Using semantically cached classification for {file_info.name}")
+            return vector, Classification.from_dict(cached)
+        return vector, None
+
+    def _embed_sketches(self, file_infos: List[FileInfo]) -> List[Any]:
+        """
+        Embed the sketches of several files in one batched call.
 
-            except ClassifierAPIError as e:
-                logger.error(f"Classification failed: {e}")
-                if attempt == self.max_retries - 1:
-                    break
+        Args:
+            file_infos: List of file information objects
 
-        return None
+        Returns:
+            One sketch vector per file (all None if the semantic cache is off)
+        """
+        if self.semantic_cache is None or not file_infos:
+            return [None] * len(file_infos)
+
+        return list(self.semantic_cache.embed_batch([
+            SemanticCache.build_sketch(file_info.name, file_info.content_preview)
+            for file_info in file_infos
+        ]))
+
+    def _semantic_store(self, vector: Any, classification: Classification) -> None:
+        """
+        Remember a fresh classification in the semantic cache.
+
+        Args:
+            vector: Sketch vector from _semantic_lookup (None if disabled)
+            classification: Classification returned by the LLM
+        """
+        if self.semantic_cache is not None and vector is not None:
+            self.semantic_cache.insert(vector, classification.to_dict())
+
+    def classify(self, file_info: FileInfo) -> Optional[Classification]:
+        """
+        Classify a single file from synchronous code.
+
+        Runs classify_async in a private event loop; the pooled HTTP client
+        is closed before returning so it is not reused from another loop,
+        and buffered cache writes are flushed since no run ends after it.
+        Must not be called while an event loop is running.
+
+        Args:
+            file_info: File information object
+
+        Returns:
+            Classification result or None if failed
+        """
+        async def run() -> Optional[Classification]:
+            async with self.llm_client:
+                return await self.classify_async(file_info)
+
+        try:
+            return asyncio.run(run())
+        finally:
+            if self.cache_manager:
+                self.cache_manager.flush()
 
     async def classify_async(self, file_info: FileInfo) -> Optional[Classification]:
         """
@@ -297,76 +1259,158 @@ Output format:
         Returns:
             Classification result or None if failed
         """
+        cache_manager = self.cache_manager
+
         # Check cache first
-        if self.cache_manager:
-            cache_key = self.cache_manager.get_cache_key(
-                str(file_info.path),
-                file_info.size,
-                file_info.modified.timestamp()
-            )
-            cached = self.cache_manager.get(cache_key)
-            if cached:
-                logger.debug(f"Using cached classification for {file_info.name}")
-                return Classification.from_dict(cached)
+        cached = self._lookup_cached(file_info)
+        if cached:
+            return cached
+
+        # Check semantic cache for a near-identical file
+        sketch_vector, similar = self._semantic_lookup(file_info)
+        if similar:
+            return similar
 
         # Build prompt
         prompt = self._build_content_prompt(file_info)
-        messages = [
-            {"role": "system", "content": self.system_prompt},
-            {"role": "user", "content": prompt}
-        ]
+        messages = self._build_messages(prompt)
 
-        # Send request with retry logic
-        for attempt in range(self.max_retries):
-            try:
-                response_text = await self.llm_client.send_request_async(messages)
-                classification = self._parse_response(response_text)
+        response_format = SINGLE_FILE_RESPONSE_FORMAT if self.llm_client.structured_output else None
 
-                if classification:
-                    # Cache the result
-                    if self.cache_manager:
-                        self.cache_manager.set(cache_key, classification.to_dict())
+        try:
+            classification = await self._request_with_retry(
+                messages,
+                self._parse_response,
+                response_format
+            )
+        except CircuitOpenError:
+            logger.debug(f"Skipped {file_info.name}: API unavailable")
+            return None
 
-                    logger.info(
-                        f"Classified {file_info.name} -> {classification.directory_path} "
-                        f"(confidence: {classification.confidence:.2f})"
-                    )
-                    return classification
+        if classification is None:
+            logger.error(f"Failed to classify {file_info.name} after {self.max_retries} attempts")
+            return None
 
-            except RateLimitError:
-                wait_time = self.retry_delay * (2 ** attempt)
-                logger.warning(f"Rate limit hit, waiting {wait_time}s")
-                await asyncio.sleep(wait_time)
+        # Cache the result
+        if cache_manager:
+            cache_manager.set(self._cache_key(file_info), classification.to_dict())
+        self._semantic_store(sketch_vector, classification)
 
-            except APITimeoutError:
-                logger.warning(f"Timeout on attempt {attempt + 1}")
-                if attempt == self.max_retries - 1:
-                    logger.error(f"Failed to classify {file_info.name} after {self.max_retries} attempts")
+        logger.info(
+            f"Classified {file_info.name} -> {classification.directory_path} "
+            f"(confidence: {classification.confidence:.2f})"
+        )
+        return classification
 
-            except (APIConnectionError, APIError) as e:
-                logger.error(f"API error: {e}")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
+    async def _request_with_retry(
+        self,
+        messages: List[Dict[str, str]],
+        parse: Callable[[Optional[str]], Any],
+        response_format: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Send a request and parse its response, retrying failed attempts.
+
+        LLMClient wraps every SDK error in ClassifierAPIError, keeping the
+        original as __cause__ for the Retry-After headers.
+
+        Args:
+            messages: List of message dictionaries
+            parse: Turns response text into a result; an empty result
+                counts as a failed attempt
+            response_format: Optional structured-output format for the response
+
+        Returns:
+            First non-empty parsed result, or None once retries are exhausted
 
+        Raises:
+            FatalAPIError: Credential and model errors are not retried
+            CircuitOpenError: The API is down, so retries would be refused too
+        """
+        for attempt in range(self.max_retries):
+            try:
+                response_text = await self.llm_client.send_request_async(
+                    messages,
+                    response_format=response_format
+                )
+            except (FatalAPIError, CircuitOpenError):
+                raise
             except ClassifierAPIError as e:
-                logger.error(f"Classification failed: {e}")
                 if attempt == self.max_retries - 1:
                     break
+                wait_time = self._compute_backoff(attempt, self.llm_client.retry_after(e))
+                if isinstance(e.__cause__, RateLimitError):
+                    logger.warning(f"Rate limit hit, waiting {wait_time:.1f}s")
+                await asyncio.sleep(wait_time)
+                continue
+
+            result = parse(response_text)
+            if result:
+                return result
 
         return None
 
-    async def classify_batch(self, file_infos: List[FileInfo]) -> List[Optional[Classification]]:
+    async def _map_bounded(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: List[Any]
+    ) -> List[Any]:
+        """
+        Await func(item) for every item with a bounded pool of workers.
+
+        Unlike gathering one task per item, at most as many calls run at
+        once as the LLM client's limiter can ever admit, so a large batch
+        does not build every prompt and coroutine up front and then queue
+        them all on the limiter.
+
+        Args:
+            func: Coroutine function applied to each item
+            items: Items to process
+
+        Returns:
+            Results in input order; exceptions are returned in place of
+            results, as with asyncio.gather(return_exceptions=True)
+
+        Raises:
+            FatalAPIError: If any call hits one; the other workers are cancelled
+        """
+        results: List[Any] = [None] * len(items)
+        pending = iter(enumerate(items))
+
+        async def worker() -> None:
+            """Process items until the shared iterator is exhausted."""
+            for index, item in pending:
+                try:
+                    results[index] = await func(item)
+                except FatalAPIError:
+                    raise
+                except Exception as e:
+                    results[index] = e
+
+        worker_count = min(len(items), self.llm_client.concurrency.maximum)
+        await gather_or_cancel([worker() for _ in range(worker_count)])
+        return results
+
+    async def classify_batch(
+        self,
+        file_infos: List[FileInfo],
+        files_per_request: int = 1
+    ) -> List[Optional[Classification]]:
         """
         Classify multiple files concurrently.
 
         Args:
             file_infos: List of file information objects
+            files_per_request: Files sent per API request; above 1 the files
+                are packed into multi-file requests (see classify_many_async)
 
         Returns:
             List of classification results
         """
-        tasks = [self.classify_async(file_info) for file_info in file_infos]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if files_per_request > 1:
+            return await self.classify_many_async(file_infos, files_per_request)
+
+        results = await self._map_bounded(self.classify_async, file_infos)
 
         # Convert exceptions to None
         processed_results = []
@@ -379,6 +1423,170 @@ Output format:
 
         return processed_results
 
+    async def classify_many_async(
+        self,
+        file_infos: List[FileInfo],
+        files_per_request: int = 10
+    ) -> List[Optional[Classification]]:
+        """
+        Classify many files with multi-file requests of up to files_per_request each.
+
+        Sub-batches are sent by a bounded pool of workers; the LLM client's
+        adaptive limiter bounds how many requests are in flight, so N files cost
+        ceil(N / files_per_request) round-trips instead of N.
+
+        Args:
+            file_infos: List of file information objects
+            files_per_request: Maximum files to include in one API request
+
+        Returns:
+            List of classification results in the same order as input
+        """
+        chunks = self.pack_requests(file_infos, max(1, files_per_request))
+
+        chunk_results = await self._map_bounded(
+            functools.partial(self.classify_multi_file_batch, max_files_per_request=files_per_request),
+            chunks
+        )
+
+        results: List[Optional[Classification]] = []
+        for chunk, chunk_result in zip(chunks, chunk_results):
+            if isinstance(chunk_result, Exception):
+                logger.error(f"Multi-file batch failed: {chunk_result}")
+                results.extend([None] * len(chunk))
+            else:
+                results.extend(chunk_result)
+
+        return results
+
+    def pack_requests(self, file_infos: List[FileInfo], files_per_request: int) -> List[List[FileInfo]]:
+        """
+        Split files into multi-file requests.
+
+        Without a prompt-token budget every request gets files_per_request
+        files. With one, files are packed greedily in order until either
+        limit is reached, so a request of content-heavy files closes early.
+
+        Args:
+            file_infos: List of file information objects
+            files_per_request: Maximum files in one request
+
+        Returns:
+            Files for each request, in input order
+        """
+        if self.max_prompt_tokens is None:
+            return [
+                file_infos[i:i + files_per_request]
+                for i in range(0, len(file_infos), files_per_request)
+            ]
+
+        chunks: List[List[FileInfo]] = []
+        chunk: List[FileInfo] = []
+        used = 0
+        for file_info in file_infos:
+            cost = self._estimate_file_tokens(file_info)
+            if chunk and (len(chunk) >= files_per_request or used + cost > self.max_prompt_tokens):
+                chunks.append(chunk)
+                chunk, used = [], 0
+            chunk.append(file_info)
+            used += cost
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _estimate_file_tokens(self, file_info: FileInfo) -> int:
+        """
+        Estimate the prompt tokens one file adds to a multi-file request.
+
+        Args:
+            file_info: File information object
+
+        Returns:
+            Approximate tokens for the metadata block and content preview
+        """
+        # Metadata block is ~25 tokens plus the name, at ~4 characters per token
+        tokens = 25 + len(file_info.name) // 4
+        if file_info.content_preview:
+            head, tail, _, max_tokens = self.MULTI_FILE_CONTENT
+            tokens += min(len(file_info.content_preview) // 4, (head + tail) // 4, max_tokens)
+        return tokens
+
+    async def classify_via_batch_api(
+        self,
+        file_infos: List[FileInfo],
+        poll_interval: float = 30.0,
+        completion_window: str = "24h"
+    ) -> List[Optional[Classification]]:
+        """
+        Classify files offline through the provider's Batch API.
+
+        Every file missing from the exact and semantic caches becomes one
+        request of a single batch job. Files the job does not answer, or all
+        of them if the provider has no Batch API, are classified with
+        regular requests instead.
+
+        Args:
+            file_infos: List of file information objects
+            poll_interval: Seconds between job status checks
+            completion_window: Time the provider has to finish the job
+
+        Returns:
+            List of classification results in the same order as input
+        """
+        results = self._lookup_cached_many(file_infos)
+        exact_misses = [i for i, result in enumerate(results) if result is None]
+
+        # Near-identical files reuse an earlier answer instead of joining the job
+        pending = []
+        sketch_vectors: Dict[int, Any] = {}
+        miss_vectors = self._embed_sketches([file_infos[i] for i in exact_misses])
+        for i, miss_vector in zip(exact_misses, miss_vectors):
+            sketch_vectors[i], results[i] = self._semantic_lookup(file_infos[i], miss_vector)
+            if results[i] is None:
+                pending.append(i)
+        if not pending:
+            return results
+
+        requests = {
+            str(i): self._build_messages(self._build_content_prompt(file_infos[i]))
+            for i in pending
+        }
+        response_format = SINGLE_FILE_RESPONSE_FORMAT if self.llm_client.structured_output else None
+
+        try:
+            responses = await self.llm_client.run_batch(
+                requests,
+                response_format,
+                poll_interval,
+                completion_window
+            )
+        except FatalAPIError:
+            raise
+        except ClassifierAPIError as e:
+            logger.warning(f"Batch API unavailable, classifying with regular requests: {e}")
+            responses = {}
+
+        cache_manager = self.cache_manager
+        unanswered = []
+        for i in pending:
+            response_text = responses.get(str(i))
+            classification = self._parse_response(response_text) if response_text else None
+            if classification is None:
+                unanswered.append(i)
+                continue
+            results[i] = classification
+            if cache_manager:
+                cache_manager.set(self._cache_key(file_infos[i]), classification.to_dict())
+            self._semantic_store(sketch_vectors[i], classification)
+
+        if unanswered:
+            logger.info(f"Classifying {len(unanswered)} files the batch job did not answer")
+            fallback = await self.classify_batch([file_infos[i] for i in unanswered])
+            for i, classification in zip(unanswered, fallback):
+                results[i] = classification
+
+        return results
+
     async def classify_multi_file_batch(
         self,
         file_infos: List[FileInfo],
@@ -404,75 +1612,90 @@ Output format:
         cached_results = []
         uncached_files = []
         uncached_indices = []
+        sketch_vectors = []
 
-        for i, file_info in enumerate(file_infos):
-            if self.cache_manager:
-                cache_key = self.cache_manager.get_cache_key(
-                    str(file_info.path),
-                    file_info.size,
-                    file_info.modified.timestamp()
-                )
-                cached = self.cache_manager.get(cache_key)
-                if cached:
-                    logger.debug(f"Using cached classification for {file_info.name}")
-                    cached_results.append((i, Classification.from_dict(cached)))
-                    continue
+        exact_misses = []
+        for i, cached in enumerate(self._lookup_cached_many(file_infos)):
+            if cached:
+                cached_results.append((i, cached))
+            else:
+                exact_misses.append(i)
 
-            uncached_files.append(file_info)
-            uncached_indices.append(i)
+        # Embed all remaining sketches in one batch before the similarity lookups
+        miss_vectors = self._embed_sketches([file_infos[i] for i in exact_misses])
 
-        # Build multi-file prompt
-        prompt = self._build_multi_file_prompt(uncached_files[:max_files_per_request])
-        messages = [
-            {"role": "system", "content": self.system_prompt},
-            {"role": "user", "content": prompt}
-        ]
+        for i, miss_vector in zip(exact_misses, miss_vectors):
+            file_info = file_infos[i]
+            sketch_vector, similar = self._semantic_lookup(file_info, miss_vector)
+            if similar:
+                cached_results.append((i, similar))
+                continue
 
-        # Send request with retry logic
-        for attempt in range(self.max_retries):
-            try:
-                response_text = await self.llm_client.send_request_async(messages)
-                classifications = self._parse_multi_file_response(
-                    response_text,
-                    uncached_files[:max_files_per_request]
-                )
+            uncached_files.append(file_info)
+            uncached_indices.append(i)
+            sketch_vectors.append(sketch_vector)
 
-                if classifications:
-                    # Cache results
-                    for file_info, classification in zip(
-                        uncached_files[:max_files_per_request],
-                        classifications
-                    ):
-                        if classification and self.cache_manager:
-                            cache_key = self.cache_manager.get_cache_key(
-                                str(file_info.path),
-                                file_info.size,
-                                file_info.modified.timestamp()
-                            )
-                            self.cache_manager.set(cache_key, classification.to_dict())
-
-                    # Merge cached and new results
-                    results = [None] * len(file_infos)
-                    for i, classification in cached_results:
-                        results[i] = classification
-                    for i, classification in enumerate(classifications):
-                        results[uncached_indices[i]] = classification
-
-                    return results
-
-            except RateLimitError:
-                wait_time = self.retry_delay * (2 ** attempt)
-                logger.warning(f"Rate limit hit, waiting {wait_time}s")
-                await asyncio.sleep(wait_time)
+        if not uncached_files:
+            results = [None] * len(file_infos)
+            for i, classification in cached_results:
+                results[i] = classification
+            return results
 
-            except Exception as e:
-                logger.error(f"Multi-file batch classification failed: {e}")
-                if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self.retry_delay * (2 ** attempt))
+        # Build multi-file prompt
+        batch = uncached_files[:max_files_per_request]
+        prompt = self._build_multi_file_prompt(batch)
+        if self.prefix_cache:
+            messages = [self._multi_file_system_message, {"role": "user", "content": prompt}]
+        else:
+            messages = self._build_messages(prompt)
+
+        response_format = None
+        if self.llm_client.structured_output:
+            response_format = multi_file_response_format(len(batch))
+
+        def parse(response_text: Optional[str]) -> Optional[List[Optional[Classification]]]:
+            # A response with no usable item is retried like an unparseable one
+            parsed = self._parse_multi_file_response(response_text, file_infos=batch)
+            return parsed if any(parsed) else None
 
-        # Fallback to individual classification if multi-file batch fails
-        logger.warning("Multi-file batch failed, falling back to individual classification")
-        return await self.classify_batch(file_infos)
+        try:
+            classifications = await self._request_with_retry(messages, parse, response_format)
+        except CircuitOpenError:
+            # Per-file requests below are refused just as fast
+            classifications = None
+
+        if classifications is None:
+            logger.warning("Multi-file batch failed, falling back to individual classification")
+            classifications = []
+
+        # Cache what the response did classify
+        cache_manager = self.cache_manager
+        for file_info, classification, sketch_vector in zip(batch, classifications, sketch_vectors):
+            if not classification:
+                continue
+            if cache_manager:
+                # Key was memoized on the FileInfo during the lookup above
+                cache_manager.set(self._cache_key(file_info), classification.to_dict())
+            self._semantic_store(sketch_vector, classification)
+
+        # Only files the response left out go to one request per file
+        classifications = list(classifications) + [None] * (len(uncached_files) - len(classifications))
+        unresolved = [k for k, classification in enumerate(classifications) if classification is None]
+        if unresolved:
+            if len(unresolved) < len(uncached_files):
+                logger.info(f"Classifying {len(unresolved)} files the multi-file response missed individually")
+            fallback = await self.classify_batch([uncached_files[k] for k in unresolved])
+            for k, classification in zip(unresolved, fallback):
+                classifications[k] = classification
+
+        # Merge cached and new results
+        results = [None] * len(file_infos)
+        for i, classification in cached_results:
+            results[i] = classification
+        for i, classification in zip(uncached_indices, classifications):
+            results[i] = classification
+
+        return results
 
     def _build_multi_file_prompt(self, file_infos: List[FileInfo]) -> str:
         """
@@ -484,74 +1707,90 @@ Output format:
         Returns:
             Formatted prompt string
         """
-        prompt = f"""Classify the following {len(file_infos)} files.
-Return a JSON array with {len(file_infos)} classification objects in the SAME ORDER as the files below.
-
-"""
+        count = len(file_infos)
+        if self.prefix_cache:
+            # Output instructions live in the multi-file system message
+            parts = [f"Classify the following {count} files.\n"]
+        else:
+            parts = [f"""Classify the following {count} files.
+Return a JSON array with {count} classification objects in the SAME ORDER as the files below.
+
+"""]
+        # Collected and joined once; += would copy the prompt for every file
         for i, file_info in enumerate(file_infos, 1):
-            prompt += f"""
+            parts.append(f"""
 File {i}:
   Filename: {file_info.name}
   Extension: {file_info.extension}
   Size: {file_info.size_formatted}
   Modified: {file_info.modified_date}
-"""
+""")
             if file_info.content_preview:
-                preview = file_info.content_preview[:200]  # Shorter for multi-file
-                prompt += f"  Content Preview: {preview}...\n"
+                preview = self._content_for_prompt(file_info, self.MULTI_FILE_CONTENT)  # Shorter for multi-file
+                parts.append(f"  Content Preview: {preview}...\n")
 
-        prompt += f"""
-Return format (JSON array with {len(file_infos)} objects):
-[
-  {{
-    "primary_category": "string (in {self.language.upper()})",
-    "subcategory": "string or null (in {self.language.upper()})",
-    "sub_subcategory": "string or null (in {self.language.upper()})",
-    "confidence": float (0.0-1.0),
-    "reasoning": "string"
-  }},
-  ...
-]
-"""
-        return prompt
+        if not self.prefix_cache:
+            parts.append(f"""
+Return format (JSON array with {count} objects):
+""")
+            parts.append(self._multi_file_format)
+        return "".join(parts)
 
     def _parse_multi_file_response(
         self,
-        response_text: str,
+        response_text: Optional[str],
         file_infos: List[FileInfo]
     ) -> List[Optional[Classification]]:
         """
         Parse LLM response for multi-file classification.
 
         Args:
-            response_text: Raw response text from LLM
+            response_text: Raw response text from LLM, possibly None
             file_infos: List of file information objects
 
         Returns:
             List of classification objects or None values
         """
+        if not response_text:
+            logger.error("Multi-file response has no content")
+            return [None] * len(file_infos)
+
+        text = _strip_code_fence(response_text)
+
+        if HAS_MSGSPEC:
+            try:
+                decoded = _MULTI_FILE_DECODER.decode(text)
+            except msgspec.DecodeError:
+                # Malformed or partially invalid - the generic path below
+                # salvages whichever items are still valid
+                pass
+            else:
+                if isinstance(decoded, MultiFileMsg):
+                    decoded = decoded.classifications
+                results: List[Optional[Classification]] = [
+                    _classification_from_msg(msg) for msg in decoded[:len(file_infos)]
+                ]
+                results.extend([None] * (len(file_infos) - len(results)))
+                return results
+
         try:
-            # Remove markdown code blocks if present
-            text = response_text.strip()
-            if text.startswith("```json"):
-                text = text[7:]
-            if text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
+            data = _json_loads(text)
 
-            data = json.loads(text.strip())
+            # Structured outputs wrap the array in an object
+            if isinstance(data, dict) and isinstance(data.get('classifications'), list):
+                data = data['classifications']
 
             # Validate it's an array
             if not isinstance(data, list):
                 logger.error("Multi-file response is not an array")
                 return [None] * len(file_infos)
 
-            # Parse each classification
+            # Parse each classification; extra items are never used
+            validate = JSONResponseValidator.validate_classification_response
             results = []
-            for item in data:
+            for item in data[:len(file_infos)]:
                 try:
-                    JSONResponseValidator.validate_classification_response(item)
+                    validate(item)
                     results.append(Classification.from_dict(item))
                 except Exception as e:
                     logger.error(f"Failed to parse classification item: {e}")
@@ -572,6 +1811,32 @@ Return format (JSON array with {len(file_infos)} objects):
             logger.error(f"Failed to parse multi-file classification: {e}")
             return [None] * len(file_infos)
 
+    def _content_for_prompt(self, file_info: FileInfo, budget: Tuple[int, int, int, int]) -> str:
+        """
+        Fit a file's content preview into a prompt budget.
+
+        Args:
+            file_info: File information object
+            budget: (head, tail, signature lines, max tokens)
+
+        Returns:
+            Content text to embed in the prompt
+        """
+        head, tail, signature_lines, max_tokens = budget
+        if not self.content_compression:
+            text = file_info.content_preview[:head + tail]
+        else:
+            text = compress_content(file_info.content_preview, head, tail, signature_lines)
+
+        encoder = self.llm_client.encoder
+        if encoder is None:
+            return text
+
+        tokens = encoder.encode_ordinary(text)
+        if len(tokens) <= max_tokens:
+            return text
+        return encoder.decode(tokens[:max_tokens])
+
     def _build_content_prompt(self, file_info: FileInfo) -> str:
         """
         Build a prompt for content-based classification.
@@ -591,33 +1856,39 @@ Created: {file_info.created_date}
 Modified: {file_info.modified_date}"""
 
         if file_info.content_preview:
-            prompt += f"\n\nContent Preview:\n{file_info.content_preview[:500]}"
+            preview = self._content_for_prompt(file_info, self.SINGLE_FILE_CONTENT)
+            prompt += f"\n\nContent Preview:\n{preview}"
 
         prompt += "\n\nSuggest an appropriate directory structure for this file."
 
         return prompt
 
-    def _parse_response(self, response_text: str) -> Optional[Classification]:
+    def _parse_response(self, response_text: Optional[str]) -> Optional[Classification]:
         """
         Parse LLM response and extract classification.
 
         Args:
-            response_text: Raw response text from LLM
+            response_text: Raw response text from LLM, possibly None
 
         Returns:
             Classification object or None if parsing failed
         """
-        try:
-            # Remove markdown code blocks if present
-            text = response_text.strip()
-            if text.startswith("```json"):
-                text = text[7:]
-            if text.startswith("```"):
-                text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
+        if not response_text:
+            logger.error("Failed to parse classification: response has no content")
+            return None
 
-            data = json.loads(text.strip())
+        text = _strip_code_fence(response_text)
+
+        if HAS_MSGSPEC:
+            try:
+                return _classification_from_msg(_CLASSIFICATION_DECODER.decode(text))
+            except msgspec.DecodeError as e:
+                logger.error(f"Failed to parse classification: {e}")
+                logger.debug(f"Response text: {response_text[:500]}")
+                return None
+
+        try:
+            data = _json_loads(text)
 
             # Validate response
             JSONResponseValidator.validate_classification_response(data)
@@ -633,3 +1904,8 @@ Modified: {file_info.modified_date}"""
         except Exception as e:
             logger.error(f"Failed to parse classification: {e}")
             return None
+
+
+# Format the system prompt for every built-in language at import time
+for _language in AIClassifier.LANGUAGE_EXAMPLES:
+    AIClassifier.get_system_prompt(_language, "english")
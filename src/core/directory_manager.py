@@ -1,8 +1,10 @@
 """Directory creation and management module."""
 
+import functools
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from ..models.classification import Classification
 from ..models.file_info import FileInfo
@@ -11,11 +13,53 @@ from ..utils.validators import FilenameValidator
 
 logger = get_logger()
 
+# Splits words for PascalCase/camelCase, compiled once
+_WORD_SEPARATORS = re.compile(r'[\s\-_]+')
+
+_ASCII_LOWER = frozenset('abcdefghijklmnopqrstuvwxyz')
+_ASCII_UPPER = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+
+def _join_words(text: str, separator: str) -> str:
+    """
+    Lowercase text and join its words with a separator in a single pass.
+
+    Spaces, hyphens and underscores end a word, as does a lowercase ASCII
+    letter followed by an uppercase one (camelCase boundary). Runs of
+    separators collapse and leading/trailing separators are dropped.
+
+    Args:
+        text: Input text
+        separator: String placed between words
+
+    Returns:
+        Lowercased text with words joined by ``separator``
+    """
+    parts = []
+    pending = False
+    prev_lower = False
+
+    for char in text:
+        if char in '-_' or char.isspace():
+            pending = True
+            prev_lower = False
+            continue
+
+        if parts and (pending or (prev_lower and char in _ASCII_UPPER)):
+            parts.append(separator)
+        pending = False
+        prev_lower = char in _ASCII_LOWER
+        parts.append(char)
+
+    # Lowercase once so context-dependent mappings (final sigma) match str.lower
+    return ''.join(parts).lower()
+
 
 class NamingConvention:
     """Handles different naming conventions for directories."""
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def to_snake_case(text: str) -> str:
         """
         Convert text to snake_case.
@@ -26,19 +70,10 @@ class NamingConvention:
         Returns:
             snake_case formatted text
         """
-        # Replace spaces and hyphens with underscores
-        text = re.sub(r'[\s\-]+', '_', text)
-        # Insert underscore before capital letters
-        text = re.sub(r'([a-z])([A-Z])', r'\1_\2', text)
-        # Convert to lowercase
-        text = text.lower()
-        # Remove consecutive underscores
-        text = re.sub(r'_+', '_', text)
-        # Remove leading/trailing underscores
-        text = text.strip('_')
-        return text
+        return _join_words(text, '_')
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def to_kebab_case(text: str) -> str:
         """
         Convert text to kebab-case.
@@ -49,15 +84,10 @@ class NamingConvention:
         Returns:
             kebab-case formatted text
         """
-        # Similar to snake_case but use hyphens
-        text = re.sub(r'[\s_]+', '-', text)
-        text = re.sub(r'([a-z])([A-Z])', r'\1-\2', text)
-        text = text.lower()
-        text = re.sub(r'-+', '-', text)
-        text = text.strip('-')
-        return text
+        return _join_words(text, '-')
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def to_pascal_case(text: str) -> str:
         """
         Convert text to PascalCase.
@@ -69,12 +99,13 @@ class NamingConvention:
             PascalCase formatted text
         """
         # Split on spaces, hyphens, underscores
-        words = re.split(r'[\s\-_]+', text)
+        words = _WORD_SEPARATORS.split(text)
         # Capitalize first letter of each word
         words = [word.capitalize() for word in words if word]
         return ''.join(words)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def to_camel_case(text: str) -> str:
         """
         Convert text to camelCase.
@@ -92,6 +123,7 @@ class NamingConvention:
         return pascal
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def apply_convention(text: str, convention: str) -> str:
         """
         Apply specified naming convention.
@@ -117,6 +149,78 @@ class NamingConvention:
             logger.warning(f"Unknown naming convention: {convention}, using snake_case")
             return NamingConvention.to_snake_case(text)
 
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop memoized conversions (for long-running processes)."""
+        for converter in (
+            NamingConvention.to_snake_case,
+            NamingConvention.to_kebab_case,
+            NamingConvention.to_pascal_case,
+            NamingConvention.to_camel_case,
+            NamingConvention.apply_convention,
+        ):
+            converter.cache_clear()
+        _process_component.cache_clear()
+
+
+def _sanitize_component(name: str, max_length: int) -> str:
+    """
+    Sanitize a directory name and cap its length.
+
+    Args:
+        name: Directory name
+        max_length: Maximum name length
+
+    Returns:
+        Sanitized name
+    """
+    # Use filename validator
+    sanitized = FilenameValidator.sanitize_filename(name)
+
+    # Limit length
+    if len(sanitized) > max_length:
+        sanitized = sanitized[:max_length]
+
+    # Remove trailing dots/spaces
+    sanitized = sanitized.rstrip('. ')
+
+    return sanitized or 'unnamed'
+
+
+@functools.lru_cache(maxsize=4096)
+def _process_component(
+    component: str,
+    convention: str,
+    sanitize: bool,
+    max_length: int
+) -> str:
+    """
+    Turn one classification path component into a directory name.
+
+    Category names repeat across files, so results are memoized.
+
+    Args:
+        component: Path component (e.g., "Documents")
+        convention: Naming convention to apply
+        sanitize: Whether to sanitize the name first
+        max_length: Maximum name length when sanitizing
+
+    Returns:
+        Directory name
+    """
+    # Sanitize if enabled
+    if sanitize:
+        component = _sanitize_component(component, max_length)
+
+    # Apply naming convention
+    component = NamingConvention.apply_convention(component, convention)
+
+    # Ensure it's a valid directory name
+    if not component or component in ('.', '..'):
+        component = 'unnamed'
+
+    return component
+
 
 class DirectoryManager:
     """Manages directory creation and naming."""
@@ -145,17 +249,19 @@ class DirectoryManager:
         self.max_name_length = max_name_length
         self.conflict_resolution = conflict_resolution
         self.created_directories: set = set()
+        # Classification path -> generated directory, reused for every file
+        self._path_cache: Dict[str, Path] = {}
 
     def create_structure(
         self,
-        classification_map: Dict[FileInfo, Classification],
+        classifications: Iterable[Optional[Classification]],
         dry_run: bool = False
     ) -> Dict[str, Path]:
         """
-        Create directory structure from classification map.
+        Create directory structure from classification results.
 
         Args:
-            classification_map: Mapping of files to classifications
+            classifications: Classification results (None entries are skipped)
             dry_run: If True, don't actually create directories
 
         Returns:
@@ -165,7 +271,7 @@ class DirectoryManager:
 
         # Collect unique directory paths
         unique_paths = set()
-        for classification in classification_map.values():
+        for classification in classifications:
             if classification:
                 unique_paths.add(classification.directory_path)
 
@@ -190,33 +296,30 @@ class DirectoryManager:
         Returns:
             Actual Path object
         """
+        cached = self._path_cache.get(classification_path)
+        if cached is not None:
+            return cached
+
         # Split into components
         components = classification_path.split('/')
 
         # Process each component
-        processed = []
-        for component in components:
-            # Sanitize if enabled
-            if self.sanitize_names:
-                component = self.sanitize_name(component)
-
-            # Apply naming convention
-            component = NamingConvention.apply_convention(
+        processed = [
+            _process_component(
                 component,
-                self.naming_convention
+                self.naming_convention,
+                self.sanitize_names,
+                self.max_name_length
             )
-
-            # Ensure it's a valid directory name
-            if not component or component in ('.', '..'):
-                component = 'unnamed'
-
-            processed.append(component)
+            for component in components
+        ]
 
         # Build full path
         full_path = self.base_path
         for component in processed:
             full_path = full_path / component
 
+        self._path_cache[classification_path] = full_path
         return full_path
 
     def sanitize_name(self, name: str) -> str:
@@ -229,17 +332,7 @@ class DirectoryManager:
         Returns:
             Sanitized name
         """
-        # Use filename validator
-        sanitized = FilenameValidator.sanitize_filename(name)
-
-        # Limit length
-        if len(sanitized) > self.max_name_length:
-            sanitized = sanitized[:self.max_name_length]
-
-        # Remove trailing dots/spaces
-        sanitized = sanitized.rstrip('. ')
-
-        return sanitized or 'unnamed'
+        return _sanitize_component(name, self.max_name_length)
 
     def resolve_conflict(self, path: Path) -> Path:
         """
@@ -260,17 +353,7 @@ class DirectoryManager:
         parent = path.parent
         name = path.name
 
-        if self.conflict_resolution == 'append_counter':
-            counter = 2
-            while True:
-                new_name = f"{name}_{counter}"
-                new_path = parent / new_name
-                if not new_path.exists():
-                    logger.debug(f"Resolved conflict: {name} -> {new_name}")
-                    return new_path
-                counter += 1
-
-        elif self.conflict_resolution == 'append_timestamp':
+        if self.conflict_resolution == 'append_timestamp':
             from datetime import datetime
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             new_name = f"{name}_{timestamp}"
@@ -286,9 +369,14 @@ class DirectoryManager:
             logger.debug(f"Resolved conflict: {name} -> {new_name}")
             return new_path
 
-        else:
-            # Default to counter
-            return self.resolve_conflict(path)
+        # append_counter (the default): one listing instead of a stat per candidate
+        existing = set(os.listdir(parent))
+        counter = 2
+        while f"{name}_{counter}" in existing:
+            counter += 1
+        new_name = f"{name}_{counter}"
+        logger.debug(f"Resolved conflict: {name} -> {new_name}")
+        return parent / new_name
 
     def _create_directory(self, path: Path) -> None:
         """
@@ -321,8 +409,22 @@ class DirectoryManager:
         Returns:
             Full destination path including filename
         """
-        dir_path = self.generate_path(classification.directory_path)
-        return dir_path / file_info.name
+        return self.get_base_dir(classification) / file_info.name
+
+    def get_base_dir(self, classification: Classification) -> Path:
+        """
+        Get the destination directory for a classification.
+
+        Files sharing a classification share this directory; it is computed
+        once per classification path and reused.
+
+        Args:
+            classification: Classification result
+
+        Returns:
+            Directory path files with this classification are moved into
+        """
+        return self.generate_path(classification.directory_path)
 
 
 def create_directory_manager_from_config(
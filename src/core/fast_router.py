@@ -0,0 +1,196 @@
+"""Extension-based routing that bypasses the LLM for obviously-typed files."""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..models.classification import Classification
+from ..models.file_info import FileInfo
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# Category (English name) -> extensions that unambiguously belong to it
+DEFAULT_ROUTES: Dict[str, Tuple[str, ...]] = {
+    "Music": ('.mp3', '.wav', '.flac', '.ogg', '.aac', '.m4a', '.wma', '.opus'),
+    "Videos": ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.webm', '.flv', '.m4v'),
+    "Images": ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.heic', '.tif', '.tiff', '.ico'),
+    "Archives": ('.zip', '.rar', '.7z', '.tar', '.gz', '.bz2', '.xz', '.tgz',
+                 '.tar.gz', '.tar.bz2', '.tar.xz'),
+    "Executables": ('.exe', '.msi', '.dmg', '.deb', '.rpm', '.apk', '.appimage'),
+}
+
+# Language -> localized name of each routed category. Routed files must land
+# in directories named in the same language the LLM uses for everything else,
+# so categories (or whole languages) missing here are left to the LLM.
+CATEGORY_NAMES: Dict[str, Dict[str, str]] = {
+    "english": {
+        "Music": "Music",
+        "Videos": "Videos",
+        "Images": "Images",
+        "Archives": "Archives",
+        "Executables": "Executables",
+    },
+    "indonesian": {
+        "Music": "Musik",
+        "Videos": "Video",
+        "Images": "Gambar",
+        "Archives": "Arsip",
+        "Executables": "Aplikasi",
+    },
+    "spanish": {
+        "Music": "Música",
+        "Videos": "Vídeos",
+        "Images": "Imágenes",
+        "Archives": "Archivos Comprimidos",
+        "Executables": "Ejecutables",
+    },
+    "french": {
+        "Music": "Musique",
+        "Videos": "Vidéos",
+        "Images": "Images",
+        "Archives": "Archives",
+        "Executables": "Exécutables",
+    },
+    "german": {
+        "Music": "Musik",
+        "Videos": "Videos",
+        "Images": "Bilder",
+        "Archives": "Archive",
+        "Executables": "Programme",
+    },
+    "japanese": {
+        "Music": "音楽",
+        "Videos": "動画",
+        "Images": "画像",
+        "Archives": "アーカイブ",
+        "Executables": "実行ファイル",
+    },
+    "chinese": {
+        "Music": "音乐",
+        "Videos": "视频",
+        "Images": "图片",
+        "Archives": "压缩文件",
+        "Executables": "可执行文件",
+    },
+}
+
+
+class FastRouter:
+    """Classifies files by extension alone when the answer is a foregone conclusion."""
+
+    def __init__(
+        self,
+        language: str = "english",
+        routes: Optional[Dict[str, Iterable[str]]] = None
+    ):
+        """
+        Initialize the router.
+
+        Categories without a name in ``language`` are not routed, so their
+        files go to the LLM instead of into an English directory.
+
+        Args:
+            language: Language for category names
+            routes: Category -> extensions mapping (defaults to DEFAULT_ROUTES)
+        """
+        routes = routes if routes is not None else DEFAULT_ROUTES
+        language = language.lower()
+        names = CATEGORY_NAMES.get(language, {})
+
+        # Flatten to suffix -> localized category for O(1) lookups
+        self.suffix_map: Dict[str, str] = {}
+        for category, extensions in routes.items():
+            # English names are the category names themselves
+            localized = names.get(category) or (category if language == "english" else None)
+            if localized is None:
+                logger.debug(f"No {language} name for {category}, leaving it to the LLM")
+                continue
+            for extension in extensions:
+                self.suffix_map[extension.lower()] = localized
+
+        self.max_suffix_parts = max(
+            (suffix.count('.') for suffix in self.suffix_map),
+            default=1
+        )
+
+    def match_suffix(self, name: str) -> Optional[str]:
+        """
+        Find the localized category for the longest known suffix of a filename.
+
+        Args:
+            name: File name
+
+        Returns:
+            Localized category name or None if not routable
+        """
+        parts = name.lower().split('.')
+        # parts[0] is the stem; try compound suffixes first (".tar.gz" before ".gz")
+        for count in range(min(self.max_suffix_parts, len(parts) - 1), 0, -1):
+            category = self.suffix_map.get('.' + '.'.join(parts[-count:]))
+            if category:
+                return category
+        return None
+
+    def route(self, file_info: FileInfo) -> Tuple[bool, Optional[Classification]]:
+        """
+        Try to classify a file by extension.
+
+        Args:
+            file_info: File information object
+
+        Returns:
+            Tuple of (hit, classification) - classification is None on miss
+        """
+        category = self.match_suffix(file_info.name)
+        if category is None:
+            return False, None
+
+        return True, Classification(
+            path=[category],
+            confidence=1.0,
+            reasoning="Routed by file extension",
+            strategy="extension_router"
+        )
+
+    def route_files(self, files: List[FileInfo]) -> List[Optional[Classification]]:
+        """
+        Classify every file that can be routed by extension.
+
+        Args:
+            files: List of file information objects
+
+        Returns:
+            Classifications aligned with ``files`` - None where the LLM is needed
+        """
+        routed: List[Optional[Classification]] = [self.route(file_info)[1] for file_info in files]
+
+        hits = len(routed) - routed.count(None)
+        if hits:
+            logger.info(f"Routed {hits} files by extension without LLM calls")
+
+        return routed
+
+
+def create_fast_router_from_config(config: dict) -> Optional[FastRouter]:
+    """
+    Create a FastRouter from configuration.
+
+    Args:
+        config: Full application configuration
+
+    Returns:
+        FastRouter instance, or None if routing is disabled or no category
+        has a name in the configured language
+    """
+    routing_config = config['classification'].get('fast_routing', {})
+    if not routing_config.get('enabled', False):
+        return None
+
+    language = config.get('language', {}).get('primary', 'english')
+    router = FastRouter(
+        language=language,
+        routes=routing_config.get('routes')
+    )
+    if not router.suffix_map:
+        logger.info(f"Extension routing has no {language} category names, using the LLM for all files")
+        return None
+    return router
@@ -1,9 +1,15 @@
 """File moving and copying operations."""
 
+import errno
+import os
 import shutil
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, Iterable, List, Optional, Set, Tuple
 
 from ..models.file_info import FileInfo
 from ..models.classification import Classification
@@ -12,6 +18,43 @@ from ..utils.exceptions import FileOperationError
 
 logger = get_logger()
 
+# Bytes requested per os.copy_file_range call; the kernel copies as much as
+# it can per call, so a large request keeps syscalls to one or two per file
+COPY_CHUNK_SIZE = 1 << 30
+
+# Filesystems on these platforms are case-insensitive by default, so names
+# are compared casefolded to never pick a name that would clobber a file
+CASE_INSENSITIVE_NAMES = sys.platform in ('win32', 'darwin')
+
+
+def _name_key(name: str) -> str:
+    """
+    Key used to compare file names within one directory.
+
+    Args:
+        name: File name
+
+    Returns:
+        The name, casefolded on case-insensitive platforms
+    """
+    return name.casefold() if CASE_INSENSITIVE_NAMES else name
+
+
+def _list_names(directory: Path) -> Set[str]:
+    """
+    Snapshot the names in a directory with a single listdir call.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Name keys (see _name_key) of its entries; empty if it does not exist
+    """
+    try:
+        return {_name_key(name) for name in os.listdir(directory)}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
 
 class DuplicateHandler:
     """Handles filename conflicts and duplicates."""
@@ -20,7 +63,8 @@ class DuplicateHandler:
     def resolve_duplicate(
         destination: Path,
         strategy: str = "rename",
-        rename_pattern: str = "{name}_{counter}{ext}"
+        rename_pattern: str = "{name}_{counter}{ext}",
+        taken: Optional[Set[str]] = None
     ) -> Path:
         """
         Resolve duplicate filename.
@@ -29,11 +73,14 @@ class DuplicateHandler:
             destination: Original destination path
             strategy: Resolution strategy (skip, rename, overwrite)
             rename_pattern: Pattern for renaming
+            taken: Names already used in the destination directory (a
+                _list_names snapshot plus destinations claimed by pending
+                operations); when given, the disk is not probed
 
         Returns:
             Resolved destination path
         """
-        if not destination.exists():
+        if not DuplicateHandler._is_taken(destination, taken):
             return destination
 
         if strategy == 'skip':
@@ -47,27 +94,52 @@ class DuplicateHandler:
         elif strategy == 'rename':
             return DuplicateHandler._generate_unique_name(
                 destination,
-                rename_pattern
+                rename_pattern,
+                taken
             )
 
         else:
             # Default to rename
             return DuplicateHandler._generate_unique_name(
                 destination,
-                rename_pattern
+                rename_pattern,
+                taken
             )
 
+    @staticmethod
+    def _is_taken(path: Path, taken: Optional[Set[str]]) -> bool:
+        """
+        Check whether a destination is already used.
+
+        Args:
+            path: Candidate destination path
+            taken: Names used in its directory, or None to stat the disk
+
+        Returns:
+            True if the path must not be used
+        """
+        if taken is None:
+            return path.exists()
+        return _name_key(path.name) in taken
+
     @staticmethod
     def _generate_unique_name(
         destination: Path,
-        pattern: str = "{name}_{counter}{ext}"
+        pattern: str = "{name}_{counter}{ext}",
+        taken: Optional[Set[str]] = None
     ) -> Path:
         """
         Generate a unique filename.
 
+        With ``taken`` the counter advances against the in-memory names, so
+        a directory that already holds N copies costs no stat calls instead
+        of N.
+
         Args:
             destination: Original destination path
             pattern: Naming pattern
+            taken: Names used in the destination directory, or None to stat
+                each candidate
 
         Returns:
             Unique path
@@ -85,7 +157,7 @@ class DuplicateHandler:
             )
             new_path = parent / new_name
 
-            if not new_path.exists():
+            if not DuplicateHandler._is_taken(new_path, taken):
                 logger.debug(f"Renamed to avoid conflict: {destination.name} -> {new_name}")
                 return new_path
 
@@ -97,7 +169,9 @@ class OperationLog:
 
     def __init__(self):
         """Initialize operation log."""
-        self.operations: List[Dict] = []
+        # (type, source, destination, time.time_ns()) per operation; tuples
+        # keep logging cheap and are expanded only by get_operations
+        self.operations: List[Tuple[str, str, str, int]] = []
 
     def log_operation(
         self,
@@ -113,41 +187,46 @@ class OperationLog:
             source: Source path
             destination: Destination path
         """
-        self.operations.append({
-            'type': operation_type,
-            'source': str(source),
-            'destination': str(destination),
-            'timestamp': datetime.now().isoformat()
-        })
+        self.operations.append(
+            (operation_type, str(source), str(destination), time.time_ns())
+        )
 
     def rollback(self) -> None:
         """Reverse all logged operations."""
         logger.info("Initiating rollback...")
 
         for operation in reversed(self.operations):
+            operation_type, source, destination, _ = operation
             try:
-                if operation['type'] == 'move':
+                # Work on the logged strings directly and let the syscalls
+                # report missing entries instead of checking first
+                if operation_type == 'move':
                     # Move file back
-                    dest_path = Path(operation['destination'])
-                    src_path = Path(operation['source'])
-
-                    if dest_path.exists():
-                        shutil.move(str(dest_path), str(src_path))
-                        logger.info(f"Rolled back: {dest_path} -> {src_path}")
-
-                elif operation['type'] == 'copy':
+                    try:
+                        os.replace(destination, source)
+                    except FileNotFoundError:
+                        continue
+                    except OSError as e:
+                        if e.errno != errno.EXDEV:
+                            raise
+                        shutil.move(destination, source)
+                    logger.info(f"Rolled back: {destination} -> {source}")
+
+                elif operation_type == 'copy':
                     # Delete copy
-                    dest_path = Path(operation['destination'])
-                    if dest_path.exists():
-                        dest_path.unlink()
-                        logger.info(f"Deleted copy: {dest_path}")
-
-                elif operation['type'] == 'create_dir':
-                    # Remove directory if empty
-                    dest_path = Path(operation['destination'])
-                    if dest_path.exists() and not any(dest_path.iterdir()):
-                        dest_path.rmdir()
-                        logger.info(f"Removed directory: {dest_path}")
+                    try:
+                        os.unlink(destination)
+                    except FileNotFoundError:
+                        continue
+                    logger.info(f"Deleted copy: {destination}")
+
+                elif operation_type == 'create_dir':
+                    # Remove directory if empty; rmdir refuses non-empty ones
+                    try:
+                        os.rmdir(destination)
+                    except OSError:
+                        continue
+                    logger.info(f"Removed directory: {destination}")
 
             except Exception as e:
                 logger.error(f"Rollback failed for {operation}: {e}")
@@ -155,8 +234,16 @@ class OperationLog:
         logger.info("Rollback complete")
 
     def get_operations(self) -> List[Dict]:
-        """Get list of all operations."""
-        return self.operations.copy()
+        """Get list of all operations, with ISO-formatted timestamps."""
+        return [
+            {
+                'type': operation_type,
+                'source': source,
+                'destination': destination,
+                'timestamp': datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+            }
+            for operation_type, source, destination, timestamp_ns in self.operations
+        ]
 
 
 class FileMover:
@@ -168,7 +255,8 @@ class FileMover:
         preserve_metadata: bool = True,
         verify_after_move: bool = True,
         duplicate_handling: str = "rename",
-        rename_pattern: str = "{name}_{counter}{ext}"
+        rename_pattern: str = "{name}_{counter}{ext}",
+        max_workers: int = 4
     ):
         """
         Initialize file mover.
@@ -176,16 +264,23 @@ class FileMover:
         Args:
             mode: Operation mode (move or copy)
             preserve_metadata: Whether to preserve file metadata
-            verify_after_move: Whether to verify file after operation
+            verify_after_move: Whether to check that copied data has the
+                source's size (renames need no check)
             duplicate_handling: How to handle duplicates
             rename_pattern: Pattern for renaming duplicates
+            max_workers: Threads performing file operations in move_stream
         """
         self.mode = mode
         self.preserve_metadata = preserve_metadata
         self.verify_after_move = verify_after_move
         self.duplicate_handling = duplicate_handling
         self.rename_pattern = rename_pattern
+        self.max_workers = max(1, max_workers)
         self.operation_log = OperationLog()
+        # (source dir, destination dir) pairs known to span filesystems
+        self._cross_device: Set[Tuple[Path, Path]] = set()
+        # Destination directories already created, so each is made only once
+        self._ensured_parents: Set[Path] = set()
 
     def move_file(
         self,
@@ -204,10 +299,6 @@ class FileMover:
         Returns:
             Tuple of (success, actual_destination_path)
         """
-        if not source.exists():
-            logger.error(f"Source file does not exist: {source}")
-            return False, None
-
         # Resolve duplicates
         actual_destination = DuplicateHandler.resolve_duplicate(
             destination,
@@ -215,43 +306,177 @@ class FileMover:
             self.rename_pattern
         )
 
+        return self._perform(source, actual_destination, dry_run)
+
+    def _perform(
+        self,
+        source: Path,
+        actual_destination: Path,
+        dry_run: bool = False
+    ) -> Tuple[bool, Optional[Path]]:
+        """
+        Move or copy a file to an already resolved destination.
+
+        A missing source is reported as (False, None). Outside dry runs it
+        is detected from the failed rename/copy rather than a stat up front,
+        so the check costs nothing for files that are present.
+
+        Args:
+            source: Source file path
+            actual_destination: Destination after duplicate resolution
+            dry_run: If True, don't actually move files
+
+        Returns:
+            Tuple of (success, actual_destination_path)
+
+        Raises:
+            FileOperationError: If the operation fails
+        """
         if dry_run:
+            if not source.exists():
+                logger.error(f"Source file does not exist: {source}")
+                return False, None
             logger.info(
                 f"[DRY RUN] Would {self.mode} {source.name} -> {actual_destination}"
             )
             return True, actual_destination
 
         try:
-            # Ensure destination directory exists
-            actual_destination.parent.mkdir(parents=True, exist_ok=True)
+            # Ensure destination directory exists (once per directory)
+            parent = actual_destination.parent
+            if parent not in self._ensured_parents:
+                parent.mkdir(parents=True, exist_ok=True)
+                self._ensured_parents.add(parent)
 
             # Perform operation
             if self.mode == 'move':
-                shutil.move(str(source), str(actual_destination))
+                self._move(source, actual_destination)
                 logger.info(f"Moved: {source.name} -> {actual_destination}")
                 self.operation_log.log_operation('move', source, actual_destination)
 
             elif self.mode == 'copy':
-                shutil.copy2(str(source), str(actual_destination))
+                self._copy(source, actual_destination)
                 logger.info(f"Copied: {source.name} -> {actual_destination}")
                 self.operation_log.log_operation('copy', source, actual_destination)
 
             else:
                 raise FileOperationError(f"Invalid mode: {self.mode}")
 
-            # Verify operation
-            if self.verify_after_move:
-                if not actual_destination.exists():
-                    raise FileOperationError(
-                        f"Verification failed: {actual_destination} does not exist"
-                    )
-
             return True, actual_destination
 
+        except FileNotFoundError as e:
+            if not source.exists():
+                logger.error(f"Source file does not exist: {source}")
+                return False, None
+            logger.error(f"Failed to {self.mode} {source.name}: {e}")
+            raise FileOperationError(f"File operation failed: {e}")
+
         except Exception as e:
             logger.error(f"Failed to {self.mode} {source.name}: {e}")
             raise FileOperationError(f"File operation failed: {e}")
 
+    def _move(self, source: Path, destination: Path) -> None:
+        """
+        Move a file, renaming in place when source and destination share a filesystem.
+
+        Args:
+            source: Source file path
+            destination: Destination file path
+
+        Raises:
+            OSError: If the file cannot be moved
+            FileOperationError: If verification finds a short copy
+        """
+        # Once a rename between two directories fails with EXDEV, later files
+        # between them go straight to the copy instead of repeating the probe
+        directories = (source.parent, destination.parent)
+        if directories not in self._cross_device:
+            try:
+                # Same filesystem: a single metadata update, no data is copied
+                os.replace(source, destination)
+                return
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                self._cross_device.add(directories)
+
+        # Different filesystems: copy the data in the kernel, then drop the source
+        try:
+            self._copy(source, destination)
+        except (OSError, FileOperationError):
+            # Don't leave a partial copy behind; the source is untouched
+            destination.unlink(missing_ok=True)
+            raise
+        os.unlink(source)
+
+    def _copy(self, source: Path, destination: Path) -> None:
+        """
+        Copy file data (and metadata if configured).
+
+        Uses os.copy_file_range where available so the data never passes
+        through user space (and may be reflinked by the filesystem),
+        falling back to shutil.copyfile, which itself uses sendfile on Linux.
+
+        Args:
+            source: Source file path
+            destination: Destination file path
+
+        Raises:
+            OSError: If the file cannot be copied
+            FileOperationError: If verification finds a short copy
+        """
+        if not self._copy_file_range(source, destination):
+            shutil.copyfile(source, destination)
+
+        # A successful rename/copy already guarantees the destination exists;
+        # the only thing left to check is that all of the data arrived
+        if self.verify_after_move:
+            expected = os.stat(source).st_size
+            actual = os.stat(destination).st_size
+            if actual != expected:
+                raise FileOperationError(
+                    f"Verification failed: {destination} has {actual} of {expected} bytes"
+                )
+
+        if self.preserve_metadata:
+            shutil.copystat(source, destination)
+
+    @staticmethod
+    def _copy_file_range(source: Path, destination: Path) -> bool:
+        """
+        Copy file data with os.copy_file_range.
+
+        Args:
+            source: Source file path
+            destination: Destination file path
+
+        Returns:
+            True if the data was copied, False if the platform or filesystem
+            does not support copy_file_range
+        """
+        if not hasattr(os, 'copy_file_range'):
+            return False
+
+        with open(source, 'rb') as fsrc, open(destination, 'wb') as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(
+                        fsrc.fileno(),
+                        fdst.fileno(),
+                        min(remaining, COPY_CHUNK_SIZE)
+                    )
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            except OSError as e:
+                if e.errno in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF):
+                    return False
+                raise
+
+        # Short copy (e.g. file shrank or pseudo-file): let shutil redo it
+        return remaining == 0
+
     def move_batch(
         self,
         operations: List[Tuple[Path, Path]],
@@ -264,19 +489,45 @@ class FileMover:
             operations: List of (source, destination) tuples
             dry_run: If True, don't actually move files
 
+        Returns:
+            Statistics dictionary
+        """
+        return self.move_stream(operations, dry_run)
+
+    def move_stream(
+        self,
+        operations: Iterable[Tuple[Path, Path]],
+        dry_run: bool = False
+    ) -> Dict[str, int]:
+        """
+        Execute file operations as they are produced.
+
+        Destinations are resolved in the calling thread, in input order,
+        against a one-time listing of each destination directory plus the
+        destinations already handed out, so duplicate handling behaves as in
+        a serial run without a stat per candidate name. The moves themselves
+        run on a thread pool with a bounded number of operations in flight,
+        so disk I/O starts with the first operation and overlaps planning.
+        Missing sources are detected by the workers, keeping the planning
+        thread free of per-file syscalls.
+
+        Args:
+            operations: Iterable of (source, destination) tuples
+            dry_run: If True, don't actually move files
+
         Returns:
             Statistics dictionary
         """
         stats = {
-            'total': len(operations),
+            'total': 0,
             'success': 0,
             'failed': 0,
             'skipped': 0
         }
 
-        for source, destination in operations:
+        def record(future: 'Future[Tuple[bool, Optional[Path]]]') -> None:
             try:
-                success, _ = self.move_file(source, destination, dry_run)
+                success, _ = future.result()
                 if success:
                     stats['success'] += 1
                 else:
@@ -290,6 +541,50 @@ class FileMover:
                 logger.error(f"Unexpected error: {e}")
                 stats['failed'] += 1
 
+        # Destination directory -> names on disk plus names handed out so far
+        taken_names: Dict[Path, Set[str]] = {}
+        # Latest operation per destination; skip/overwrite can send several
+        # files to one path, and those must land in input order
+        reuses_destinations = self.duplicate_handling in ('skip', 'overwrite')
+        by_destination: Dict[Path, Future] = {}
+        pending: Deque[Future] = deque()
+        max_pending = self.max_workers * 4
+
+        # Dry runs do no I/O, so there is nothing to overlap
+        workers = 1 if dry_run else self.max_workers
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mover") as executor:
+            for source, destination in operations:
+                stats['total'] += 1
+
+                taken = taken_names.get(destination.parent)
+                if taken is None:
+                    taken = taken_names[destination.parent] = _list_names(destination.parent)
+
+                actual_destination = DuplicateHandler.resolve_duplicate(
+                    destination,
+                    self.duplicate_handling,
+                    self.rename_pattern,
+                    taken
+                )
+                taken.add(_name_key(actual_destination.name))
+
+                if reuses_destinations:
+                    previous = by_destination.get(actual_destination)
+                    if previous is not None:
+                        wait([previous])
+
+                future = executor.submit(self._perform, source, actual_destination, dry_run)
+                if reuses_destinations:
+                    by_destination[actual_destination] = future
+                pending.append(future)
+
+                # Bound the work queued ahead of the disk
+                while len(pending) > max_pending:
+                    record(pending.popleft())
+
+            while pending:
+                record(pending.popleft())
+
         logger.info(
             f"Batch operation complete: "
             f"{stats['success']} succeeded, "
@@ -302,6 +597,8 @@ class FileMover:
     def rollback(self) -> None:
         """Rollback all operations."""
         self.operation_log.rollback()
+        # Rollback may remove directories we created
+        self._ensured_parents.clear()
 
     def get_operation_log(self) -> List[Dict]:
         """
@@ -328,5 +625,6 @@ def create_file_mover_from_config(config: dict) -> FileMover:
         preserve_metadata=config.get('preserve_metadata', True),
         verify_after_move=config.get('verify_after_move', True),
         duplicate_handling=config.get('duplicate_handling', 'rename'),
-        rename_pattern=config.get('rename_pattern', '{name}_{counter}{ext}')
+        rename_pattern=config.get('rename_pattern', '{name}_{counter}{ext}'),
+        max_workers=config.get('max_workers', 4)
     )
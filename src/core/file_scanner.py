@@ -1,11 +1,12 @@
 """File discovery and scanning module with parallel I/O optimization."""
 
-import asyncio
 import fnmatch
+import os
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional, Set
-from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from ..models.file_info import FileInfo
 from ..utils.logger import get_logger
@@ -13,6 +14,9 @@ from ..utils.exceptions import ValidationError
 
 logger = get_logger()
 
+# Number of file reads submitted to the worker pool at a time
+READ_BATCH_SIZE = 128
+
 
 class FileFilter:
     """Configuration for file filtering."""
@@ -89,7 +93,8 @@ class FileScanner:
         ignore_hidden: bool = True,
         ignore_patterns: Optional[List[str]] = None,
         max_depth: Optional[int] = None,
-        max_workers: int = 10
+        max_workers: int = 10,
+        scan_threads: int = 8
     ):
         """
         Initialize the file scanner.
@@ -101,6 +106,7 @@ class FileScanner:
             ignore_patterns: List of patterns to ignore (e.g., 'node_modules', '*.tmp')
             max_depth: Maximum directory depth to scan (None = unlimited)
             max_workers: Maximum parallel workers for content reading
+            scan_threads: Parallel workers listing directories during discovery
         """
         self.recursive = recursive
         self.follow_symlinks = follow_symlinks
@@ -108,6 +114,7 @@ class FileScanner:
         self.ignore_patterns = ignore_patterns or []
         self.max_depth = max_depth
         self.max_workers = max_workers
+        self.scan_threads = max(1, scan_threads)
 
     def scan(
         self,
@@ -139,56 +146,129 @@ class FileScanner:
 
         logger.info(f"Scanning directory: {path}")
 
-        # Use optimized parallel scan if reading content
-        if read_content:
-            files = self._scan_optimized(path, file_filter, max_content_length)
-        else:
-            files = []
-            self._scan_directory(
-                path,
-                files,
-                file_filter,
-                read_content,
-                max_content_length,
-                current_depth=0
-            )
+        files = self._scan_optimized(path, file_filter, read_content, max_content_length)
 
         logger.info(f"Found {len(files)} files")
         return files
 
+    def iter_scan(
+        self,
+        path: Path,
+        file_filter: Optional[FileFilter] = None,
+        read_content: bool = False,
+        max_content_length: int = 5000
+    ) -> Iterator[FileInfo]:
+        """
+        Scan directory lazily, yielding files as they are discovered.
+
+        Lets callers start processing (e.g. classification) before the
+        whole tree has been walked.
+
+        Args:
+            path: Directory path to scan
+            file_filter: Optional file filter
+            read_content: Whether to read file content previews
+            max_content_length: Maximum content length to read
+
+        Yields:
+            FileInfo objects matching the filter
+
+        Raises:
+            ValidationError: If path is invalid
+        """
+        if not path.exists():
+            raise ValidationError(f"Path does not exist: {path}")
+
+        if not path.is_dir():
+            raise ValidationError(f"Path is not a directory: {path}")
+
+        logger.info(f"Scanning directory (streaming): {path}")
+
+        count = 0
+        file_infos = self._read_files_batched(
+            self._iter_file_paths(path, current_depth=0),
+            read_content,
+            max_content_length
+        )
+        for file_info in file_infos:
+            if file_filter is None or file_filter.matches(file_info):
+                count += 1
+                yield file_info
+
+        logger.info(f"Found {count} files")
+
     def _scan_optimized(
         self,
         path: Path,
         file_filter: Optional[FileFilter],
+        read_content: bool,
         max_content_length: int
     ) -> List[FileInfo]:
         """
-        Optimized scan with parallel content reading.
+        Optimized scan with parallel directory listing and file reads.
 
         Args:
             path: Directory path to scan
             file_filter: Optional file filter
+            read_content: Whether to read file content previews
             max_content_length: Maximum content length to read
 
         Returns:
             List of FileInfo objects
         """
-        # Phase 1: Discover all file paths (fast, no I/O)
+        # Phase 1: Discover all file paths (directory listings only)
         file_paths = []
         self._discover_files(path, file_paths, current_depth=0)
 
         logger.debug(f"Discovered {len(file_paths)} file paths")
 
-        # Phase 2: Create FileInfo objects in parallel (with content reading)
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            files = loop.run_until_complete(
-                self._process_files_parallel(file_paths, file_filter, max_content_length)
-            )
-            return files
-        finally:
-            loop.close()
+        # Phase 2: Create FileInfo objects in parallel (stat + optional content)
+        return [
+            file_info
+            for file_info in self._read_files_batched(file_paths, read_content, max_content_length)
+            if file_filter is None or file_filter.matches(file_info)
+        ]
+
+    def _read_files_batched(
+        self,
+        file_paths: Iterable[Path],
+        read_content: bool,
+        max_content_length: int
+    ) -> Iterator[FileInfo]:
+        """
+        Build FileInfo objects with stat/content reads fanned out to a thread pool.
+
+        Paths are submitted in batches of READ_BATCH_SIZE so the pool keeps
+        many reads in flight while results are still yielded in order.
+
+        Args:
+            file_paths: Paths of files to process (may be a lazy iterator)
+            read_content: Whether to read file content previews
+            max_content_length: Maximum content length to read
+
+        Yields:
+            FileInfo objects for files that could be read
+        """
+        def load(file_path: Path) -> Optional[FileInfo]:
+            try:
+                return FileInfo.from_path(
+                    file_path,
+                    read_content=read_content,
+                    max_content_length=max_content_length
+                )
+            except Exception as e:
+                logger.warning(f"Failed to process file {file_path}: {e}")
+                return None
+
+        paths = iter(file_paths)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                batch = list(islice(paths, READ_BATCH_SIZE))
+                if not batch:
+                    break
+                for file_info in executor.map(load, batch):
+                    if file_info is not None:
+                        yield file_info
 
     def _discover_files(
         self,
@@ -204,171 +284,117 @@ class FileScanner:
             file_paths: List to append discovered file paths to
             current_depth: Current recursion depth
         """
-        # Check depth limit
-        if self.max_depth is not None and current_depth >= self.max_depth:
-            return
+        file_paths.extend(self._iter_file_paths(directory, current_depth))
 
-        try:
-            for entry in directory.iterdir():
-                # Check if symlink (and whether to follow)
-                if entry.is_symlink() and not self.follow_symlinks:
-                    continue
-
-                # Check if hidden
-                if self.ignore_hidden and entry.name.startswith('.'):
-                    continue
+    def _iter_file_paths(
+        self,
+        directory: Path,
+        current_depth: int
+    ) -> Iterator[Path]:
+        """
+        Lazily discover file paths without reading file contents.
 
-                # Check ignore patterns
-                if self._should_ignore(entry.name):
-                    continue
+        Subdirectory listings are prefetched on a thread pool as soon as their
+        parent is listed, so many readdir calls are in flight at once, while
+        paths are still yielded in depth-first order (same as a serial walk).
 
-                # Collect file paths
-                if entry.is_file():
-                    file_paths.append(entry)
+        Args:
+            directory: Directory to scan
+            current_depth: Depth of ``directory``
 
-                # Recurse into subdirectories
-                elif entry.is_dir() and self.recursive:
-                    if self._should_ignore(entry.name):
-                        continue
-                    self._discover_files(entry, file_paths, current_depth + 1)
+        Yields:
+            Paths of files to process
+        """
+        if self.max_depth is not None and current_depth >= self.max_depth:
+            return
 
-        except PermissionError:
-            logger.warning(f"Permission denied: {directory}")
-        except Exception as e:
-            logger.error(f"Error discovering files in {directory}: {e}")
+        executor = ThreadPoolExecutor(max_workers=self.scan_threads)
+        try:
+            yield from self._walk(
+                executor,
+                executor.submit(self._list_directory, directory),
+                current_depth
+            )
+        finally:
+            # Discard prefetched listings if the consumer stopped early
+            executor.shutdown(wait=True, cancel_futures=True)
 
-    async def _process_files_parallel(
+    def _walk(
         self,
-        file_paths: List[Path],
-        file_filter: Optional[FileFilter],
-        max_content_length: int
-    ) -> List[FileInfo]:
+        executor: ThreadPoolExecutor,
+        listing: 'Future[List[Tuple[Path, bool]]]',
+        current_depth: int
+    ) -> Iterator[Path]:
         """
-        Process files in parallel with async I/O.
+        Yield files from a directory listing, recursing into subdirectories.
 
         Args:
-            file_paths: List of file paths to process
-            file_filter: Optional file filter
-            max_content_length: Maximum content length to read
+            executor: Pool listing directories
+            listing: Pending listing of the directory at current_depth
+            current_depth: Depth of the listed directory
 
-        Returns:
-            List of FileInfo objects
+        Yields:
+            Paths of files to process
         """
-        # Create tasks for parallel processing
-        semaphore = asyncio.Semaphore(self.max_workers)
-
-        async def process_file(file_path: Path) -> Optional[FileInfo]:
-            """Process a single file with semaphore control."""
-            async with semaphore:
-                try:
-                    # Run blocking I/O in thread pool
-                    loop = asyncio.get_event_loop()
-                    file_info = await loop.run_in_executor(
-                        None,
-                        FileInfo.from_path,
-                        file_path,
-                        True,  # read_content
-                        max_content_length
-                    )
-
-                    # Apply filter
-                    if file_filter is None or file_filter.matches(file_info):
-                        return file_info
-
-                except Exception as e:
-                    logger.warning(f"Failed to process file {file_path}: {e}")
-
-                return None
-
-        # Process all files in parallel
-        tasks = [process_file(fp) for fp in file_paths]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        entries = listing.result()
+
+        # Start listing every subdirectory before descending into the first
+        descend = self.recursive and (
+            self.max_depth is None or current_depth + 1 < self.max_depth
+        )
+        pending = {
+            entry: executor.submit(self._list_directory, entry)
+            for entry, is_dir in entries
+            if is_dir and descend
+        }
+
+        for entry, is_dir in entries:
+            if not is_dir:
+                yield entry
+            elif descend:
+                yield from self._walk(executor, pending[entry], current_depth + 1)
+
+    def _list_directory(self, directory: Path) -> List[Tuple[Path, bool]]:
+        """
+        List the files and subdirectories of one directory.
 
-        # Filter out None values and exceptions
-        files = []
-        for result in results:
-            if isinstance(result, FileInfo):
-                files.append(result)
-            elif isinstance(result, Exception):
-                logger.error(f"File processing error: {result}")
+        Uses os.scandir, whose entries carry the file type from readdir, so
+        no extra stat call is needed per entry on most filesystems.
 
-        return files
+        Args:
+            directory: Directory to list
 
-    def _scan_directory(
-        self,
-        directory: Path,
-        files: List[FileInfo],
-        file_filter: Optional[FileFilter],
-        read_content: bool,
-        max_content_length: int,
-        current_depth: int
-    ) -> None:
+        Returns:
+            (path, is_directory) pairs in directory order, after applying
+            symlink, hidden-file and ignore-pattern rules
         """
-        Recursively scan directory (internal method).
+        entries: List[Tuple[Path, bool]] = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    # Check if symlink (and whether to follow)
+                    if not self.follow_symlinks and entry.is_symlink():
+                        continue
 
-        Args:
-            directory: Directory to scan
-            files: List to append discovered files to
-            file_filter: Optional file filter
-            read_content: Whether to read content
-            max_content_length: Maximum content length
-            current_depth: Current recursion depth
-        """
-        # Check depth limit
-        if self.max_depth is not None and current_depth >= self.max_depth:
-            return
+                    # Check if hidden
+                    if self.ignore_hidden and entry.name.startswith('.'):
+                        continue
 
-        try:
-            for entry in directory.iterdir():
-                # Check if symlink (and whether to follow)
-                if entry.is_symlink() and not self.follow_symlinks:
-                    continue
-
-                # Check if hidden
-                if self.ignore_hidden and entry.name.startswith('.'):
-                    continue
-
-                # Check ignore patterns
-                if self._should_ignore(entry.name):
-                    continue
-
-                # Process file
-                if entry.is_file():
-                    try:
-                        file_info = FileInfo.from_path(
-                            entry,
-                            read_content=read_content,
-                            max_content_length=max_content_length
-                        )
-
-                        # Apply filter
-                        if file_filter is None or file_filter.matches(file_info):
-                            files.append(file_info)
-                            logger.debug(f"Added file: {file_info.name}")
-
-                    except Exception as e:
-                        logger.warning(f"Failed to process file {entry}: {e}")
-
-                # Recurse into subdirectories
-                elif entry.is_dir() and self.recursive:
-                    # Check ignore patterns for directories
+                    # Check ignore patterns
                     if self._should_ignore(entry.name):
-                        logger.debug(f"Ignoring directory: {entry.name}")
                         continue
 
-                    self._scan_directory(
-                        entry,
-                        files,
-                        file_filter,
-                        read_content,
-                        max_content_length,
-                        current_depth + 1
-                    )
+                    if entry.is_file():
+                        entries.append((directory / entry.name, False))
+                    elif entry.is_dir():
+                        entries.append((directory / entry.name, True))
 
         except PermissionError:
             logger.warning(f"Permission denied: {directory}")
         except Exception as e:
-            logger.error(f"Error scanning directory {directory}: {e}")
+            logger.error(f"Error discovering files in {directory}: {e}")
+
+        return entries
 
     def _should_ignore(self, name: str) -> bool:
         """
@@ -426,7 +452,8 @@ def create_scanner_from_config(config: dict) -> FileScanner:
         ignore_hidden=config.get('ignore_hidden', True),
         ignore_patterns=config.get('ignore_patterns', []),
         max_depth=config.get('max_depth'),
-        max_workers=max_workers
+        max_workers=max_workers,
+        scan_threads=config.get('scan_threads', 8)
     )
 
 
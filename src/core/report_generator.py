@@ -2,6 +2,7 @@
 
 import csv
 import json
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -28,34 +29,41 @@ class ReportGenerator:
 
     def generate_summary(
         self,
-        classification_map: Dict[FileInfo, Optional[Classification]],
+        files: List[FileInfo],
+        classifications: List[Optional[Classification]],
         operation_stats: Dict[str, int],
-        execution_time: float
+        execution_time: float,
+        classified: Optional[int] = None,
+        categories: Optional[Dict[str, int]] = None
     ) -> Dict[str, Any]:
         """
         Generate summary statistics.
 
         Args:
-            classification_map: Mapping of files to classifications
+            files: List of processed files
+            classifications: Classifications aligned with files
             operation_stats: Statistics from file operations
             execution_time: Total execution time in seconds
+            classified: Number of classified files (counted here if None)
+            categories: Files per primary category (counted here if None)
 
         Returns:
             Summary dictionary
         """
-        total_files = len(classification_map)
-        classified = sum(1 for c in classification_map.values() if c is not None)
-        failed = total_files - classified
+        total_files = len(files)
 
-        # Category statistics
-        categories: Dict[str, int] = {}
-        confidence_sum = 0.0
+        classified_only = [c for c in classifications if c is not None]
+        confidence_sum = sum(c.confidence for c in classified_only)
 
-        for classification in classification_map.values():
-            if classification:
-                category = classification.primary_category
-                categories[category] = categories.get(category, 0) + 1
-                confidence_sum += classification.confidence
+        if classified is None:
+            classified = len(classified_only)
+
+        # Category statistics: Counter tallies in C instead of a dict
+        # get/set per file
+        if categories is None:
+            categories = Counter(c.primary_category for c in classified_only)
+        categories = dict(categories)
+        failed = total_files - classified
 
         avg_confidence = confidence_sum / classified if classified > 0 else 0.0
 
@@ -76,7 +84,8 @@ class ReportGenerator:
     def export_json(
         self,
         data: Dict[str, Any],
-        filename: Optional[str] = None
+        filename: Optional[str] = None,
+        timestamp: Optional[str] = None
     ) -> Path:
         """
         Export data to JSON file.
@@ -84,12 +93,13 @@ class ReportGenerator:
         Args:
             data: Data to export
             filename: Output filename (auto-generated if None)
+            timestamp: Timestamp for the generated filename (defaults to now)
 
         Returns:
             Path to exported file
         """
         if filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"classification_report_{timestamp}.json"
 
         output_path = self.output_dir / filename
@@ -107,21 +117,25 @@ class ReportGenerator:
 
     def export_csv(
         self,
-        classification_map: Dict[FileInfo, Optional[Classification]],
-        filename: Optional[str] = None
+        files: List[FileInfo],
+        classifications: List[Optional[Classification]],
+        filename: Optional[str] = None,
+        timestamp: Optional[str] = None
     ) -> Path:
         """
         Export classification results to CSV file.
 
         Args:
-            classification_map: Mapping of files to classifications
+            files: List of processed files
+            classifications: Classifications aligned with files
             filename: Output filename (auto-generated if None)
+            timestamp: Timestamp for the generated filename (defaults to now)
 
         Returns:
             Path to exported file
         """
         if filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"classification_results_{timestamp}.csv"
 
         output_path = self.output_dir / filename
@@ -145,7 +159,7 @@ class ReportGenerator:
                 ])
 
                 # Write data
-                for file_info, classification in classification_map.items():
+                for file_info, classification in zip(files, classifications):
                     if classification:
                         writer.writerow([
                             file_info.name,
@@ -183,28 +197,32 @@ class ReportGenerator:
     def export_html(
         self,
         summary: Dict[str, Any],
-        classification_map: Dict[FileInfo, Optional[Classification]],
-        filename: Optional[str] = None
+        files: List[FileInfo],
+        classifications: List[Optional[Classification]],
+        filename: Optional[str] = None,
+        timestamp: Optional[str] = None
     ) -> Path:
         """
         Export report as HTML file.
 
         Args:
             summary: Summary statistics
-            classification_map: Mapping of files to classifications
+            files: List of processed files
+            classifications: Classifications aligned with files
             filename: Output filename (auto-generated if None)
+            timestamp: Timestamp for the generated filename (defaults to now)
 
         Returns:
             Path to exported file
         """
         if filename is None:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = timestamp or datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f"classification_report_{timestamp}.html"
 
         output_path = self.output_dir / filename
 
         # Generate simple HTML report
-        html = self._generate_html_report(summary, classification_map)
+        html = self._generate_html_report(summary, files, classifications)
 
         try:
             with open(output_path, 'w') as f:
@@ -220,7 +238,8 @@ class ReportGenerator:
     def _generate_html_report(
         self,
         summary: Dict[str, Any],
-        classification_map: Dict[FileInfo, Optional[Classification]]
+        files: List[FileInfo],
+        classifications: List[Optional[Classification]]
     ) -> str:
         """Generate HTML report content."""
 
@@ -281,7 +300,7 @@ class ReportGenerator:
         </tr>
 """
 
-        for file_info, classification in classification_map.items():
+        for file_info, classification in zip(files, classifications):
             if classification:
                 html += f"""        <tr>
             <td>{file_info.name}</td>
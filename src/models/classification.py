@@ -4,9 +4,14 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Classification:
-    """Represents a classification result for a file."""
+    """
+    Represents a classification result for a file.
+
+    Slotted because a run holds one instance per file (shared by
+    duplicates) until reports are written.
+    """
 
     path: List[str]
     confidence: float
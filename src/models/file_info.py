@@ -1,14 +1,34 @@
 """File information model."""
 
+import hashlib
+import os
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
+# Try to import blake3 for faster content fingerprints (SIMD-accelerated)
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
 
-@dataclass
+# Leading bytes fingerprinted by FileInfo.head_digest()
+HEAD_DIGEST_LENGTH = 4096
+# Digests from different algorithms must never be compared
+HEAD_DIGEST_ALGORITHM = 'blake3' if HAS_BLAKE3 else 'blake2b'
+
+
+@dataclass(slots=True)
 class FileInfo:
-    """Represents metadata and information about a file."""
+    """
+    Represents metadata and information about a file.
+
+    Uses __slots__ so attribute reads in grouping, routing and move loops
+    are fixed-offset loads rather than instance-dict lookups, and each
+    instance is smaller when scanning large trees.
+    """
 
     path: Path
     name: str
@@ -19,6 +39,12 @@ class FileInfo:
     content_preview: Optional[str] = None
     mime_type: Optional[str] = None
     metadata: Optional[dict] = None
+    content_digest: Optional[str] = None
+    # (namespace, key) from the last classifier that keyed this file; reused
+    # only when the namespace matches
+    cache_key: Optional[Tuple[str, str]] = None
+    # Raw st_mtime, kept so cache lookups need no datetime round trip
+    mtime: Optional[float] = None
 
     def __hash__(self) -> int:
         """
@@ -75,7 +101,11 @@ class FileInfo:
 
                 # Use smart sampling for files larger than max_content_length
                 if smart_sampling and file_size > max_content_length:
-                    content_preview = cls._smart_sample_content(file_path, max_content_length)
+                    content_preview = None
+                    if hasattr(os, 'pread'):
+                        content_preview = cls._sample_content_pread(file_path, max_content_length)
+                    if content_preview is None:
+                        content_preview = cls._smart_sample_content(file_path, max_content_length)
                 else:
                     # Read sequentially for small files
                     with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
@@ -93,7 +123,8 @@ class FileInfo:
             size=stat.st_size,
             created=created,
             modified=modified,
-            content_preview=content_preview
+            content_preview=content_preview,
+            mtime=stat.st_mtime
         )
 
     @staticmethod
@@ -152,6 +183,111 @@ class FileInfo:
             except:
                 return ""
 
+    @staticmethod
+    def _sample_content_pread(file_path: Path, max_length: int) -> Optional[str]:
+        """
+        Sample beginning, middle and end of a large file with positional reads.
+
+        Same sections as _smart_sample_content, but each one is a single
+        os.pread on a raw descriptor: no text-mode wrapper, read buffers or
+        seek/tell round-trips.
+
+        Args:
+            file_path: Path to the file
+            max_length: Maximum total length of sampled content
+
+        Returns:
+            Sampled content string, or None if the file cannot be read
+        """
+        chunk_size = max_length // 4
+
+        def read(chars: int, offset: int) -> str:
+            # UTF-8 needs at most 4 bytes per character
+            data = os.pread(fd, chars * 4, offset)
+            return data.decode('utf-8', errors='ignore')[:chars]
+
+        try:
+            fd = os.open(file_path, os.O_RDONLY)
+        except OSError:
+            return None
+
+        try:
+            file_size = os.fstat(fd).st_size
+
+            # Allocate content budget: 50% beginning, 25% middle, 25% end
+            beginning = read(chunk_size * 2, 0)
+            samples = [beginning]
+
+            middle_pos = file_size // 2 - (chunk_size // 2)
+            if middle_pos > len(beginning):
+                middle = read(chunk_size, max(0, middle_pos))
+                if middle and middle not in beginning:
+                    samples.append(f"\n... [middle section] ...\n{middle}")
+
+            end_pos = file_size - chunk_size
+            if end_pos > middle_pos + chunk_size:
+                end = read(chunk_size, max(0, end_pos))
+                if end and end not in beginning:
+                    samples.append(f"\n... [end section] ...\n{end}")
+
+            return ''.join(samples)[:max_length]
+
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+
+    def head_digest(self, length: int = HEAD_DIGEST_LENGTH) -> Optional[str]:
+        """
+        Fingerprint the first bytes of the file for duplicate detection.
+
+        Args:
+            length: Number of leading bytes to hash
+
+        Returns:
+            Hex digest (BLAKE3 if available, else BLAKE2b) or None if unreadable
+        """
+        # Duplicate detection and the classification cache share one read
+        if length == HEAD_DIGEST_LENGTH and self.content_digest is not None:
+            return self.content_digest
+
+        try:
+            with open(self.path, 'rb') as f:
+                head = f.read(length)
+        except OSError:
+            return None
+
+        if HAS_BLAKE3:
+            digest = blake3.blake3(head).hexdigest()
+        else:
+            digest = hashlib.blake2b(head, digest_size=16).hexdigest()
+
+        if length == HEAD_DIGEST_LENGTH:
+            self.content_digest = digest
+        return digest
+
+    def full_digest(self, chunk_size: int = 1 << 20) -> Optional[str]:
+        """
+        Fingerprint the whole file.
+
+        Only needed to confirm a duplicate once head digests collide, since
+        files can share their first bytes and still differ later on.
+
+        Args:
+            chunk_size: Bytes read per call
+
+        Returns:
+            Hex digest (BLAKE3 if available, else BLAKE2b) or None if unreadable
+        """
+        hasher = blake3.blake3() if HAS_BLAKE3 else hashlib.blake2b(digest_size=16)
+        try:
+            with open(self.path, 'rb') as f:
+                while chunk := f.read(chunk_size):
+                    hasher.update(chunk)
+        except OSError:
+            return None
+        return hasher.hexdigest()
+
     @staticmethod
     def _is_text_file(extension: str) -> bool:
         """
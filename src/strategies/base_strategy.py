@@ -1,7 +1,8 @@
 """Base classification strategy."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 
 from ..models.file_info import FileInfo
 from ..models.classification import Classification
@@ -34,6 +35,29 @@ class ClassificationStrategy(ABC):
         """
         pass
 
+    async def classify_many_async(
+        self,
+        files: List[FileInfo],
+        files_per_request: int = 10
+    ) -> List[Optional[Classification]]:
+        """
+        Classify many files, batching requests where the strategy supports it.
+
+        The default runs classify() for each file on worker threads;
+        strategies backed by an LLM override this to send several files
+        per request.
+
+        Args:
+            files: List of file information objects
+            files_per_request: Maximum files to include in one request
+
+        Returns:
+            Classification results aligned with files
+        """
+        return list(await asyncio.gather(
+            *(asyncio.to_thread(self.classify, file_info) for file_info in files)
+        ))
+
     @abstractmethod
     def can_handle(self, file_info: FileInfo) -> bool:
         """
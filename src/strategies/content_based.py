@@ -1,6 +1,6 @@
 """Content-based classification strategy using AI."""
 
-from typing import Optional
+from typing import List, Optional
 
 from .base_strategy import ClassificationStrategy
 from ..models.file_info import FileInfo
@@ -54,3 +54,29 @@ class ContentBasedStrategy(ClassificationStrategy):
             classification.strategy = self.name
 
         return classification
+
+    async def classify_many_async(
+        self,
+        files: List[FileInfo],
+        files_per_request: int = 10
+    ) -> List[Optional[Classification]]:
+        """
+        Classify many files with multi-file AI requests.
+
+        Args:
+            files: List of file information objects
+            files_per_request: Maximum files to include in one API request
+
+        Returns:
+            Classification results aligned with files
+        """
+        classifications = await self.ai_classifier.classify_many_async(
+            files,
+            files_per_request=files_per_request
+        )
+
+        for classification in classifications:
+            if classification:
+                classification.strategy = self.name
+
+        return classifications
@@ -2,10 +2,14 @@
 
 import hashlib
 import json
+import logging
 import pickle
+import sqlite3
+import threading
 import time
+import zlib
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Try to import msgpack for faster serialization (3-5x faster than JSON)
 try:
@@ -14,21 +18,145 @@ try:
 except ImportError:
     HAS_MSGPACK = False
 
+# xxhash (XXH3) hashes cache keys several times faster than MD5
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+# Tags every cache key, so entries written with the other hash never match.
+# Installing or removing xxhash therefore starts a fresh cache; keys are
+# one-way digests, so old entries cannot be re-keyed and simply expire.
+KEY_ALGORITHM = 'xxh3' if HAS_XXHASH else 'md5'
+
+# orjson encodes/decodes JSON in C, for sqlite rows and .json cache files
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# numpy is required for the semantic cache; faiss and fastembed are optional
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import faiss
+    HAS_FAISS = True
+except ImportError:
+    HAS_FAISS = False
+
+try:
+    from fastembed import TextEmbedding
+    HAS_FASTEMBED = True
+except ImportError:
+    HAS_FASTEMBED = False
+
+# onnxruntime (or onnxruntime-gpu) + tokenizers run a local ONNX embedding model
+try:
+    import onnxruntime as ort
+    from tokenizers import Tokenizer
+    HAS_ONNXRUNTIME = True
+except ImportError:
+    HAS_ONNXRUNTIME = False
+
 from .exceptions import CacheError
 from .logger import get_logger
 
 logger = get_logger()
 
 
+def _crc32_table() -> 'np.ndarray':
+    """Build the byte lookup table of the reflected CRC-32 used by zlib."""
+    table = np.arange(256, dtype=np.uint32)
+    for _ in range(8):
+        table = np.where(table & 1, (table >> 1) ^ np.uint32(0xEDB88320), table >> 1)
+    return table.astype(np.uint32)
+
+
+_CRC32_TABLE = _crc32_table() if HAS_NUMPY else None
+
+
+def _trigram_hashes(text: bytes) -> 'np.ndarray':
+    """
+    CRC32 of every 3-byte window of text, computed for all windows at once.
+
+    Bit-identical to ``zlib.crc32(text[i:i + 3])`` for each i, but runs as
+    three vectorized table lookups instead of one Python call per window.
+
+    Args:
+        text: Encoded text of at least 3 bytes
+
+    Returns:
+        uint32 array with len(text) - 2 hashes
+    """
+    data = np.frombuffer(text, dtype=np.uint8)
+    crc = np.full(len(data) - 2, 0xFFFFFFFF, dtype=np.uint32)
+    for offset in range(3):
+        byte = data[offset:offset + len(crc)]
+        crc = _CRC32_TABLE[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ np.uint32(0xFFFFFFFF)
+
+
+
+def _json_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON, with orjson when available.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON bytes
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+# Both accept str or bytes
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+
+def _key_digest(data: str) -> str:
+    """
+    Hash a cache key string to a fixed-width hex digest.
+
+    Args:
+        data: Key material
+
+    Returns:
+        32-character hex digest (XXH3-128 if available, else MD5),
+        prefixed with KEY_ALGORITHM
+    """
+    if HAS_XXHASH:
+        return f"{KEY_ALGORITHM}-{xxhash.xxh3_128_hexdigest(data.encode())}"
+    return f"{KEY_ALGORITHM}-{hashlib.md5(data.encode()).hexdigest()}"
+
+
 class CacheManager:
     """Manages caching of classification results with optimized serialization."""
 
+    SQLITE_FILE = "classifications.sqlite"
+    # SQLite rows buffered before they are written in one transaction
+    WRITE_BATCH_SIZE = 64
+    # Keys per IN (...) query; older SQLite builds allow 999 parameters
+    SQLITE_MAX_VARIABLES = 500
+    # Bytes of the database file read through mmap (0 disables)
+    SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
     def __init__(
         self,
         cache_dir: str = ".cache",
         ttl_hours: int = 24,
         enabled: bool = True,
-        use_binary: bool = True
+        use_binary: bool = True,
+        use_sqlite: bool = False
     ):
         """
         Initialize the cache manager.
@@ -38,15 +166,28 @@ class CacheManager:
             ttl_hours: Time-to-live for cache entries in hours
             enabled: Whether caching is enabled
             use_binary: Use binary serialization (msgpack/pickle) instead of JSON (3-5x faster)
+            use_sqlite: Store all entries in one SQLite database instead of a file per entry
         """
         self.cache_dir = Path(cache_dir)
         self.ttl_seconds = ttl_hours * 3600
         self.enabled = enabled
         self.use_binary = use_binary and (HAS_MSGPACK or True)  # Always available (pickle fallback)
         self.memory_cache: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        # Write-behind buffers; results stay readable from memory_cache and
+        # fingerprints from the dict until flush() writes them out
+        self._pending_entries: List[Tuple[str, float, bytes]] = []
+        self._pending_fingerprints: Dict[str, Tuple[str, int, float, str, float]] = {}
 
         # Determine serialization format
-        if self.use_binary:
+        if use_sqlite:
+            self.format = 'sqlite'
+            self.file_ext = '.sqlite'
+            logger.debug("Using SQLite cache database")
+        elif self.use_binary:
             if HAS_MSGPACK:
                 self.format = 'msgpack'
                 self.file_ext = '.msgpack'
@@ -62,11 +203,73 @@ class CacheManager:
 
         if self.enabled:
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if self.format == 'sqlite':
+                self._open_database()
             logger.debug(f"Cache initialized at {self.cache_dir}")
 
+    def _open_database(self) -> None:
+        """Open (or create) the SQLite cache and drop expired entries."""
+        self._db = sqlite3.connect(
+            self.cache_dir / self.SQLITE_FILE,
+            check_same_thread=False,  # shared by per-file classification threads
+            isolation_level=None
+        )
+        # WAL keeps readers and the single writer from blocking each other;
+        # NORMAL sync is durable enough for a cache. Memory-mapped reads
+        # skip a copy through SQLite's page cache on warm-cache lookups.
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(f"PRAGMA mmap_size={self.SQLITE_MMAP_SIZE}")
+        # Keyed by the digest itself (WITHOUT ROWID), so a lookup walks one
+        # B-tree instead of the key index and then the row table
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS classifications "
+            "(key TEXT PRIMARY KEY, timestamp REAL NOT NULL, data TEXT NOT NULL) WITHOUT ROWID"
+        )
+        self._db.execute(
+            "DELETE FROM classifications WHERE timestamp < ?",
+            (time.time() - self.ttl_seconds,)
+        )
+        # Content digests of files seen before, so unchanged files are not
+        # re-read to build their cache keys
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints "
+            "(path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime REAL NOT NULL, "
+            "digest TEXT NOT NULL, timestamp REAL NOT NULL) WITHOUT ROWID"
+        )
+        self._db.execute(
+            "DELETE FROM fingerprints WHERE timestamp < ?",
+            (time.time() - self.ttl_seconds,)
+        )
+
+    def get_content_key(
+        self,
+        name: str,
+        file_size: int,
+        digest: Optional[str],
+        namespace: str = ""
+    ) -> str:
+        """
+        Generate a cache key from file name and content.
+
+        Unlike get_cache_key, the key survives moves and touch-only
+        modifications, and the namespace (model, prompt version, language)
+        keeps results from different configurations apart.
+
+        Args:
+            name: File name
+            file_size: File size in bytes
+            digest: Content fingerprint (e.g. FileInfo.head_digest())
+            namespace: Identifies the configuration that produced the result
+
+        Returns:
+            Cache key (algorithm-tagged 128-bit hex digest)
+        """
+        return _key_digest(f"{namespace}:{name}:{file_size}:{digest}")
+
     def get_cache_key(self, file_path: str, file_size: int, modified_time: float) -> str:
         """
-        Generate a cache key from file characteristics using MD5 (faster than SHA256).
+        Generate a cache key from file path, size and modification time.
 
         Args:
             file_path: Path to the file
@@ -74,11 +277,54 @@ class CacheManager:
             modified_time: File modification timestamp
 
         Returns:
-            Cache key (MD5 hash - 2x faster than SHA256)
+            Cache key (algorithm-tagged 128-bit hex digest)
+        """
+        return _key_digest(f"{file_path}:{file_size}:{modified_time}")
+
+    def get_fingerprint(self, path: str, file_size: int, modified_time: float) -> Optional[str]:
+        """
+        Look up the remembered content digest of an unchanged file.
+
+        Only the SQLite backend keeps fingerprints; other formats always miss.
+
+        Args:
+            path: File path (may be prefixed to separate digest algorithms)
+            file_size: File size in bytes
+            modified_time: File modification timestamp
+
+        Returns:
+            Digest recorded for this path, size and mtime, or None
+        """
+        if self._db is None:
+            return None
+
+        with self._db_lock:
+            pending = self._pending_fingerprints.get(path)
+            if pending is not None:
+                return pending[3] if pending[1:3] == (file_size, modified_time) else None
+            row = self._db.execute(
+                "SELECT digest FROM fingerprints WHERE path = ? AND size = ? AND mtime = ?",
+                (path, file_size, modified_time)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_fingerprint(self, path: str, file_size: int, modified_time: float, digest: str) -> None:
         """
-        data = f"{file_path}:{file_size}:{modified_time}"
-        # Use MD5 for cache keys (speed matters more than collision resistance for cache)
-        return hashlib.md5(data.encode()).hexdigest()
+        Remember a file's content digest until its size or mtime changes.
+
+        Args:
+            path: File path (may be prefixed to separate digest algorithms)
+            file_size: File size in bytes
+            modified_time: File modification timestamp
+            digest: Content digest
+        """
+        if self._db is None:
+            return
+
+        with self._db_lock:
+            self._pending_fingerprints[path] = (path, file_size, modified_time, digest, time.time())
+            if len(self._pending_fingerprints) >= self.WRITE_BATCH_SIZE:
+                self._write_pending()
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """
@@ -93,16 +339,105 @@ class CacheManager:
         if not self.enabled:
             return None
 
+        data = self._lookup(key)
+        if data is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return data
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve several cached classification results at once.
+
+        With the SQLite backend, keys missing from memory are fetched in one
+        query per SQLITE_MAX_VARIABLES keys instead of one query each.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached data by key, for the keys that were found and not expired
+        """
+        if not self.enabled:
+            return {}
+
+        found = {}
+        if self._db is not None:
+            # Everything stored is in memory after this; misses need no query
+            self._load_rows([key for key in keys if key not in self.memory_cache])
+            for key in keys:
+                entry = self.memory_cache.get(key)
+                if entry is not None and self._is_valid(entry):
+                    found[key] = entry['data']
+        else:
+            for key in keys:
+                data = self._lookup(key)
+                if data is not None:
+                    found[key] = data
+
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def _load_rows(self, keys: List[str]) -> None:
+        """
+        Copy valid SQLite entries for keys into the memory cache.
+
+        Args:
+            keys: Cache keys not yet in memory
+        """
+        for start in range(0, len(keys), self.SQLITE_MAX_VARIABLES):
+            chunk = keys[start:start + self.SQLITE_MAX_VARIABLES]
+            placeholders = ", ".join("?" * len(chunk))
+            with self._db_lock:
+                rows = self._db.execute(
+                    f"SELECT key, timestamp, data FROM classifications WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+            for key, timestamp, data in rows:
+                entry = {'timestamp': timestamp, 'data': _json_loads(data)}
+                if self._is_valid(entry):
+                    self.memory_cache[key] = entry
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a valid entry in memory, then in the persistent store.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached data or None if not found or expired
+        """
         # Check memory cache first
         if key in self.memory_cache:
             entry = self.memory_cache[key]
             if self._is_valid(entry):
-                logger.debug(f"Cache hit (memory): {key[:8]}...")
+                # Warm runs take this path for every file; skip formatting
+                # a message nobody will see
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache hit (memory): {key[:8]}...")
                 return entry['data']
             else:
                 # Remove expired entry
                 del self.memory_cache[key]
 
+        if self._db is not None:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT timestamp, data FROM classifications WHERE key = ?",
+                    (key,)
+                ).fetchone()
+            if row is None:
+                return None
+            entry = {'timestamp': row[0], 'data': _json_loads(row[1])}
+            if not self._is_valid(entry):
+                return None
+            self.memory_cache[key] = entry
+            logger.debug(f"Cache hit (sqlite): {key[:8]}...")
+            return entry['data']
+
         # Check disk cache (try all formats for backward compatibility)
         cache_file = self.cache_dir / f"{key}{self.file_ext}"
 
@@ -148,8 +483,8 @@ class CacheManager:
             ext = cache_file.suffix
 
             if ext == '.json':
-                with open(cache_file, 'r') as f:
-                    return json.load(f)
+                with open(cache_file, 'rb') as f:
+                    return _json_loads(f.read())
 
             elif ext == '.msgpack':
                 with open(cache_file, 'rb') as f:
@@ -176,6 +511,9 @@ class CacheManager:
         """
         Store classification result in cache using optimized serialization.
 
+        SQLite rows are written in batches of WRITE_BATCH_SIZE; call flush()
+        before exiting to write the remainder.
+
         Args:
             key: Cache key
             data: Data to cache
@@ -191,12 +529,19 @@ class CacheManager:
         # Store in memory cache
         self.memory_cache[key] = entry
 
+        if self._db is not None:
+            with self._db_lock:
+                self._pending_entries.append((key, entry['timestamp'], _json_bytes(data)))
+                if len(self._pending_entries) >= self.WRITE_BATCH_SIZE:
+                    self._write_pending()
+            return
+
         # Store on disk with appropriate serializer
         cache_file = self.cache_dir / f"{key}{self.file_ext}"
         try:
             if self.format == 'json':
-                with open(cache_file, 'w') as f:
-                    json.dump(entry, f, indent=2)
+                with open(cache_file, 'wb') as f:
+                    f.write(_json_bytes(entry, indent=True))
 
             elif self.format == 'msgpack':
                 with open(cache_file, 'wb') as f:
@@ -211,6 +556,38 @@ class CacheManager:
         except IOError as e:
             logger.warning(f"Failed to write cache file: {e}")
 
+    def flush(self) -> None:
+        """Write buffered SQLite rows to disk (no-op for file formats)."""
+        if self._db is None:
+            return
+
+        with self._db_lock:
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Write buffered rows in one transaction; caller holds _db_lock."""
+        if not (self._pending_entries or self._pending_fingerprints):
+            return
+
+        try:
+            self._db.execute("BEGIN")
+            self._db.executemany(
+                "INSERT OR REPLACE INTO classifications VALUES (?, ?, ?)",
+                self._pending_entries
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO fingerprints VALUES (?, ?, ?, ?, ?)",
+                list(self._pending_fingerprints.values())
+            )
+            self._db.execute("COMMIT")
+        except sqlite3.Error as e:
+            if self._db.in_transaction:
+                self._db.execute("ROLLBACK")
+            logger.warning(f"Failed to write cache entries: {e}")
+        finally:
+            self._pending_entries.clear()
+            self._pending_fingerprints.clear()
+
     def _is_valid(self, entry: Dict[str, Any]) -> bool:
         """
         Check if cache entry is still valid.
@@ -235,6 +612,13 @@ class CacheManager:
         # Clear memory cache
         self.memory_cache.clear()
 
+        if self._db is not None:
+            with self._db_lock:
+                self._pending_entries.clear()
+                self._pending_fingerprints.clear()
+                self._db.execute("DELETE FROM classifications")
+                self._db.execute("DELETE FROM fingerprints")
+
         # Clear disk cache (all formats)
         try:
             for ext in ['*.json', '*.msgpack', '*.pkl']:
@@ -265,6 +649,18 @@ class CacheManager:
         total_size = 0
         format_breakdown = {}
 
+        if self._db is not None:
+            with self._db_lock:
+                self._write_pending()
+                count = self._db.execute("SELECT COUNT(*) FROM classifications").fetchone()[0]
+            size = sum(
+                path.stat().st_size
+                for path in self.cache_dir.glob(f"{self.SQLITE_FILE}*")
+            )
+            disk_entries += count
+            total_size += size
+            format_breakdown['sqlite'] = {'count': count, 'size_mb': size / (1024 * 1024)}
+
         for ext in ['*.json', '*.msgpack', '*.pkl']:
             files = list(self.cache_dir.glob(ext))
             count = len(files)
@@ -280,6 +676,7 @@ class CacheManager:
                     'size_mb': size / (1024 * 1024)
                 }
 
+        lookups = self.hits + self.misses
         return {
             'enabled': True,
             'format': self.format,
@@ -287,5 +684,559 @@ class CacheManager:
             'disk_entries': disk_entries,
             'total_size_mb': total_size / (1024 * 1024),
             'ttl_hours': self.ttl_seconds / 3600,
-            'format_breakdown': format_breakdown
+            'format_breakdown': format_breakdown,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+class OnnxEmbedder:
+    """
+    Sentence embedder backed by an ONNX model (e.g. all-MiniLM, bge-micro).
+
+    Runs on the GPU through the CUDA execution provider when onnxruntime-gpu
+    is installed and falls back to the CPU provider otherwise.
+    """
+
+    DEFAULT_PROVIDERS = ["CUDAExecutionProvider", "CPUExecutionProvider"]
+
+    def __init__(
+        self,
+        model_path: str,
+        tokenizer_path: Optional[str] = None,
+        providers: Optional[List[str]] = None,
+        max_tokens: int = 128,
+        batch_size: int = 256
+    ):
+        """
+        Load the model and tokenizer.
+
+        Args:
+            model_path: Path to the .onnx model file
+            tokenizer_path: Path to tokenizer.json (defaults to the model's directory)
+            providers: Execution providers in order of preference
+            max_tokens: Sequences are truncated to this many tokens
+            batch_size: Sketches per inference call
+        """
+        tokenizer_path = tokenizer_path or str(Path(model_path).parent / 'tokenizer.json')
+        self.tokenizer = Tokenizer.from_file(tokenizer_path)
+        self.tokenizer.enable_truncation(max_length=max_tokens)
+        self.tokenizer.enable_padding()
+        self.batch_size = batch_size
+
+        requested = providers or self.DEFAULT_PROVIDERS
+        available = set(ort.get_available_providers())
+        self.session = ort.InferenceSession(
+            model_path,
+            providers=[p for p in requested if p in available] or ['CPUExecutionProvider']
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        logger.debug(f"ONNX embedder using {self.session.get_providers()[0]}")
+
+    def embed(self, texts: List[str]) -> 'np.ndarray':
+        """
+        Embed texts with attention-masked mean pooling.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 array of shape (len(texts), dim), not normalized
+        """
+        outputs = []
+        for start in range(0, len(texts), self.batch_size):
+            encodings = self.tokenizer.encode_batch(texts[start:start + self.batch_size])
+            input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+            attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+
+            feeds = {'input_ids': input_ids, 'attention_mask': attention_mask}
+            if 'token_type_ids' in self.input_names:
+                feeds['token_type_ids'] = np.zeros_like(input_ids)
+
+            hidden = self.session.run(None, {k: v for k, v in feeds.items() if k in self.input_names})[0]
+            if hidden.ndim == 3:
+                # Token embeddings: mean over non-padding tokens
+                mask = attention_mask[..., None].astype(np.float32)
+                hidden = (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+            outputs.append(hidden.astype(np.float32))
+
+        return np.vstack(outputs)
+
+
+class SemanticCache:
+    """
+    Approximate cache that reuses classifications for near-identical files.
+
+    Each file is reduced to a short text sketch (name plus the start of its
+    content), embedded, and compared by cosine similarity against previously
+    classified sketches. Vectors are kept in a single array (int8-quantized
+    by default, else float32), mirrored in a FAISS inner-product index when
+    faiss is installed, and persisted with numpy under
+    ``cache_dir/semantic/<partition>``. The partition is derived from the
+    classifier namespace and the embedder, so answers for another model,
+    prompt version or language, and vectors from another embedding space,
+    are never reused.
+    """
+
+    VECTORS_FILE = 'vectors.npy'
+    ENTRIES_FILE = 'entries.json'
+
+    # int8 codes span [-127, 127]; each row keeps its own float32 scale
+    QUANT_LEVELS = 127.0
+    # Rows dequantized per step when scanning without faiss
+    SCAN_BLOCK_ROWS = 8192
+
+    def __init__(
+        self,
+        cache_dir: str = ".cache",
+        threshold: float = 0.92,
+        dim: int = 512,
+        ttl_hours: int = 24,
+        model_name: Optional[str] = None,
+        enabled: bool = True,
+        onnx_model_path: Optional[str] = None,
+        onnx_providers: Optional[List[str]] = None,
+        quantize: bool = True,
+        namespace: str = ""
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            cache_dir: Base cache directory
+            threshold: Minimum cosine similarity for a cache hit
+            dim: Dimension of hashed n-gram sketches (ignored with a model)
+            ttl_hours: Time-to-live for cache entries in hours
+            model_name: Optional fastembed model name (e.g. 'BAAI/bge-small-en-v1.5')
+            enabled: Whether the semantic cache is enabled
+            onnx_model_path: Optional local ONNX embedding model (takes precedence)
+            onnx_providers: ONNX Runtime execution providers (default: CUDA, then CPU)
+            quantize: Store vectors as int8 (4x smaller, slightly less precise)
+            namespace: Classifier cache namespace (see AIClassifier.cache_namespace)
+        """
+        self.cache_dir = Path(cache_dir) / 'semantic'
+        self.namespace = namespace
+        self.threshold = threshold
+        self.ttl_seconds = ttl_hours * 3600
+        self.enabled = enabled and HAS_NUMPY
+        self.model = None
+        self.onnx = None
+        self.dim = dim
+        self.quantize = quantize
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+        if enabled and not HAS_NUMPY:
+            logger.warning("Semantic cache disabled: numpy is not installed")
+
+        if not self.enabled:
+            return
+
+        if onnx_model_path:
+            if HAS_ONNXRUNTIME:
+                self.onnx = OnnxEmbedder(onnx_model_path, providers=onnx_providers)
+                self.dim = self.onnx.embed(["probe"]).shape[1]
+            else:
+                logger.warning("onnxruntime/tokenizers not installed, ignoring onnx_model_path")
+
+        if model_name and self.onnx is None:
+            if HAS_FASTEMBED:
+                self.model = TextEmbedding(model_name)
+                self.dim = len(next(iter(self.model.embed(["probe"]))))
+                logger.debug(f"Semantic cache using fastembed model {model_name}")
+            else:
+                logger.warning("fastembed not installed, using hashed n-gram sketches")
+
+        if self.onnx is not None:
+            self.embedder_id = f"onnx:{onnx_model_path}"
+        elif self.model is not None:
+            self.embedder_id = f"fastembed:{model_name}"
+        else:
+            self.embedder_id = f"ngram:{self.dim}"
+        partition = hashlib.sha256(f"{namespace}|{self.embedder_id}".encode()).hexdigest()[:16]
+        self.cache_dir = self.cache_dir / partition
+
+        # Row buffers grown by doubling; only the first _rows rows are in use
+        self._rows = 0
+        self._vector_buffer = np.zeros((0, self.dim), dtype=self._storage_dtype)
+        self._scale_buffer = np.zeros(0, dtype=np.float32)
+        self.entries: List[Dict[str, Any]] = []
+        self.index = self._create_index() if HAS_FAISS else None
+        # Guards vectors/scales/entries, which per-file classification
+        # threads read and extend concurrently
+        self._lock = threading.Lock()
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    @property
+    def vectors(self) -> 'np.ndarray':
+        """Stored vectors (int8 codes or float32), one row per entry."""
+        return self._vector_buffer[:self._rows]
+
+    @property
+    def scales(self) -> 'np.ndarray':
+        """Per-row float32 scales of the stored vectors."""
+        return self._scale_buffer[:self._rows]
+
+    def _set_rows(self, vectors: 'np.ndarray', scales: 'np.ndarray') -> None:
+        """
+        Replace all stored rows.
+
+        Args:
+            vectors: Vectors in the storage format
+            scales: Per-row scales
+        """
+        self._vector_buffer = np.ascontiguousarray(vectors)
+        self._scale_buffer = np.asarray(scales, dtype=np.float32)
+        self._rows = len(vectors)
+
+    def _append_row(self, codes: 'np.ndarray', scale: float) -> None:
+        """
+        Append one row, doubling the buffers when they are full.
+
+        Growing geometrically keeps the total copying linear over a run,
+        where stacking a new array per insert would be quadratic.
+
+        Args:
+            codes: Vector in the storage format
+            scale: Its scale
+        """
+        if self._rows == len(self._vector_buffer):
+            capacity = max(64, 2 * self._rows)
+            vectors = np.empty((capacity, self.dim), dtype=self._vector_buffer.dtype)
+            scales = np.empty(capacity, dtype=np.float32)
+            vectors[:self._rows] = self.vectors
+            scales[:self._rows] = self.scales
+            self._vector_buffer, self._scale_buffer = vectors, scales
+
+        self._vector_buffer[self._rows] = codes
+        self._scale_buffer[self._rows] = scale
+        self._rows += 1
+
+    @property
+    def _storage_dtype(self) -> Any:
+        """numpy dtype used for stored vectors."""
+        return np.int8 if self.quantize else np.float32
+
+    def _create_index(self) -> Any:
+        """
+        Create the FAISS inner-product index.
+
+        Returns:
+            An 8-bit scalar-quantized index when quantizing, else a flat index
+        """
+        if not self.quantize:
+            return faiss.IndexFlatIP(self.dim)
+
+        index = faiss.IndexScalarQuantizer(
+            self.dim,
+            faiss.ScalarQuantizer.QT_8bit,
+            faiss.METRIC_INNER_PRODUCT
+        )
+        # Unit vectors need no calibration: train on the [-1, 1] bounds
+        index.train(np.stack([
+            np.full(self.dim, -1.0, dtype=np.float32),
+            np.full(self.dim, 1.0, dtype=np.float32)
+        ]))
+        return index
+
+    def _encode(self, vectors: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray']:
+        """
+        Convert float vectors to the storage format.
+
+        Each row is scaled so its largest component maps to +/-127, which
+        keeps quantization error well below typical similarity thresholds.
+
+        Args:
+            vectors: float32 vectors
+
+        Returns:
+            Tuple of (int8 codes or float32 vectors, per-row float32 scales)
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if not self.quantize:
+            return vectors, np.ones(len(vectors), dtype=np.float32)
+
+        peaks = np.abs(vectors).max(axis=1) if vectors.size else np.zeros(len(vectors))
+        scales = (np.where(peaks > 0, peaks, 1.0) / self.QUANT_LEVELS).astype(np.float32)
+        codes = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+        return codes, scales
+
+    @staticmethod
+    def _decode(vectors: 'np.ndarray', scales: 'np.ndarray') -> 'np.ndarray':
+        """
+        Convert stored vectors back to float32.
+
+        Args:
+            vectors: Stored vectors
+            scales: Per-row scales
+
+        Returns:
+            float32 vectors
+        """
+        if vectors.dtype == np.int8:
+            return vectors.astype(np.float32) * scales[:, None]
+        return np.asarray(vectors, dtype=np.float32)
+
+    def _scan(self, vector: 'np.ndarray') -> Tuple[int, float]:
+        """
+        Find the most similar stored vector without faiss.
+
+        int8 codes are dequantized block by block so memory stays bounded.
+
+        Args:
+            vector: Normalized query vector
+
+        Returns:
+            Tuple of (best row, cosine similarity)
+        """
+        if not self.quantize:
+            similarities = self.vectors @ vector
+            best = int(np.argmax(similarities))
+            return best, float(similarities[best])
+
+        query = vector.astype(np.float32)
+        best, score = -1, float('-inf')
+        for start in range(0, len(self.vectors), self.SCAN_BLOCK_ROWS):
+            end = start + self.SCAN_BLOCK_ROWS
+            similarities = (self.vectors[start:end].astype(np.float32) @ query) * self.scales[start:end]
+            row = int(np.argmax(similarities))
+            if similarities[row] > score:
+                best, score = start + row, float(similarities[row])
+        return best, score
+
+    @staticmethod
+    def build_sketch(name: str, content: Optional[str], length: int = 512) -> str:
+        """
+        Build the text sketch embedded for a file.
+
+        Args:
+            name: File name
+            content: Content preview, if any
+            length: Number of content characters to include
+
+        Returns:
+            Sketch string
+        """
+        return f"{name}\n{content[:length]}" if content else name
+
+    def embed(self, sketch: str) -> 'np.ndarray':
+        """
+        Embed a sketch as a unit-length float32 vector.
+
+        Without a model, character trigrams are hashed (with a stable CRC32)
+        into a fixed-size count vector, which is cheap and deterministic
+        across runs.
+
+        Args:
+            sketch: Sketch string
+
+        Returns:
+            Normalized embedding vector
+        """
+        return self.embed_batch([sketch])[0]
+
+    def embed_batch(self, sketches: List[str]) -> 'np.ndarray':
+        """
+        Embed several sketches at once.
+
+        Model backends run one batched inference call instead of one per
+        sketch, which is where GPU execution pays off.
+
+        Args:
+            sketches: Sketch strings
+
+        Returns:
+            float32 array of normalized vectors, one row per sketch
+        """
+        if not sketches:
+            return np.zeros((0, self.dim), dtype=np.float32)
+
+        if self.onnx is not None:
+            vectors = self.onnx.embed(sketches)
+        elif self.model is not None:
+            vectors = np.asarray(list(self.model.embed(sketches)), dtype=np.float32)
+        else:
+            # Bucket every sketch's trigrams into one flat histogram at once
+            buckets = []
+            for row, sketch in enumerate(sketches):
+                text = sketch.lower().encode('utf-8', errors='ignore')
+                if len(text) < 3:
+                    hashes = np.array([zlib.crc32(text)], dtype=np.uint32)
+                else:
+                    hashes = _trigram_hashes(text)
+                buckets.append(hashes % self.dim + row * self.dim)
+            vectors = np.bincount(
+                np.concatenate(buckets),
+                minlength=len(sketches) * self.dim
+            ).reshape(len(sketches), self.dim).astype(np.float32)
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms > 0, norms, 1.0)
+
+    def lookup(
+        self,
+        vector: 'np.ndarray',
+        threshold: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached classification for a similar sketch.
+
+        Args:
+            vector: Normalized embedding vector
+            threshold: Minimum cosine similarity (defaults to self.threshold)
+
+        Returns:
+            Cached data or None if no entry is similar enough
+        """
+        threshold = self.threshold if threshold is None else threshold
+        if not self.enabled or not self.entries:
+            self.misses += 1
+            return None
+
+        with self._lock:
+            if self.index is not None:
+                scores, ids = self.index.search(vector.reshape(1, -1), 1)
+                best, score = int(ids[0][0]), float(scores[0][0])
+            else:
+                best, score = self._scan(vector)
+
+            entry = self.entries[best] if best >= 0 else None
+        if entry is None or score < threshold or not self._is_valid(entry):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.debug(f"Semantic cache hit (similarity {score:.3f})")
+        return entry['data']
+
+    def semantic_lookup(
+        self,
+        sketch: str,
+        threshold: Optional[float] = None
+    ) -> Tuple[Optional['np.ndarray'], Optional[Dict[str, Any]]]:
+        """
+        Embed a sketch and find a cached classification for similar content.
+
+        The vector is returned so a miss can be inserted after classification
+        without embedding the sketch twice.
+
+        Args:
+            sketch: Sketch string (see build_sketch)
+            threshold: Minimum cosine similarity (defaults to self.threshold)
+
+        Returns:
+            Tuple of (embedding vector or None if disabled, cached data or None)
+        """
+        if not self.enabled:
+            return None, None
+
+        vector = self.embed(sketch)
+        return vector, self.lookup(vector, threshold)
+
+    def insert(self, vector: 'np.ndarray', data: Dict[str, Any]) -> None:
+        """
+        Add a classified sketch to the cache.
+
+        Args:
+            vector: Normalized embedding vector
+            data: Classification data to cache
+        """
+        if not self.enabled:
+            return
+
+        codes, scales = self._encode(vector.reshape(1, -1))
+        with self._lock:
+            self._append_row(codes[0], scales[0])
+            if self.index is not None:
+                self.index.add(vector.reshape(1, -1))
+            self.entries.append({'timestamp': time.time(), 'scale': float(scales[0]), 'data': data})
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist vectors and entries if anything changed."""
+        if not self.enabled or not self._dirty:
+            return
+
+        # Snapshot rows and entries together; inserts may continue meanwhile
+        with self._lock:
+            vectors = self.vectors
+            entries = list(self.entries)
+
+        try:
+            np.save(self.cache_dir / self.VECTORS_FILE, vectors)
+            with open(self.cache_dir / self.ENTRIES_FILE, 'wb') as f:
+                f.write(_json_bytes(entries))
+            self._dirty = False
+            logger.debug(f"Saved semantic cache ({len(entries)} entries)")
+        except (IOError, OSError) as e:
+            logger.warning(f"Failed to save semantic cache: {e}")
+
+    def _load(self) -> None:
+        """Load persisted vectors and entries, dropping expired ones."""
+        vectors_file = self.cache_dir / self.VECTORS_FILE
+        entries_file = self.cache_dir / self.ENTRIES_FILE
+        if not vectors_file.exists() or not entries_file.exists():
+            return
+
+        try:
+            vectors = np.load(vectors_file)
+            with open(entries_file, 'rb') as f:
+                entries = _json_loads(f.read())
+        except Exception as e:
+            logger.warning(f"Failed to load semantic cache: {e}")
+            return
+
+        if vectors.ndim != 2 or vectors.shape != (len(entries), self.dim):
+            logger.debug("Semantic cache shape changed, starting fresh")
+            return
+
+        keep = [i for i, entry in enumerate(entries) if self._is_valid(entry)]
+        expired = len(keep) != len(entries)
+        vectors = vectors[keep]
+        entries = [entries[i] for i in keep]
+        scales = np.array([entry.get('scale', 1.0) for entry in entries], dtype=np.float32)
+        converted = vectors.dtype != self._storage_dtype
+        if converted:
+            # Cache written with the other storage format
+            vectors, scales = self._encode(self._decode(vectors, scales))
+            for entry, scale in zip(entries, scales):
+                entry['scale'] = float(scale)
+        self._set_rows(vectors, scales)
+        self.entries = entries
+        if self.index is not None and len(keep):
+            self.index.add(self._decode(self.vectors, self.scales))
+        self._dirty = converted or expired
+        logger.debug(f"Loaded semantic cache ({len(self.entries)} entries)")
+
+    def _is_valid(self, entry: Dict[str, Any]) -> bool:
+        """
+        Check if a semantic cache entry is still valid.
+
+        Args:
+            entry: Cache entry with timestamp and data
+
+        Returns:
+            True if valid, False if expired
+        """
+        return time.time() - entry.get('timestamp', 0) < self.ttl_seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get semantic cache statistics.
+
+        Returns:
+            Dictionary with semantic cache statistics
+        """
+        return {
+            'enabled': self.enabled,
+            'entries': len(self.entries) if self.enabled else 0,
+            'hits': self.hits,
+            'misses': self.misses,
+            'backend': 'faiss' if self.index is not None else 'numpy',
+            'quantized': self.quantize,
+            'embedder': 'onnx' if self.onnx is not None else 'fastembed' if self.model is not None else 'ngram'
         }
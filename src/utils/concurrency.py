@@ -0,0 +1,280 @@
+"""Concurrency control primitives for API requests."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Deque, List, Optional
+
+from .logger import get_logger
+
+# uvloop (libuv-based event loop) is optional and unavailable on Windows
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
+logger = get_logger()
+
+
+async def gather_or_cancel(coroutines: List[Awaitable[Any]]) -> List[Any]:
+    """
+    Run coroutines concurrently; if one raises, cancel the rest and re-raise.
+
+    Unlike asyncio.gather, the remaining coroutines do not keep running (and
+    sending requests) after the first failure.
+
+    Args:
+        coroutines: Coroutines to run
+
+    Returns:
+        Their results in order
+    """
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def install_event_loop_policy(use_uvloop: bool = True) -> bool:
+    """
+    Make asyncio.run use uvloop when it is installed.
+
+    Args:
+        use_uvloop: Set False to keep the default asyncio loop
+
+    Returns:
+        True if uvloop is in use
+    """
+    if not (use_uvloop and HAS_UVLOOP):
+        return False
+
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.debug("Using uvloop event loop")
+    return True
+
+
+class AdaptiveSemaphore:
+    """
+    Async semaphore whose limit adapts to API health (AIMD).
+
+    The limit grows by one after every ``window`` consecutive successes and
+    is halved whenever the API signals overload (rate limits, 5xx, timeouts),
+    so throughput tracks the headroom the server actually has.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: Optional[int] = None,
+        window: int = 32,
+        adaptive: bool = True
+    ):
+        """
+        Initialize the semaphore.
+
+        Args:
+            initial: Starting number of permits
+            minimum: Lowest limit reached by multiplicative decrease
+            maximum: Highest limit reached by additive increase (defaults to 2x initial)
+            window: Consecutive successes required before adding a permit
+            adaptive: If False, behaves as a fixed semaphore of ``initial`` permits
+        """
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum if maximum is not None else initial * 2)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.window = max(1, window)
+        self.adaptive = adaptive
+
+        self._in_flight = 0
+        self._successes = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of permits currently held."""
+        return self._in_flight
+
+    async def acquire(self) -> None:
+        """Wait for a permit."""
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass on a wake-up we were given but can no longer use
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+        self._in_flight += 1
+
+    def release(self) -> None:
+        """Return a permit."""
+        self._in_flight -= 1
+        self._wake()
+
+    def record_success(self) -> None:
+        """Report a successful request; grows the limit after a full window."""
+        if not self.adaptive:
+            return
+
+        self._successes += 1
+        if self._successes >= self.window:
+            self._successes = 0
+            if self.limit < self.maximum:
+                self.limit += 1
+                logger.debug(f"Concurrency limit increased to {self.limit}")
+                self._wake()
+
+    def record_failure(self) -> None:
+        """Report an overload signal; halves the limit."""
+        if not self.adaptive:
+            return
+
+        self._successes = 0
+        new_limit = max(self.minimum, self.limit // 2)
+        if new_limit < self.limit:
+            logger.warning(f"API overloaded, reducing concurrency limit {self.limit} -> {new_limit}")
+            self.limit = new_limit
+
+    def _wake(self) -> None:
+        """Wake as many waiters as there are free permits."""
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def __aenter__(self) -> 'AdaptiveSemaphore':
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
+class TokenBucket:
+    """
+    Rate limiter that spaces requests to stay under a per-minute budget.
+
+    The bucket holds up to ``capacity`` tokens and refills continuously at
+    ``per_minute / 60`` tokens per second; refill is computed on demand, so
+    no background task is needed. Callers reserve tokens up front and the
+    balance may go negative, which queues later callers behind earlier ones
+    in arrival order without a lock bound to one event loop.
+    """
+
+    def __init__(self, per_minute: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket.
+
+        Args:
+            per_minute: Tokens granted per minute (requests or LLM tokens)
+            capacity: Largest burst allowed after idling (defaults to one
+                minute's worth)
+        """
+        self.rate = per_minute / 60.0
+        self.capacity = capacity if capacity is not None else float(per_minute)
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """
+        Take tokens from the bucket.
+
+        Args:
+            amount: Tokens needed (clamped to capacity so it can be satisfied)
+
+        Returns:
+            Seconds the caller must wait before using the tokens
+        """
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= min(amount, self.capacity)
+        return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until ``amount`` tokens are available."""
+        delay = self.reserve(amount)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class CircuitBreaker:
+    """
+    Fails requests fast while the API is down.
+
+    After ``failure_threshold`` consecutive outage errors the breaker opens
+    and refuses requests for ``reset_timeout`` seconds. Then one request is
+    let through as a probe and the rest are held back for another period;
+    any response from the server closes the breaker again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive outage errors that open the breaker
+            reset_timeout: Seconds to refuse requests before probing again
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        """True while requests are being refused or probed."""
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """
+        Check whether a request may be sent now.
+
+        Returns:
+            True if the breaker is closed or this request is the probe
+        """
+        if self._opened_at is None:
+            return True
+
+        now = time.monotonic()
+        if now - self._opened_at < self.reset_timeout:
+            return False
+
+        # Half-open: this request probes, others wait out another period
+        self._opened_at = now
+        return True
+
+    def record_success(self) -> None:
+        """Report that the server answered; closes the breaker."""
+        if self._opened_at is not None:
+            logger.info("API reachable again, resuming requests")
+        self._failures = 0
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        """Report an outage error (connection failure, timeout, 5xx)."""
+        self._failures += 1
+        if self._failures >= self.failure_threshold:
+            if self._opened_at is None:
+                logger.warning(
+                    f"API unavailable after {self._failures} consecutive failures, "
+                    f"refusing requests for {self.reset_timeout:.0f}s"
+                )
+            self._opened_at = time.monotonic()
@@ -143,6 +143,7 @@ class ConfigManager:
                 "retry_delay": 2,
                 "max_concurrent_requests": 5,
                 "requests_per_minute": 60,
+                "tokens_per_minute": None,
             },
             "classification": {
                 "default_strategy": "content_based",
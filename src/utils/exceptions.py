@@ -16,6 +16,16 @@ class APIError(ClassifierError):
     pass
 
 
+class CircuitOpenError(APIError):
+    """Raised when a request is refused because the API looks unavailable."""
+    pass
+
+
+class FatalAPIError(APIError):
+    """Raised when an API error would repeat for every request (credentials, model, endpoint)."""
+    pass
+
+
 class FileOperationError(ClassifierError):
     """Raised when file operations fail."""
     pass
@@ -219,6 +219,9 @@ class ConfigValidator:
 class JSONResponseValidator:
     """Validates JSON responses from LLM."""
 
+    REQUIRED_FIELDS = ('primary_category', 'confidence')
+    OPTIONAL_STRING_FIELDS = ('subcategory', 'sub_subcategory', 'reasoning')
+
     @staticmethod
     def validate_classification_response(data: Dict[str, Any]) -> None:
         """
@@ -230,9 +233,10 @@ class JSONResponseValidator:
         Raises:
             ValidationError: If response is invalid
         """
-        required_fields = ['primary_category', 'confidence']
+        if not isinstance(data, dict):
+            raise ValidationError("Classification must be a JSON object")
 
-        for field in required_fields:
+        for field in JSONResponseValidator.REQUIRED_FIELDS:
             if field not in data:
                 raise ValidationError(f"Missing required field: {field}")
 
@@ -246,7 +250,7 @@ class JSONResponseValidator:
             raise ValidationError("confidence must be a number between 0 and 1")
 
         # Validate optional fields
-        for field in ['subcategory', 'sub_subcategory', 'reasoning']:
-            if field in data and data[field] is not None:
-                if not isinstance(data[field], str):
-                    raise ValidationError(f"{field} must be a string or null")
+        for field in JSONResponseValidator.OPTIONAL_STRING_FIELDS:
+            value = data.get(field)
+            if value is not None and not isinstance(value, str):
+                raise ValidationError(f"{field} must be a string or null")
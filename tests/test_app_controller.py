@@ -0,0 +1,33 @@
+"""Tests for the ApplicationController workflow."""
+
+import pytest
+
+from src.app_controller import ApplicationController
+from src.utils.config_manager import load_config
+
+
+@pytest.fixture
+def config(tmp_path):
+    """Default configuration with caching disabled."""
+    config = load_config()
+    config['app']['cache_enabled'] = False
+    config['app']['log_file'] = str(tmp_path / 'classifier.log')
+    return config
+
+
+class TestExecute:
+    """Tests for ApplicationController.execute."""
+
+    @pytest.mark.parametrize('streaming', [True, False])
+    def test_empty_source_directory(self, config, tmp_path, streaming):
+        config['performance'].setdefault('batch_processing', {})['streaming_pipeline'] = streaming
+        source = tmp_path / 'source'
+        source.mkdir()
+
+        result = ApplicationController(config).execute(source, tmp_path / 'dest', dry_run=True)
+
+        assert result['success'] is True
+        assert result['total_files'] == 0
+        assert result['classified'] == 0
+        assert result['failed'] == 0
+        assert not (tmp_path / 'dest').exists()
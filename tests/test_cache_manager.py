@@ -0,0 +1,184 @@
+"""Tests for the SQLite cache backend and its write-behind buffer."""
+
+import hashlib
+import sqlite3
+import time
+
+import pytest
+
+from src.core.ai_classifier import AIClassifier, LLMClient
+from src.models.file_info import FileInfo
+from src.utils import cache_manager as cache_module
+from src.utils.cache_manager import CacheManager
+
+
+def make_cache(path, ttl_hours=24):
+    """SQLite-backed cache manager in path."""
+    return CacheManager(cache_dir=str(path), ttl_hours=ttl_hours, use_sqlite=True)
+
+
+def stored_keys(path):
+    """Keys written to the database file so far."""
+    with sqlite3.connect(path / CacheManager.SQLITE_FILE) as db:
+        return {row[0] for row in db.execute("SELECT key FROM classifications")}
+
+
+def result(category):
+    """Minimal classification payload."""
+    return {'path': [category], 'confidence': 0.9, 'reasoning': 'test'}
+
+
+class TestSqliteCache:
+    """Tests for CacheManager with use_sqlite=True."""
+
+    def test_writes_are_buffered_until_flush(self, tmp_path):
+        cache = make_cache(tmp_path)
+        cache.set('a', result('Docs'))
+
+        # Readable immediately, but not yet on disk
+        assert cache.get('a') == result('Docs')
+        assert stored_keys(tmp_path) == set()
+
+        cache.flush()
+
+        assert stored_keys(tmp_path) == {'a'}
+
+    def test_full_batch_is_written_without_flush(self, tmp_path):
+        cache = make_cache(tmp_path)
+        for i in range(CacheManager.WRITE_BATCH_SIZE):
+            cache.set(f'k{i}', result('Docs'))
+
+        assert len(stored_keys(tmp_path)) == CacheManager.WRITE_BATCH_SIZE
+
+    def test_reopen_reads_persisted_entries(self, tmp_path):
+        cache = make_cache(tmp_path)
+        cache.set('a', result('Docs'))
+        cache.set('b', result('Music'))
+        cache.flush()
+
+        reopened = make_cache(tmp_path)
+
+        assert reopened.get('a') == result('Docs')
+        assert reopened.get('b') == result('Music')
+        assert reopened.get('c') is None
+
+    def test_get_many_hits_and_misses(self, tmp_path):
+        cache = make_cache(tmp_path)
+        cache.set('a', result('Docs'))
+        cache.set('b', result('Music'))
+        cache.flush()
+        reopened = make_cache(tmp_path)
+
+        found = reopened.get_many(['a', 'missing', 'b'])
+
+        assert found == {'a': result('Docs'), 'b': result('Music')}
+        assert (reopened.hits, reopened.misses) == (2, 1)
+        # Found rows are now served from memory
+        assert set(reopened.memory_cache) == {'a', 'b'}
+
+    def test_get_many_sees_buffered_entries(self, tmp_path):
+        cache = make_cache(tmp_path)
+        cache.set('a', result('Docs'))
+
+        assert cache.get_many(['a', 'b']) == {'a': result('Docs')}
+
+    def test_get_many_spans_query_chunks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(CacheManager, 'SQLITE_MAX_VARIABLES', 3)
+        cache = make_cache(tmp_path)
+        for i in range(10):
+            cache.set(f'k{i}', result(str(i)))
+        cache.flush()
+        reopened = make_cache(tmp_path)
+
+        found = reopened.get_many([f'k{i}' for i in range(12)])
+
+        assert found == {f'k{i}': result(str(i)) for i in range(10)}
+
+    def test_expired_entries_are_ignored(self, tmp_path, monkeypatch):
+        cache = make_cache(tmp_path, ttl_hours=1)
+        cache.set('a', result('Docs'))
+        cache.flush()
+        reopened = make_cache(tmp_path, ttl_hours=1)
+
+        later = time.time() + 2 * 3600
+        monkeypatch.setattr(cache_module.time, 'time', lambda: later)
+
+        assert cache.get('a') is None
+        assert reopened.get_many(['a']) == {}
+        assert reopened.get('a') is None
+
+    def test_expired_rows_are_purged_on_open(self, tmp_path, monkeypatch):
+        cache = make_cache(tmp_path, ttl_hours=1)
+        cache.set('a', result('Docs'))
+        cache.flush()
+
+        later = time.time() + 2 * 3600
+        monkeypatch.setattr(cache_module.time, 'time', lambda: later)
+        make_cache(tmp_path, ttl_hours=1)
+
+        assert stored_keys(tmp_path) == set()
+
+    def test_fingerprints_round_trip(self, tmp_path):
+        cache = make_cache(tmp_path)
+        cache.set_fingerprint('/f.txt', 10, 123.0, 'digest')
+
+        # Pending rows answer before they are written
+        assert cache.get_fingerprint('/f.txt', 10, 123.0) == 'digest'
+        assert cache.get_fingerprint('/f.txt', 11, 123.0) is None
+
+        cache.flush()
+        reopened = make_cache(tmp_path)
+
+        assert reopened.get_fingerprint('/f.txt', 10, 123.0) == 'digest'
+        assert reopened.get_fingerprint('/f.txt', 10, 124.0) is None
+
+    def test_clear_drops_pending_and_stored_rows(self, tmp_path):
+        cache = make_cache(tmp_path)
+        cache.set('a', result('Docs'))
+        cache.flush()
+        cache.set('b', result('Music'))
+
+        cache.clear()
+        cache.flush()
+
+        assert stored_keys(tmp_path) == set()
+        assert make_cache(tmp_path).get_many(['a', 'b']) == {}
+
+
+@pytest.mark.parametrize('use_binary', [True, False])
+def test_file_backend_get_many(tmp_path, use_binary):
+    cache = CacheManager(cache_dir=str(tmp_path), use_binary=use_binary)
+    cache.set('a', result('Docs'))
+
+    reopened = CacheManager(cache_dir=str(tmp_path), use_binary=use_binary)
+
+    assert reopened.get_many(['a', 'b']) == {'a': result('Docs')}
+
+
+def test_keys_are_tagged_with_hash_algorithm(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_module, 'HAS_XXHASH', False)
+    monkeypatch.setattr(cache_module, 'KEY_ALGORITHM', 'md5')
+    cache = make_cache(tmp_path)
+
+    key = cache.get_content_key('a.txt', 10, 'digest', 'ns')
+
+    assert key == 'md5-' + hashlib.md5(b'ns:a.txt:10:digest').hexdigest()
+
+
+def test_stored_file_key_is_not_reused_across_namespaces(tmp_path):
+    path = tmp_path / 'report.txt'
+    path.write_text('quarterly numbers')
+    file_info = FileInfo.from_path(path)
+    cache = CacheManager(cache_dir=str(tmp_path / 'cache'))
+    client = LLMClient({'base_url': 'http://localhost:1', 'model_name': 'test-model'})
+    english = AIClassifier(client, cache_manager=cache, language='english')
+    spanish = AIClassifier(client, cache_manager=cache, language='spanish')
+
+    english_key = english._cache_key(file_info)
+    spanish_key = spanish._cache_key(file_info)
+
+    assert english_key != spanish_key
+    assert english._cache_key(file_info) == english_key
+    assert spanish_key == cache.get_content_key(
+        file_info.name, file_info.size, file_info.head_digest(), spanish._cache_namespace
+    )
@@ -0,0 +1,269 @@
+"""Tests for the request concurrency primitives."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils import concurrency
+from src.utils.concurrency import AdaptiveSemaphore, CircuitBreaker, TokenBucket, gather_or_cancel
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(concurrency.time, 'monotonic', fake)
+    return fake
+
+
+class TestAdaptiveSemaphore:
+    """Tests for AdaptiveSemaphore."""
+
+    def test_failure_halves_limit_down_to_minimum(self):
+        semaphore = AdaptiveSemaphore(initial=16, minimum=3)
+
+        semaphore.record_failure()
+        assert semaphore.limit == 8
+        semaphore.record_failure()
+        assert semaphore.limit == 4
+        semaphore.record_failure()
+        assert semaphore.limit == 3
+        semaphore.record_failure()
+        assert semaphore.limit == 3
+
+    def test_limit_grows_after_window_successes(self):
+        semaphore = AdaptiveSemaphore(initial=4, maximum=5, window=3)
+
+        for _ in range(2):
+            semaphore.record_success()
+        assert semaphore.limit == 4
+        semaphore.record_success()
+        assert semaphore.limit == 5
+
+        # Capped at maximum
+        for _ in range(3):
+            semaphore.record_success()
+        assert semaphore.limit == 5
+
+    def test_failure_resets_success_streak(self):
+        semaphore = AdaptiveSemaphore(initial=4, maximum=8, window=3)
+
+        semaphore.record_success()
+        semaphore.record_success()
+        semaphore.record_failure()
+        semaphore.record_success()
+        semaphore.record_success()
+
+        assert semaphore.limit == 2
+
+    def test_non_adaptive_limit_is_fixed(self):
+        semaphore = AdaptiveSemaphore(initial=4, adaptive=False)
+
+        semaphore.record_failure()
+        for _ in range(100):
+            semaphore.record_success()
+
+        assert semaphore.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_limits_permits_in_flight(self):
+        semaphore = AdaptiveSemaphore(initial=2, adaptive=False)
+        peak = 0
+
+        async def worker():
+            nonlocal peak
+            async with semaphore:
+                peak = max(peak, semaphore.in_flight)
+                await asyncio.sleep(0.001)
+
+        await asyncio.gather(*(worker() for _ in range(10)))
+
+        assert peak == 2
+        assert semaphore.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_waiters_woken_when_limit_rises(self):
+        semaphore = AdaptiveSemaphore(initial=1, maximum=2, window=2)
+        await semaphore.acquire()
+        waiter = asyncio.create_task(semaphore.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        semaphore.record_success()
+        semaphore.record_success()
+        await asyncio.wait_for(waiter, timeout=1)
+
+        assert semaphore.in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_passes_wakeup_on(self):
+        semaphore = AdaptiveSemaphore(initial=1, adaptive=False)
+        await semaphore.acquire()
+        first = asyncio.create_task(semaphore.acquire())
+        second = asyncio.create_task(semaphore.acquire())
+        await asyncio.sleep(0)
+
+        # Wake the first waiter, then cancel it before it can take the permit
+        semaphore.release()
+        first.cancel()
+
+        await asyncio.wait_for(second, timeout=1)
+        assert first.cancelled()
+        assert semaphore.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        semaphore = AdaptiveSemaphore(initial=1, adaptive=False)
+        await semaphore.acquire()
+        waiter = asyncio.create_task(semaphore.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert len(semaphore._waiters) == 0
+        semaphore.release()
+        assert semaphore.in_flight == 0
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_then_delay_once_negative(self, clock):
+        bucket = TokenBucket(per_minute=60, capacity=2)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(1.0)
+        assert bucket.reserve() == pytest.approx(2.0)
+
+    def test_refills_over_time(self, clock):
+        bucket = TokenBucket(per_minute=60, capacity=2)
+        bucket.reserve(2)
+
+        clock.advance(1.5)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+
+    def test_refill_is_capped_at_capacity(self, clock):
+        bucket = TokenBucket(per_minute=60, capacity=2)
+
+        clock.advance(3600)
+
+        assert bucket.reserve(2) == 0.0
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_oversized_request_is_clamped(self, clock):
+        bucket = TokenBucket(per_minute=60, capacity=5)
+
+        assert bucket.reserve(50) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_tokens(self):
+        bucket = TokenBucket(per_minute=6000, capacity=1)
+        await bucket.acquire()
+
+        start = time.monotonic()
+        await bucket.acquire()
+
+        assert time.monotonic() - start >= 0.005
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold(self, clock):
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.is_open
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self, clock):
+        breaker = CircuitBreaker(failure_threshold=2)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert not breaker.is_open
+
+    def test_probe_then_close(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+
+        clock.advance(29)
+        assert not breaker.allow()
+
+        clock.advance(2)
+        # One probe goes through; the rest wait another period
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert not breaker.is_open
+        assert breaker.allow()
+
+    def test_failed_probe_reopens(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+        breaker.record_failure()
+        clock.advance(31)
+        assert breaker.allow()
+
+        breaker.record_failure()
+
+        assert breaker.is_open
+        clock.advance(29)
+        assert not breaker.allow()
+        clock.advance(2)
+        assert breaker.allow()
+
+
+class TestGatherOrCancel:
+    """Tests for gather_or_cancel."""
+
+    @pytest.mark.asyncio
+    async def test_returns_results_in_order(self):
+        async def value(v, delay):
+            await asyncio.sleep(delay)
+            return v
+
+        assert await gather_or_cancel([value(1, 0.01), value(2, 0)]) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_the_rest(self):
+        cancelled = asyncio.Event()
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await gather_or_cancel([slow(), fail()])
+
+        assert cancelled.is_set()
@@ -0,0 +1,127 @@
+"""Tests for duplicate detection before classification."""
+
+import pytest
+
+from src.app_controller import ApplicationController
+from src.models.file_info import HEAD_DIGEST_LENGTH, FileInfo
+from src.utils.config_manager import load_config
+
+
+@pytest.fixture
+def controller(tmp_path):
+    """Controller with caching disabled so digests are always computed."""
+    config = load_config()
+    config['app']['cache_enabled'] = False
+    config['app']['log_file'] = str(tmp_path / 'classifier.log')
+    return ApplicationController(config)
+
+
+@pytest.fixture
+def full_digest_calls(monkeypatch):
+    """Record the paths whose whole content gets hashed."""
+    calls = []
+    original = FileInfo.full_digest
+
+    def counting(self, *args, **kwargs):
+        calls.append(self.path.name)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(FileInfo, 'full_digest', counting)
+    return calls
+
+
+def make_files(tmp_path, contents):
+    """Write files and return their FileInfo objects, in order."""
+    files = []
+    for name, data in contents:
+        path = tmp_path / name
+        path.write_bytes(data)
+        files.append(FileInfo.from_path(path))
+    return files
+
+
+class TestDeduplicateFiles:
+    """Tests for ApplicationController._deduplicate_files."""
+
+    def test_same_size_different_content_is_not_merged(self, controller, tmp_path, full_digest_calls):
+        files = make_files(tmp_path, [('a.txt', b'a' * 100), ('b.txt', b'b' * 100)])
+
+        unique, duplicates = controller._deduplicate_files(files)
+
+        assert unique == [0, 1]
+        assert duplicates == {}
+        # Head digests differ, so nothing is read past the first block
+        assert full_digest_calls == []
+
+    def test_small_true_duplicates_are_merged_from_head_digest(self, controller, tmp_path, full_digest_calls):
+        files = make_files(tmp_path, [('a.txt', b'same'), ('b.txt', b'same'), ('c.txt', b'same')])
+
+        unique, duplicates = controller._deduplicate_files(files)
+
+        assert unique == [0]
+        assert duplicates == {1: 0, 2: 0}
+        # Files within the head block are fully covered by its digest
+        assert full_digest_calls == []
+
+    def test_large_true_duplicates_are_confirmed_by_full_hash(self, controller, tmp_path, full_digest_calls):
+        data = b'x' * (HEAD_DIGEST_LENGTH * 3)
+        files = make_files(tmp_path, [('a.log', data), ('b.log', data)])
+
+        unique, duplicates = controller._deduplicate_files(files)
+
+        assert unique == [0]
+        assert duplicates == {1: 0}
+        assert sorted(full_digest_calls) == ['a.log', 'b.log']
+
+    def test_shared_head_with_different_tail_is_not_merged(self, controller, tmp_path, full_digest_calls):
+        head = b'h' * HEAD_DIGEST_LENGTH
+        files = make_files(tmp_path, [
+            ('a.log', head + b'tail-one'),
+            ('b.log', head + b'tail-two'),
+            ('c.log', head + b'tail-one'),
+        ])
+
+        unique, duplicates = controller._deduplicate_files(files)
+
+        assert unique == [0, 1]
+        assert duplicates == {2: 0}
+        # Each whole file is hashed once, however many candidates it meets
+        assert sorted(full_digest_calls) == ['a.log', 'b.log', 'c.log']
+
+    def test_extension_separates_groups(self, controller, tmp_path, full_digest_calls):
+        files = make_files(tmp_path, [('a.txt', b'same'), ('a.md', b'same')])
+
+        unique, duplicates = controller._deduplicate_files(files)
+
+        assert unique == [0, 1]
+        assert duplicates == {}
+
+    def test_unique_sizes_are_not_hashed(self, controller, tmp_path, monkeypatch):
+        files = make_files(tmp_path, [('a.txt', b'1'), ('b.txt', b'22'), ('c.txt', b'333')])
+        monkeypatch.setattr(FileInfo, 'head_digest', lambda self, *a: pytest.fail('hashed'))
+
+        unique, duplicates = controller._deduplicate_files(files)
+
+        assert unique == [0, 1, 2]
+        assert duplicates == {}
+
+    def test_empty_files_are_never_merged(self, controller, tmp_path):
+        files = make_files(tmp_path, [('a.txt', b''), ('b.txt', b'')])
+
+        assert controller._deduplicate_files(files) == ([0, 1], {})
+
+    def test_index_shared_across_windows(self, controller, tmp_path):
+        files = make_files(tmp_path, [('a.txt', b'same'), ('b.txt', b'same')])
+        seen = {}
+
+        first = controller._deduplicate_files(files, [0], seen)
+        second = controller._deduplicate_files(files, [1], seen)
+
+        assert first == ([0], {})
+        assert second == ([], {1: 0})
+
+    def test_disabled_by_config(self, controller, tmp_path):
+        controller._batch_config['deduplicate'] = False
+        files = make_files(tmp_path, [('a.txt', b'same'), ('b.txt', b'same')])
+
+        assert controller._deduplicate_files(files) == ([0, 1], {})
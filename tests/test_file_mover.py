@@ -0,0 +1,205 @@
+"""Tests for streamed file moves, duplicate naming and rollback."""
+
+from pathlib import Path
+
+import pytest
+
+from src.core import file_mover
+from src.core.file_mover import FileMover
+
+
+def make_sources(root, names):
+    """Create one file per (directory, name, content) and return their paths."""
+    paths = []
+    for directory, name, content in names:
+        path = root / 'src' / directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        paths.append(path)
+    return paths
+
+
+def tree(root):
+    """Relative path -> content for every file under root."""
+    return {
+        str(path.relative_to(root)): path.read_text()
+        for path in sorted(root.rglob('*'))
+        if path.is_file()
+    }
+
+
+class TestMoveStream:
+    """Tests for FileMover.move_stream."""
+
+    def test_same_destination_name_is_renamed(self, tmp_path):
+        sources = make_sources(tmp_path, [('a', 'report.txt', 'one'), ('b', 'report.txt', 'two')])
+        dest = tmp_path / 'dest'
+
+        stats = FileMover(max_workers=4).move_stream((s, dest / 'report.txt') for s in sources)
+
+        assert stats == {'total': 2, 'success': 2, 'failed': 0, 'skipped': 0}
+        assert tree(dest) == {'report.txt': 'one', 'report_1.txt': 'two'}
+
+    def test_existing_file_is_not_overwritten(self, tmp_path):
+        sources = make_sources(tmp_path, [('a', 'notes.txt', 'new')])
+        dest = tmp_path / 'dest'
+        dest.mkdir()
+        (dest / 'notes.txt').write_text('old')
+        (dest / 'notes_1.txt').write_text('older')
+
+        FileMover().move_stream([(sources[0], dest / 'notes.txt')])
+
+        assert tree(dest) == {'notes.txt': 'old', 'notes_1.txt': 'older', 'notes_2.txt': 'new'}
+
+    def test_case_insensitive_collision_is_renamed(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(file_mover, 'CASE_INSENSITIVE_NAMES', True)
+        sources = make_sources(tmp_path, [('a', 'Photo.JPG', 'upper'), ('b', 'photo.jpg', 'lower')])
+        dest = tmp_path / 'dest'
+        dest.mkdir()
+        (dest / 'PHOTO.jpg').write_text('existing')
+
+        FileMover(max_workers=4).move_stream((s, dest / s.name) for s in sources)
+
+        # Names differing only in case count as taken
+        assert tree(dest) == {
+            'PHOTO.jpg': 'existing',
+            'Photo_1.JPG': 'upper',
+            'photo_2.jpg': 'lower',
+        }
+
+    def test_threaded_moves_complete(self, tmp_path):
+        sources = make_sources(tmp_path, [(f'd{i % 7}', f'file{i}.txt', str(i)) for i in range(200)])
+        dest = tmp_path / 'dest'
+
+        stats = FileMover(max_workers=8).move_stream(
+            (s, dest / s.parent.name / s.name) for s in sources
+        )
+
+        assert stats == {'total': 200, 'success': 200, 'failed': 0, 'skipped': 0}
+        assert sorted(tree(dest).values(), key=int) == [str(i) for i in range(200)]
+        assert not any(path.is_file() for path in (tmp_path / 'src').rglob('*'))
+
+    def test_missing_source_is_skipped(self, tmp_path):
+        sources = make_sources(tmp_path, [('a', 'kept.txt', 'x')])
+        dest = tmp_path / 'dest'
+
+        stats = FileMover(max_workers=2).move_stream([
+            (tmp_path / 'src' / 'gone.txt', dest / 'gone.txt'),
+            (sources[0], dest / 'kept.txt'),
+        ])
+
+        assert stats == {'total': 2, 'success': 1, 'failed': 0, 'skipped': 1}
+        assert tree(dest) == {'kept.txt': 'x'}
+
+    def test_dry_run_touches_nothing(self, tmp_path):
+        sources = make_sources(tmp_path, [('a', 'x.txt', 'x'), ('b', 'x.txt', 'y')])
+        before = tree(tmp_path)
+
+        stats = FileMover().move_stream(((s, tmp_path / 'dest' / 'x.txt') for s in sources), dry_run=True)
+
+        assert stats['success'] == 2
+        assert tree(tmp_path) == before
+        assert not (tmp_path / 'dest').exists()
+
+    def test_copy_mode_keeps_sources(self, tmp_path):
+        sources = make_sources(tmp_path, [('a', 'x.txt', 'data')])
+
+        FileMover(mode='copy').move_stream([(sources[0], tmp_path / 'dest' / 'x.txt')])
+
+        assert tree(tmp_path / 'dest') == {'x.txt': 'data'}
+        assert sources[0].read_text() == 'data'
+
+
+class TestRollback:
+    """Tests for FileMover.rollback."""
+
+    def test_rollback_restores_original_layout(self, tmp_path):
+        sources = make_sources(tmp_path, [('a', 'r.txt', '1'), ('b', 'r.txt', '2'), ('c', 's.txt', '3')])
+        original = tree(tmp_path / 'src')
+        mover = FileMover(max_workers=4)
+        mover.move_stream((s, tmp_path / 'dest' / 'docs' / s.name) for s in sources)
+        assert tree(tmp_path / 'src') == {}
+
+        mover.rollback()
+
+        assert tree(tmp_path / 'src') == original
+        assert tree(tmp_path / 'dest') == {}
+
+    def test_rollback_skips_vanished_destinations(self, tmp_path):
+        sources = make_sources(tmp_path, [('a', 'x.txt', 'x'), ('a', 'y.txt', 'y')])
+        mover = FileMover()
+        mover.move_stream((s, tmp_path / 'dest' / s.name) for s in sources)
+        (tmp_path / 'dest' / 'x.txt').unlink()
+
+        mover.rollback()
+
+        assert tree(tmp_path / 'src') == {'a/y.txt': 'y'}
+
+    def test_rollback_removes_copies_and_empty_directories(self, tmp_path):
+        sources = make_sources(tmp_path, [('a', 'x.txt', 'x')])
+        mover = FileMover(mode='copy')
+        mover.operation_log.log_operation('create_dir', tmp_path, tmp_path / 'dest')
+        mover.move_stream([(sources[0], tmp_path / 'dest' / 'x.txt')])
+        (tmp_path / 'kept').mkdir()
+        (tmp_path / 'kept' / 'f.txt').write_text('f')
+        mover.operation_log.log_operation('create_dir', tmp_path, tmp_path / 'kept')
+
+        mover.rollback()
+
+        assert not (tmp_path / 'dest').exists()
+        assert (tmp_path / 'kept' / 'f.txt').exists()
+        assert sources[0].read_text() == 'x'
+
+    def test_operation_log_timestamps(self, tmp_path):
+        sources = make_sources(tmp_path, [('a', 'x.txt', 'x')])
+        mover = FileMover()
+        mover.move_stream([(sources[0], tmp_path / 'dest' / 'x.txt')])
+
+        (operation,) = mover.get_operation_log()
+
+        assert operation['type'] == 'move'
+        assert operation['source'] == str(sources[0])
+        assert operation['destination'] == str(tmp_path / 'dest' / 'x.txt')
+        assert 'T' in operation['timestamp']
+
+
+class TestEnsuredParents:
+    """Tests for creating each destination directory once."""
+
+    @pytest.fixture
+    def mkdir_calls(self, monkeypatch):
+        calls = []
+        original = Path.mkdir
+
+        def counting(self, *args, **kwargs):
+            calls.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, 'mkdir', counting)
+        return calls
+
+    def test_each_parent_created_once(self, tmp_path, mkdir_calls):
+        sources = make_sources(tmp_path, [('a', f'{i}.txt', str(i)) for i in range(30)])
+        # Existing base directory, so mkdir(parents=True) never recurses
+        (tmp_path / 'dest').mkdir()
+        del mkdir_calls[:]
+
+        FileMover(max_workers=1).move_stream(
+            (s, tmp_path / 'dest' / ('even' if int(s.stem) % 2 == 0 else 'odd') / s.name)
+            for s in sources
+        )
+
+        assert sorted(p.name for p in mkdir_calls) == ['even', 'odd']
+
+    def test_parents_recreated_after_rollback(self, tmp_path):
+        sources = make_sources(tmp_path, [('a', 'x.txt', 'x')])
+        mover = FileMover()
+        destination = tmp_path / 'dest' / 'x.txt'
+        mover.move_stream([(sources[0], destination)])
+        mover.rollback()
+        (tmp_path / 'dest').rmdir()
+
+        stats = mover.move_stream([(sources[0], destination)])
+
+        assert stats['success'] == 1
+        assert destination.read_text() == 'x'
@@ -0,0 +1,125 @@
+"""Tests for the streaming JSON end detection used by LLMClient._read_stream."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.core.ai_classifier import LLMClient, _JsonEndTracker
+
+
+def feed_all(deltas):
+    """Feed deltas to a fresh tracker and return the per-delta results."""
+    tracker = _JsonEndTracker()
+    return [tracker.feed(delta) for delta in deltas]
+
+
+class TestJsonEndTracker:
+    """Tests for _JsonEndTracker."""
+
+    def test_single_delta_object(self):
+        assert feed_all(['{"a": 1}']) == [True]
+
+    def test_object_split_across_deltas(self):
+        assert feed_all(['{"a"', ': {"b": ', '[1, 2]', '}', '}']) == [False, False, False, False, True]
+
+    def test_array_of_objects_closes_once(self):
+        deltas = ['[{"a": 1}', ', {"b": 2}', ']']
+        assert feed_all(deltas) == [False, False, True]
+
+    def test_braces_inside_strings_are_ignored(self):
+        deltas = ['{"reasoning": "uses } and ] and {', ' inside text"', '}']
+        assert feed_all(deltas) == [False, False, True]
+
+    def test_escaped_quote_does_not_end_string(self):
+        deltas = ['{"name": "say \\"}\\" ok', '"}']
+        assert feed_all(deltas) == [False, True]
+
+    def test_escape_split_across_deltas(self):
+        # Backslash at the end of one delta escapes the quote in the next
+        deltas = ['{"a": "x\\', '"}', '"}']
+        assert feed_all(deltas) == [False, False, True]
+
+    def test_escaped_backslash_before_closing_quote(self):
+        assert feed_all(['{"path": "C:\\\\"}']) == [True]
+
+    def test_quotes_before_first_bracket_are_not_strings(self):
+        # Prose (or a code fence) ahead of the payload must not open a string
+        assert feed_all(['Here is "the" answer:\n```json\n', '{"a": "}"}']) == [False, True]
+
+    def test_trailing_text_after_close(self):
+        tracker = _JsonEndTracker()
+        assert tracker.feed('{"a": 1}\nHope this helps') is True
+        assert tracker.feed(' and more text') is False
+
+    def test_stray_closing_bracket_before_start(self):
+        assert feed_all(['] ', '{"a": 1}']) == [False, True]
+
+
+class FakeStream:
+    """Async iterator over canned chat completion chunks."""
+
+    def __init__(self, deltas):
+        self.deltas = list(deltas)
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.consumed >= len(self.deltas):
+            raise StopAsyncIteration
+        delta = self.deltas[self.consumed]
+        self.consumed += 1
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+    async def close(self):
+        self.closed = True
+
+
+def make_client(stream):
+    """LLMClient whose async client returns the given stream."""
+    client = LLMClient({'base_url': 'http://localhost:1', 'model_name': 'test-model'})
+
+    async def create(**kwargs):
+        return stream
+
+    client._async_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    return client
+
+
+class TestReadStream:
+    """Tests for LLMClient._read_stream early stopping."""
+
+    @pytest.mark.asyncio
+    async def test_stops_after_payload_closes(self):
+        payload = [{"primary_category": "Docs", "reasoning": "has } in it"}]
+        text = json.dumps(payload)
+        stream = FakeStream([text[:10], text[10:25], text[25:], '\nExtra words', ' never read'])
+
+        result = await make_client(stream)._read_stream([], {})
+
+        assert json.loads(result) == payload
+        assert stream.consumed == 3
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_returns_everything_when_never_complete(self):
+        stream = FakeStream(['{"a": ', '1'])
+
+        result = await make_client(stream)._read_stream([], {})
+
+        assert result == '{"a": 1'
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_trailing_text_in_closing_delta_reads_to_end(self):
+        stream = FakeStream(['{"a": 1}\nDone', '.'])
+
+        result = await make_client(stream)._read_stream([], {})
+
+        assert result == '{"a": 1}\nDone.'
+        assert stream.consumed == 2
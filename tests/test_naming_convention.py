@@ -0,0 +1,131 @@
+"""Tests for directory naming conventions."""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from src.core.directory_manager import DirectoryManager, NamingConvention
+
+
+def regex_snake_case(text):
+    """Reference snake_case conversion (the original regex implementation)."""
+    text = re.sub(r'[\s\-]+', '_', text)
+    text = re.sub(r'([a-z])([A-Z])', r'\1_\2', text)
+    text = text.lower()
+    text = re.sub(r'_+', '_', text)
+    return text.strip('_')
+
+
+def regex_kebab_case(text):
+    """Reference kebab-case conversion (the original regex implementation)."""
+    text = re.sub(r'[\s_]+', '-', text)
+    text = re.sub(r'([a-z])([A-Z])', r'\1-\2', text)
+    text = text.lower()
+    text = re.sub(r'-+', '-', text)
+    return text.strip('-')
+
+
+SAMPLES = [
+    '',
+    'Documents',
+    'Financial Reports',
+    'work-projects_2024',
+    'mixed - separators _ here',
+    'camelCaseName',
+    'PascalCaseName',
+    'HTTPServerLogs',
+    'already_snake_case',
+    'already-kebab-case',
+    'double__underscore',
+    'triple---dash',
+    '_-_ -_',
+    '__leading and trailing__',
+    '--leading-dash',
+    'trailing-dash-',
+    'Tax 2024 Q1',
+    'report2024Final',
+    'v2Beta',
+    'a1B2c3D',
+    'tabs\tand\nnewlines',
+    'Música Clásica',
+    'ΟΔΟΣ ΣΟΦΟΚΛΕΟΥΣ',
+    'İstanbul Photos',
+    'Foto Pribadi',
+    '音楽 ファイル',
+    'x',
+    'X',
+    'aB',
+    'Ab',
+]
+
+
+class TestSinglePassConverters:
+    """The single-pass converters must match the regex implementation."""
+
+    @pytest.mark.parametrize('text', SAMPLES)
+    def test_snake_case_matches_regex(self, text):
+        assert NamingConvention.to_snake_case(text) == regex_snake_case(text)
+
+    @pytest.mark.parametrize('text', SAMPLES)
+    def test_kebab_case_matches_regex(self, text):
+        assert NamingConvention.to_kebab_case(text) == regex_kebab_case(text)
+
+    @pytest.mark.parametrize('text, expected', [
+        ('Financial Reports', 'financial_reports'),
+        ('camelCaseName', 'camel_case_name'),
+        ('  spaced  out  ', 'spaced_out'),
+        ('a--b__c  d', 'a_b_c_d'),
+        ('Report2024', 'report2024'),
+    ])
+    def test_snake_case_examples(self, text, expected):
+        assert NamingConvention.to_snake_case(text) == expected
+
+    @pytest.mark.parametrize('text, expected', [
+        ('Financial Reports', 'financial-reports'),
+        ('camelCaseName', 'camel-case-name'),
+        ('_under_score_', 'under-score'),
+    ])
+    def test_kebab_case_examples(self, text, expected):
+        assert NamingConvention.to_kebab_case(text) == expected
+
+
+class TestConventions:
+    """Tests for the remaining conventions and their caches."""
+
+    @pytest.mark.parametrize('convention, expected', [
+        ('snake_case', 'work_projects'),
+        ('kebab-case', 'work-projects'),
+        ('PascalCase', 'WorkProjects'),
+        ('camelCase', 'workProjects'),
+        ('unknown', 'work_projects'),
+    ])
+    def test_apply_convention(self, convention, expected):
+        assert NamingConvention.apply_convention('Work Projects', convention) == expected
+
+    def test_cache_clear(self):
+        NamingConvention.to_snake_case('Cache Me')
+        assert NamingConvention.to_snake_case.cache_info().currsize > 0
+
+        NamingConvention.cache_clear()
+
+        assert NamingConvention.to_snake_case.cache_info().currsize == 0
+
+
+class TestGeneratePath:
+    """Tests for DirectoryManager.generate_path."""
+
+    def test_components_are_converted(self):
+        manager = DirectoryManager(Path('/out'), naming_convention='kebab-case')
+
+        assert manager.generate_path('Work Docs/Reports 2024') == Path('/out/work-docs/reports-2024')
+
+    def test_invalid_components_become_unnamed(self):
+        manager = DirectoryManager(Path('/out'))
+
+        assert manager.generate_path('Docs/../.') == Path('/out/docs/unnamed/unnamed')
+
+    def test_results_are_reused(self):
+        manager = DirectoryManager(Path('/out'))
+
+        assert manager.generate_path('A/B') is manager.generate_path('A/B')
@@ -0,0 +1,82 @@
+"""Tests for token-budget packing of multi-file requests."""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.core.ai_classifier import AIClassifier, LLMClient
+from src.models.file_info import FileInfo
+
+
+def make_file(name, content=None):
+    """Build a FileInfo without touching the disk."""
+    now = datetime.now()
+    return FileInfo(
+        path=Path('/data') / name,
+        name=name,
+        extension=Path(name).suffix,
+        size=len(content or ''),
+        created=now,
+        modified=now,
+        content_preview=content
+    )
+
+
+def make_classifier(max_prompt_tokens=None):
+    """AIClassifier with no cache and an unused client."""
+    client = LLMClient({'base_url': 'http://localhost:1', 'model_name': 'test-model'})
+    return AIClassifier(client, max_prompt_tokens=max_prompt_tokens)
+
+
+@pytest.fixture
+def mixed_files():
+    """Files alternating between metadata-only and content-heavy."""
+    return [
+        make_file(f'file_{i}.txt', 'x' * 2000 if i % 3 == 0 else None)
+        for i in range(20)
+    ]
+
+
+class TestPackRequests:
+    """Tests for AIClassifier.pack_requests."""
+
+    def test_without_budget_splits_by_count(self, mixed_files):
+        chunks = make_classifier().pack_requests(mixed_files, 6)
+
+        assert [len(chunk) for chunk in chunks] == [6, 6, 6, 2]
+
+    def test_no_request_exceeds_budget(self, mixed_files):
+        classifier = make_classifier(max_prompt_tokens=200)
+
+        chunks = classifier.pack_requests(mixed_files, 10)
+
+        for chunk in chunks:
+            assert len(chunk) <= 10
+            if len(chunk) > 1:
+                assert sum(classifier._estimate_file_tokens(f) for f in chunk) <= 200
+
+    def test_budget_closes_requests_early(self, mixed_files):
+        unbounded = make_classifier().pack_requests(mixed_files, 10)
+        bounded = make_classifier(max_prompt_tokens=200).pack_requests(mixed_files, 10)
+
+        assert len(bounded) > len(unbounded)
+
+    def test_oversized_file_gets_its_own_request(self):
+        classifier = make_classifier(max_prompt_tokens=60)
+        small = [make_file('a.txt'), make_file('b.txt')]
+        big = make_file('big.txt', 'y' * 5000)
+        assert classifier._estimate_file_tokens(big) > 60
+
+        chunks = classifier.pack_requests([small[0], big, small[1]], 10)
+
+        assert [big] in chunks
+        assert [file.name for chunk in chunks for file in chunk] == ['a.txt', 'big.txt', 'b.txt']
+
+    def test_output_preserves_input_order(self, mixed_files):
+        chunks = make_classifier(max_prompt_tokens=150).pack_requests(mixed_files, 4)
+
+        assert [file for chunk in chunks for file in chunk] == mixed_files
+
+    def test_empty_input(self):
+        assert make_classifier(max_prompt_tokens=100).pack_requests([], 5) == []
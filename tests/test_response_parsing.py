@@ -0,0 +1,95 @@
+"""Tests for parsing LLM responses, including responses without content."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.core.ai_classifier import AIClassifier, LLMClient, _strip_code_fence
+from src.models.file_info import FileInfo
+
+VALID = json.dumps({'primary_category': 'Documents', 'confidence': 0.9, 'reasoning': 'test'})
+
+
+def make_file(name):
+    """Build a FileInfo without touching the disk."""
+    now = datetime.now()
+    return FileInfo(
+        path=Path('/data') / name,
+        name=name,
+        extension=Path(name).suffix,
+        size=0,
+        created=now,
+        modified=now
+    )
+
+
+@pytest.fixture
+def classifier():
+    """AIClassifier with no cache, no retry delay and an unused client."""
+    client = LLMClient({'base_url': 'http://localhost:1', 'model_name': 'test-model'})
+    classifier = AIClassifier(client, max_retries=3)
+    classifier._compute_backoff = lambda *args: 0
+    return classifier
+
+
+class TestStripCodeFence:
+    """Tests for _strip_code_fence."""
+
+    @pytest.mark.parametrize('text, expected', [
+        (None, ''),
+        ('', ''),
+        ('```json\n{"a": 1}\n```', '{"a": 1}'),
+        ('  {"a": 1}  ', '{"a": 1}'),
+    ])
+    def test_strip(self, text, expected):
+        assert _strip_code_fence(text) == expected
+
+
+class TestEmptyResponses:
+    """A response without content is a parse failure, not a crash."""
+
+    @pytest.mark.parametrize('text', [None, ''])
+    def test_single_file(self, classifier, text):
+        assert classifier._parse_response(text) is None
+
+    @pytest.mark.parametrize('text', [None, ''])
+    def test_multi_file(self, classifier, text):
+        files = [make_file('a.txt'), make_file('b.txt')]
+
+        assert classifier._parse_multi_file_response(text, files) == [None, None]
+
+    def test_valid_response_parses(self, classifier):
+        classification = classifier._parse_response(VALID)
+
+        assert classification.primary_category == 'Documents'
+
+    @pytest.mark.asyncio
+    async def test_empty_response_is_retried(self, classifier, monkeypatch):
+        responses = iter([None, VALID])
+        calls = []
+
+        async def send(messages, response_format=None):
+            calls.append(messages)
+            return next(responses)
+
+        monkeypatch.setattr(classifier.llm_client, 'send_request_async', send)
+
+        result = await classifier._request_with_retry([], classifier._parse_response)
+
+        assert result.primary_category == 'Documents'
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_responses_exhaust_retries(self, classifier, monkeypatch):
+        calls = []
+
+        async def send(messages, response_format=None):
+            calls.append(messages)
+            return None
+
+        monkeypatch.setattr(classifier.llm_client, 'send_request_async', send)
+
+        assert await classifier._request_with_retry([], classifier._parse_response) is None
+        assert len(calls) == 3